@@ -132,11 +132,33 @@ class Scene(SceneObject):
                 options.file_name = file_name
 
             importer = io_service.create_importer(detected_format)
-            importer.import_scene(self, stream, options)
+            if file_name is not None and getattr(options, 'use_mmap', False):
+                self._import_mapped(importer, stream, options)
+            else:
+                importer.import_scene(self, stream, options)
         finally:
             if file_name is not None and stream is not None:
                 stream.close()
 
+    def _import_mapped(self, importer, stream, options):
+        import mmap
+        import os
+
+        if os.fstat(stream.fileno()).st_size == 0:
+            importer.import_scene(self, stream, options)
+            return
+
+        mapped = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            importer.import_scene(self, mapped, options)
+        finally:
+            try:
+                mapped.close()
+            except BufferError:
+                # A view into the mapping is still referenced; the mapping is
+                # released once that view is collected.
+                pass
+
     def save(self, file_or_stream, format_or_options=None):
         from .formats import IOService, SaveOptions
         from .FileFormat import FileFormat
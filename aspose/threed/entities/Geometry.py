@@ -79,8 +79,12 @@ class Geometry(Entity):
         from .MappingMode import MappingMode
         from .ReferenceMode import ReferenceMode
         from .VertexElementFVector import VertexElementFVector
+        from .VertexElementMaterial import VertexElementMaterial
 
-        element = VertexElementFVector(element_type, "", mapping_mode, reference_mode)
+        if element_type == VertexElementType.MATERIAL:
+            element = VertexElementMaterial("", mapping_mode, reference_mode)
+        else:
+            element = VertexElementFVector(element_type, "", mapping_mode, reference_mode)
         self._vertex_elements.append(element)
         return element
 
@@ -1,10 +1,13 @@
-from typing import List, Optional, TYPE_CHECKING
+from array import array
+from itertools import accumulate, chain, islice, repeat
+from typing import List, Optional, Union, TYPE_CHECKING
 
 from .Geometry import Geometry
 from .BooleanOperation import BooleanOperation
 from ..utilities.Matrix4 import Matrix4
 from ..utilities.Vector4 import Vector4
 from ..utilities.ArrayList import ArrayListAdapter
+from ..utilities.PackedVector4List import PackedVector4List
 
 if TYPE_CHECKING:
     from .VertexElement import VertexElement
@@ -16,21 +19,46 @@ if TYPE_CHECKING:
 
 
 class Mesh(Geometry):
-    def __init__(self, name: str = None, height_map=None, transform: Matrix4 = None, tri_mesh: bool = None):
+    def __init__(self, name: str = None, height_map=None, transform: Matrix4 = None, tri_mesh: bool = None, packed: bool = False):
         if name is None:
             name = ""
         super().__init__(name)
 
-        self._control_points: List[Vector4] = []
+        self._control_points: Union[List[Vector4], PackedVector4List] = []
         self._edges: List[int] = []
-        self._polygons: List[int] = []
-        self._polygon_sizes: List[int] = []
+        self._polygons: Union[List[int], array] = []
+        self._polygon_sizes: Union[List[int], array] = []
+        self._polygon_offsets: Optional[array] = None
+        self._packed = False
         self._control_points_adapter: 'ArrayListAdapter[Vector4]' = None
         self._edges_adapter: 'ArrayListAdapter[int]' = None
 
         if height_map is not None:
             raise NotImplementedError("height_map constructor is not implemented")
 
+        if packed:
+            self.pack()
+
+    @property
+    def packed(self) -> bool:
+        """Gets whether control points and polygons are kept in packed array storage."""
+        return self._packed
+
+    def pack(self) -> 'Mesh':
+        """Moves control points and polygons into packed array storage.
+
+        Control points are stored as a flat array('d') of x, y, z, w components and
+        polygons as a flat array('I') of indices plus an array('I') of sizes.
+        """
+        if not self._packed:
+            self._control_points = PackedVector4List(self._control_points)
+            self._polygons = array('I', self._polygons)
+            self._polygon_sizes = array('I', self._polygon_sizes)
+            self._polygon_offsets = None
+            self._control_points_adapter = None
+            self._packed = True
+        return self
+
     @property
     def control_points(self) -> ArrayListAdapter[Vector4]:
         if self._control_points_adapter is None:
@@ -49,6 +77,9 @@ class Mesh(Geometry):
 
     @property
     def polygons(self) -> List[List[int]]:
+        if self._packed:
+            from .PolygonListView import PolygonListView
+            return PolygonListView(self)
         result = []
         offset = 0
         for size in self._polygon_sizes:
@@ -85,6 +116,122 @@ class Mesh(Geometry):
         self._polygon_sizes.append(len(indices))
         self._polygons.extend(indices)
 
+    def to_numpy(self):
+        """Gets (positions, face_indices, face_offsets) arrays for this mesh.
+
+        positions is an (N, 4) float64 array of control points, face_indices a flat
+        uint32 array of polygon vertex indices and face_offsets an int64 array of
+        polygon_count + 1 offsets into face_indices. For packed meshes positions and
+        face_indices share memory with the mesh, which cannot grow while they are
+        alive. Without NumPy, array('d'), array('I') and array('q') copies are
+        returned instead.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+
+        if self._packed:
+            positions = self._control_points.buffer
+            indices = self._polygons
+        else:
+            positions = PackedVector4List(self._control_points).buffer
+            indices = array('I', self._polygons)
+        offsets = array('q', [0])
+        offsets.extend(accumulate(self._polygon_sizes))
+
+        if np is None:
+            if self._packed:
+                return array('d', positions), array('I', indices), offsets
+            return positions, indices, offsets
+        return (np.frombuffer(positions, dtype=np.float64).reshape(-1, 4),
+                np.frombuffer(indices, dtype=np.uint32),
+                np.frombuffer(offsets, dtype=np.int64))
+
+    @staticmethod
+    def from_numpy(positions, face_indices, face_offsets=None, name: str = None) -> 'Mesh':
+        """Creates a packed mesh from position, index and offset arrays.
+
+        positions is an (N, 3) or (N, 4) array, or a flat sequence of x, y, z, w
+        values. face_offsets holds polygon_count + 1 offsets into face_indices;
+        when omitted the indices are read as triangles. The data is copied into
+        the mesh's packed storage with a single buffer copy per array.
+        """
+        mesh = Mesh(name, packed=True)
+        stride = 4
+        if getattr(positions, 'shape', None) is not None:
+            import numpy as np
+            positions = np.ascontiguousarray(positions, dtype=np.float64)
+            if positions.ndim == 2:
+                stride = positions.shape[1]
+            values = array('d')
+            values.frombytes(memoryview(positions).cast('B'))
+            mesh._control_points.extend_components(values, stride)
+
+            face_indices = np.ascontiguousarray(face_indices, dtype=np.uint32).ravel()
+            if face_offsets is None:
+                count = len(face_indices) // 3
+                face_indices = face_indices[:count * 3]
+                sizes = np.full(count, 3, dtype=np.uint32)
+            else:
+                face_offsets = np.asarray(face_offsets, dtype=np.int64)
+                if len(face_offsets) > 0:
+                    face_indices = face_indices[face_offsets[0]:face_offsets[-1]]
+                sizes = np.diff(face_offsets).astype(np.uint32)
+            mesh._polygons.frombytes(memoryview(np.ascontiguousarray(face_indices)).cast('B'))
+            mesh._polygon_sizes.frombytes(memoryview(sizes).cast('B'))
+            return mesh
+
+        mesh._control_points.extend_components(positions, stride)
+        if face_offsets is None:
+            mesh._extend_polygons(face_indices, 3)
+            return mesh
+        offsets = list(face_offsets)
+        if offsets:
+            mesh._polygons.extend(array('I', face_indices[offsets[0]:offsets[-1]]))
+        mesh._polygon_sizes.extend(b - a for a, b in zip(offsets, offsets[1:]))
+        return mesh
+
+    def _get_polygon_offsets(self) -> array:
+        sizes = self._polygon_sizes
+        offsets = self._polygon_offsets
+        count = len(sizes)
+        if offsets is None or len(offsets) > count:
+            offsets = self._polygon_offsets = array('Q')
+        done = len(offsets)
+        if done < count:
+            start = offsets[done - 1] + sizes[done - 1] if done else 0
+            offsets.extend(accumulate(chain((start,), islice(sizes, done, count - 1))))
+        return offsets
+
+    def _extend_control_points(self, components, stride: int = 3, w: float = 1.0):
+        if self._packed:
+            self._control_points.extend_components(components, stride, w)
+            return
+        it = iter(components)
+        if stride == 4:
+            self._control_points.extend(Vector4(x, y, z, cw) for x, y, z, cw in zip(it, it, it, it))
+        elif stride == 3:
+            self._control_points.extend(Vector4(x, y, z, w) for x, y, z in zip(it, it, it))
+        else:
+            raise ValueError("stride must be 3 or 4")
+
+    def _extend_polygons(self, indices, size=3):
+        """Appends polygons from a flat index sequence.
+
+        ``size`` is either the corner count shared by every polygon or a
+        sequence with the corner count of each polygon.
+        """
+        if isinstance(indices, array) and isinstance(self._polygons, array) and indices.typecode != self._polygons.typecode:
+            indices = indices.tolist()
+        if not isinstance(size, int):
+            self._polygons.extend(indices)
+            self._polygon_sizes.extend(size)
+            return
+        count = len(indices) // size
+        self._polygons.extend(indices[:count * size])
+        self._polygon_sizes.extend(repeat(size, count))
+
     def get_polygon_size(self, index: int) -> int:
         if index < 0 or index >= len(self._polygon_sizes):
             raise IndexError("Polygon index out of range")
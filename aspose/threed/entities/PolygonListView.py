@@ -0,0 +1,46 @@
+from typing import Iterator, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .Mesh import Mesh
+
+
+class PolygonListView:
+    """Read-only view of a packed mesh's polygons.
+
+    Each polygon is sliced out of the mesh's flat index array only when it is
+    accessed, so no list of lists is built up front.
+    """
+
+    def __init__(self, mesh: 'Mesh'):
+        self._mesh = mesh
+
+    def __len__(self) -> int:
+        return len(self._mesh._polygon_sizes)
+
+    def __getitem__(self, index):
+        mesh = self._mesh
+        count = len(mesh._polygon_sizes)
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(count))]
+        if index < 0:
+            index += count
+        if index < 0 or index >= count:
+            raise IndexError("Polygon index out of range")
+        start = mesh._get_polygon_offsets()[index]
+        return list(mesh._polygons[start:start + mesh._polygon_sizes[index]])
+
+    def __iter__(self) -> Iterator[List[int]]:
+        polygons = self._mesh._polygons
+        offset = 0
+        for size in self._mesh._polygon_sizes:
+            yield list(polygons[offset:offset + size])
+            offset += size
+
+    def __eq__(self, other) -> bool:
+        try:
+            return list(self) == [list(p) for p in other]
+        except TypeError:
+            return False
+
+    def __repr__(self) -> str:
+        return f"PolygonListView({list(self)!r})"
@@ -1,4 +1,7 @@
 from typing import List, TYPE_CHECKING, Union
+from array import array
+from itertools import accumulate, chain
+import copy
 import math
 
 from ..utilities.Vector4 import Vector4
@@ -55,8 +58,8 @@ class PolygonModifier:
     def _triangulate_mesh(mesh: 'Mesh') -> 'Mesh':
         from .Mesh import Mesh
 
-        new_mesh = Mesh(name=f"{mesh.name}_triangulated" if mesh.name else "triangulated")
-        new_mesh._control_points = list(mesh._control_points)
+        new_mesh = Mesh(name=f"{mesh.name}_triangulated" if mesh.name else "triangulated", packed=mesh.packed)
+        new_mesh._control_points.extend(mesh._control_points)
 
         for polygon in mesh.polygons:
             PolygonModifier._triangulate_polygon_to_mesh(new_mesh, polygon)
@@ -65,6 +68,262 @@ class PolygonModifier:
 
         return new_mesh
 
+    @staticmethod
+    def optimize_vertex_order(mesh: 'Mesh', cache_size: int = 16) -> 'Mesh':
+        """Returns a copy of the mesh reordered for GPU vertex cache and fetch locality.
+
+        Polygons are reordered with the Tipsify algorithm (Sander et al. 2007) for a
+        cache of ``cache_size`` vertices, then control points are renumbered in order
+        of first use. Vertex elements are reordered to match.
+        """
+        polygon_order = PolygonModifier._tipsify(mesh._polygons, mesh._polygon_sizes, mesh._get_polygon_offsets(),
+                                                 len(mesh._control_points), cache_size)
+        return PolygonModifier._extract_polygons(mesh, polygon_order, True)
+
+    @staticmethod
+    def _extract_polygons(mesh: 'Mesh', polygon_order, keep_unused: bool = False) -> 'Mesh':
+        """Returns a mesh made of the given polygons of ``mesh``, in that order.
+
+        Control points are renumbered in order of first use; unused ones are
+        dropped unless ``keep_unused`` is set, which appends them at the end.
+        """
+        from .Mesh import Mesh
+
+        polygons = mesh._polygons
+        sizes = mesh._polygon_sizes
+        offsets = mesh._get_polygon_offsets()
+        vertex_count = len(mesh._control_points)
+
+        # A dict keeps extracting a few polygons of a large mesh proportional to their size.
+        remap = {}
+        vertex_order = []
+        corner_order = []
+        new_polygons = []
+        for p in polygon_order:
+            start = offsets[p]
+            for corner in range(start, start + sizes[p]):
+                v = polygons[corner]
+                new_index = remap.get(v)
+                if new_index is None:
+                    new_index = remap[v] = len(vertex_order)
+                    vertex_order.append(v)
+                new_polygons.append(new_index)
+                corner_order.append(corner)
+        if keep_unused:
+            for v in range(vertex_count):
+                if v not in remap:
+                    remap[v] = len(vertex_order)
+                    vertex_order.append(v)
+
+        result = Mesh(mesh.name, packed=mesh.packed)
+        if mesh.packed:
+            buffer = mesh._control_points.buffer
+            result._extend_control_points(chain.from_iterable(buffer[v * 4:v * 4 + 4] for v in vertex_order), 4)
+        else:
+            points = mesh._control_points
+            result._control_points.extend([points[v] for v in vertex_order])
+        result._extend_polygons(new_polygons, [sizes[p] for p in polygon_order])
+
+        for element in mesh._vertex_elements:
+            result._vertex_elements.append(PolygonModifier._reorder_vertex_element(
+                element, vertex_count, vertex_order, polygon_order, corner_order))
+
+        return result
+
+    @staticmethod
+    def _split_vertices(mesh: 'Mesh', elements) -> 'Mesh':
+        """Returns a copy of the mesh where ``elements`` hold one value per control point.
+
+        Control points are duplicated for every distinct combination of values
+        their corners use, and the elements become CONTROL_POINT/DIRECT. Polygon
+        order is kept; elements whose indices or data are out of range are dropped.
+        """
+        from .Mesh import Mesh
+        from .MappingMode import MappingMode
+        from .ReferenceMode import ReferenceMode
+        from ..utilities.PackedFVector4List import PackedFVector4List
+
+        polygons = mesh._polygons
+        sizes = mesh._polygon_sizes
+        vertex_count = len(mesh._control_points)
+        corner_count = len(polygons)
+
+        # Value index of each element at every corner
+        columns = []
+        converted = []
+        for element in elements:
+            mapping_mode = element.mapping_mode
+            if mapping_mode is None and len(element._data) == vertex_count:
+                mapping_mode = MappingMode.CONTROL_POINT
+            if mapping_mode == MappingMode.CONTROL_POINT:
+                keys = polygons
+            elif mapping_mode == MappingMode.POLYGON_VERTEX:
+                keys = range(corner_count)
+            elif mapping_mode == MappingMode.POLYGON:
+                keys = list(chain.from_iterable([p] * size for p, size in enumerate(sizes)))
+            elif mapping_mode == MappingMode.ALL_SAME:
+                keys = [0] * corner_count
+            else:
+                continue
+
+            if element.reference_mode in (ReferenceMode.INDEX, ReferenceMode.INDEX_TO_DIRECT):
+                indices = element._indices
+                if keys and max(keys) >= len(indices):
+                    continue
+                keys = [indices[k] for k in keys]
+            if keys and (min(keys) < 0 or max(keys) >= len(element._data)):
+                continue
+            columns.append(keys)
+            converted.append(element)
+
+        remap = {}
+        vertex_order = []
+        vertex_keys = []
+        new_polygons = array('I')
+        for key in zip(polygons, *columns):
+            new_index = remap.get(key)
+            if new_index is None:
+                new_index = remap[key] = len(vertex_order)
+                vertex_order.append(key[0])
+                vertex_keys.append(key)
+            new_polygons.append(new_index)
+
+        result = Mesh(mesh.name, packed=mesh.packed)
+        if mesh.packed:
+            buffer = mesh._control_points.buffer
+            result._extend_control_points(chain.from_iterable(buffer[v * 4:v * 4 + 4] for v in vertex_order), 4)
+        else:
+            points = mesh._control_points
+            result._control_points.extend([points[v] for v in vertex_order])
+        result._extend_polygons(new_polygons, sizes)
+
+        identity = range(max(len(sizes), corner_count))
+        for element in mesh._vertex_elements:
+            if element in converted:
+                column = converted.index(element) + 1
+                data = element._data
+                values = [data[key[column]] for key in vertex_keys]
+                new_element = copy.copy(element)
+                new_element._data = PackedFVector4List(values) if isinstance(data, PackedFVector4List) else values
+                new_element._indices = []
+                new_element._mapping_mode = MappingMode.CONTROL_POINT
+                new_element._reference_mode = ReferenceMode.DIRECT
+                if hasattr(new_element, '_data_adapter'):
+                    new_element._data_adapter = None
+                result._vertex_elements.append(new_element)
+            elif element not in elements:
+                result._vertex_elements.append(PolygonModifier._reorder_vertex_element(
+                    element, vertex_count, vertex_order, identity, identity))
+
+        return result
+
+    @staticmethod
+    def _tipsify(polygons, sizes, offsets, vertex_count: int, cache_size: int) -> List[int]:
+        polygon_count = len(sizes)
+
+        # Polygons using each vertex, stored contiguously per vertex
+        live = [0] * vertex_count
+        for v in polygons:
+            live[v] += 1
+        adjacency_start = [0]
+        adjacency_start.extend(accumulate(live))
+        fill = adjacency_start[:-1]
+        adjacency = [0] * len(polygons)
+        for p in range(polygon_count):
+            start = offsets[p]
+            for v in polygons[start:start + sizes[p]]:
+                adjacency[fill[v]] = p
+                fill[v] += 1
+
+        cache_time = [0] * vertex_count
+        emitted = bytearray(polygon_count)
+        dead_end = []
+        order = []
+        time = cache_size + 1
+        cursor = 0
+
+        fanning = 0 if vertex_count else -1
+        while fanning >= 0:
+            candidates = []
+            for p in adjacency[adjacency_start[fanning]:adjacency_start[fanning + 1]]:
+                if emitted[p]:
+                    continue
+                emitted[p] = 1
+                order.append(p)
+                start = offsets[p]
+                for v in polygons[start:start + sizes[p]]:
+                    dead_end.append(v)
+                    candidates.append(v)
+                    live[v] -= 1
+                    if time - cache_time[v] > cache_size:
+                        cache_time[v] = time
+                        time += 1
+
+            # Prefer the candidate still in the cache that is least likely to be
+            # evicted before its remaining polygons are emitted.
+            fanning = -1
+            best_priority = -1
+            for v in candidates:
+                if live[v] > 0:
+                    priority = 0
+                    if time - cache_time[v] + 2 * live[v] <= cache_size:
+                        priority = time - cache_time[v]
+                    if priority > best_priority:
+                        best_priority = priority
+                        fanning = v
+
+            while fanning < 0 and dead_end:
+                v = dead_end.pop()
+                if live[v] > 0:
+                    fanning = v
+            while fanning < 0 and cursor < vertex_count:
+                if live[cursor] > 0:
+                    fanning = cursor
+                cursor += 1
+
+        if len(order) < polygon_count:
+            order.extend(p for p in range(polygon_count) if not emitted[p])
+        return order
+
+    @staticmethod
+    def _reorder_vertex_element(element, vertex_count: int, vertex_order: List[int], polygon_order: List[int], corner_order: List[int]):
+        from .MappingMode import MappingMode
+        from .ReferenceMode import ReferenceMode
+        from ..utilities.PackedFVector4List import PackedFVector4List
+
+        result = copy.copy(element)
+        data = getattr(element, '_data', None)
+        indices = element._indices
+        mapping_mode = element.mapping_mode
+
+        if mapping_mode == MappingMode.CONTROL_POINT or (mapping_mode is None and data is not None and len(data) == vertex_count):
+            order = vertex_order
+        elif mapping_mode == MappingMode.POLYGON_VERTEX:
+            order = corner_order
+        elif mapping_mode == MappingMode.POLYGON:
+            order = polygon_order
+        else:
+            order = None
+
+        indexed = element.reference_mode in (ReferenceMode.INDEX, ReferenceMode.INDEX_TO_DIRECT)
+        if order is not None and indexed and len(indices) >= len(order):
+            result._indices = [indices[i] for i in order]
+        else:
+            result._indices = list(indices)
+
+        if data is None:
+            return result
+
+        if order is not None and not indexed and len(data) >= len(order):
+            data = [data[i] for i in order]
+        if isinstance(element._data, PackedFVector4List):
+            result._data = PackedFVector4List(data)
+        else:
+            result._data = list(data)
+        if hasattr(result, '_data_adapter'):
+            result._data_adapter = None
+        return result
+
     @staticmethod
     def _copy_vertex_elements(source_mesh: 'Mesh', target_mesh: 'Mesh'):
         from .VertexElement import VertexElement
@@ -47,7 +47,7 @@ class VertexElement:
         self._indices = list(data)
 
     def clear(self):
-        self._indices.clear()
+        del self._indices[:]
 
     @property
     def indices(self) -> List[int]:
@@ -1,6 +1,8 @@
+from array import array
 from typing import List, TYPE_CHECKING
 
 from .VertexElement import VertexElement
+from ..utilities.PackedFVector4List import PackedFVector4List
 
 if TYPE_CHECKING:
     from .MappingMode import MappingMode
@@ -33,17 +35,77 @@ class VertexElementFVector(VertexElement):
                 self._data = list(data)
             else:
                 raise TypeError(f"Unsupported data type for VertexElementFVector: {type(data[0])}")
+            self._data_adapter = None
+
+    @property
+    def packed(self) -> bool:
+        """Gets whether the data is kept in packed array('f') storage."""
+        return isinstance(self._data, PackedFVector4List)
+
+    def pack(self) -> 'VertexElementFVector':
+        """Moves the data into packed array('f') storage."""
+        if not isinstance(self._data, PackedFVector4List):
+            self._data = PackedFVector4List(self._data)
+            self._data_adapter = None
+        return self
+
+    def as_array(self):
+        """Gets the data as an (N, 4) float32 array.
+
+        With NumPy installed, packed data is returned as a view that shares memory
+        with this element; unpacked data is copied. Without NumPy a flat
+        array('f') copy of the x, y, z, w components is returned.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+
+        if isinstance(self._data, PackedFVector4List):
+            if np is None:
+                return array('f', self._data.buffer)
+            return np.frombuffer(self._data.buffer, dtype=np.float32).reshape(-1, 4)
+
+        flat = PackedFVector4List(self._data).buffer
+        if np is None:
+            return flat
+        return np.frombuffer(flat, dtype=np.float32).reshape(-1, 4)
+
+    def set_array(self, data, components: int = 4):
+        """Replaces the data with packed values from an (N, k) array or a flat sequence.
+
+        ``components`` gives the number of values per element for flat input and is
+        taken from the second dimension of two-dimensional NumPy arrays. Missing
+        components are filled with 0.
+        """
+        shape = getattr(data, 'shape', None)
+        if shape is not None:
+            import numpy as np
+            if len(shape) == 2:
+                components = shape[1]
+            data = memoryview(np.ascontiguousarray(data, dtype=np.float32)).cast('B')
+            values = array('f')
+            values.frombytes(data)
+            data = values
+        packed = PackedFVector4List()
+        packed.extend_components(data, components, 0.0)
+        self._data = packed
+        self._data_adapter = None
 
     def set_indices(self, data: List[int]):
         self._indices = list(data)
 
     def clear(self):
         self._data.clear()
-        self._indices.clear()
+        del self._indices[:]
 
     def copy_to(self, target: 'VertexElementFVector'):
-        target._data = list(self._data)
+        if isinstance(self._data, PackedFVector4List):
+            target._data = PackedFVector4List(self._data)
+        else:
+            target._data = list(self._data)
         target._indices = list(self._indices)
+        target._data_adapter = None
 
     @property
     def data(self) -> 'ArrayListAdapter[FVector4]':
@@ -1,21 +1,23 @@
 from typing import TYPE_CHECKING
 
 from .VertexElement import VertexElement
+from .VertexElementType import VertexElementType
 
 if TYPE_CHECKING:
     from .MappingMode import MappingMode
     from .ReferenceMode import ReferenceMode
-    from .VertexElementType import VertexElementType
 
 
 class VertexElementMaterial(VertexElement):
-    """Defines the material for specified components."""
+    """Defines the material for specified components.
 
-    def set_indices(self, data):
-        raise NotImplementedError("set_indices is not implemented")
+    The indices select a material from the materials of the node holding the
+    mesh, one index per polygon with MappingMode.POLYGON or a single index
+    with MappingMode.ALL_SAME.
+    """
 
-    def clear(self):
-        raise NotImplementedError("clear is not implemented")
+    def __init__(self, name: str = "", mapping_mode: 'MappingMode' = None, reference_mode: 'ReferenceMode' = None):
+        super().__init__(VertexElementType.MATERIAL, name, mapping_mode, reference_mode)
 
     def copy_to(self, target):
         raise NotImplementedError("copy_to is not implemented")
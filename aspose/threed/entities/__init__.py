@@ -34,6 +34,7 @@ from .PatchDirectionType import PatchDirectionType
 from .Plane import Plane
 from .PointCloud import PointCloud
 from .PolygonBuilder import PolygonBuilder
+from .PolygonListView import PolygonListView
 from .PolygonModifier import PolygonModifier
 from .Primitive import Primitive
 from .ProjectionType import ProjectionType
@@ -83,7 +84,7 @@ __all__ = [
     'IIndexedVertexElement', 'LinearExtrusion', 'Line', 'Light', 'LightType',
     'MappingMode', 'Mesh', 'NurbsCurve', 'NurbsDirection', 'NurbsSurface',
     'NurbsType', 'Patch', 'PatchDirection', 'PatchDirectionType', 'Plane',
-    'PointCloud', 'PolygonBuilder', 'PolygonModifier', 'Primitive', 'ProjectionType',
+    'PointCloud', 'PolygonBuilder', 'PolygonListView', 'PolygonModifier', 'Primitive', 'ProjectionType',
     'Pyramid', 'RectangularTorus', 'ReferenceMode', 'RevolvedAreaSolid',
     'RotationMode', 'Shape', 'Skeleton', 'SkeletonType', 'Sphere', 'SplitMeshPolicy',
     'SweptAreaSolid', 'TextureMapping', 'Torus', 'TransformedCurve', 'TriMesh',
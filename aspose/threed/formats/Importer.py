@@ -15,3 +15,22 @@ class Importer:
 
     def import_scene(self, scene: 'Scene', stream, options: 'LoadOptions'):
         raise NotImplementedError("import_scene is not implemented")
+
+    def _read_bytes(self, stream):
+        """Reads the whole stream as a bytes-like object.
+
+        A memory-mapped file, as passed by ``Scene.open`` when
+        ``LoadOptions.use_mmap`` is set, is returned as a memoryview so that
+        slicing it does not copy.
+        """
+        import mmap
+        if isinstance(stream, mmap.mmap):
+            return memoryview(stream)
+        if not hasattr(stream, 'read'):
+            raise TypeError("Stream must support read() method")
+        if hasattr(stream, 'seek'):
+            stream.seek(0)
+        data = stream.read()
+        if isinstance(data, str):
+            return data.encode('utf-8', errors='ignore')
+        return data
@@ -10,3 +10,22 @@ class LoadOptions(IOConfig):
     def __init__(self):
         super().__init__()
         self._encoding = None
+        self._packed_storage = False
+        self._use_mmap = False
+
+    @property
+    def packed_storage(self) -> bool:
+        return self._packed_storage
+
+    @packed_storage.setter
+    def packed_storage(self, value: bool):
+        self._packed_storage = bool(value)
+
+    @property
+    def use_mmap(self) -> bool:
+        """Gets whether Scene.open memory-maps the input file instead of reading it."""
+        return self._use_mmap
+
+    @use_mmap.setter
+    def use_mmap(self, value: bool):
+        self._use_mmap = bool(value)
@@ -157,25 +157,20 @@ class ColladaImporter(Importer):
                 mesh_data = mesh_map[geometry_url]
 
                 if mesh_data['positions']:
-                    mesh = Mesh(node_name)
+                    mesh = Mesh(node_name, packed=options.packed_storage)
                     node.entity = mesh
 
                     positions = mesh_data['positions']
                     normals = mesh_data['normals']
 
-                    vertex_map = {}
-
-                    for i in range(0, len(positions), 3):
-                        if i + 2 < len(positions):
-                            x = positions[i] * scale
-                            y = positions[i + 1] * scale
-                            z = positions[i + 2] * scale
-
-                            if flip_coords:
-                                y, z = z, y
+                    vertex_count = len(positions) // 3
+                    components = [p * scale for p in positions[:vertex_count * 3]]
+                    if flip_coords:
+                        components[1::3], components[2::3] = components[2::3], components[1::3]
 
-                            vertex_map[i // 3] = len(mesh._control_points)
-                            mesh._control_points.append(Vector4(x, y, z, 1))
+                    base_index = len(mesh._control_points)
+                    vertex_map = {i: base_index + i for i in range(vertex_count)}
+                    mesh._extend_control_points(components, 3)
 
                     if 'triangles' in mesh_data:
                         for triangles_elem in mesh_data['triangles']:
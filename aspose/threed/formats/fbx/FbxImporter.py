@@ -1,4 +1,6 @@
 from typing import TYPE_CHECKING, Optional, List, Dict, Any
+from array import array
+from functools import partial
 import io
 
 from ..Importer import Importer
@@ -23,49 +25,34 @@ class FbxImporter(Importer):
             return False
         return data[0:18] == b'Kaydara FBX Binary'
 
-    def _get_tokens_from_file(self, filename: str):
-        with open(filename, 'rb') as f:
-            data = f.read()
-
+    def _read_root_scope(self, data, options=None):
         if self._is_binary_file(data):
-            from .binary_tokenizer import BinaryTokenizer
-            tokenizer = BinaryTokenizer(data)
-            return tokenizer.tokenize()
-        else:
-            content = data.decode('utf-8')
-            from .tokenizer import FbxTokenizer
-            tokenizer = FbxTokenizer(content)
-            return tokenizer.tokenize()
-
-    def _get_tokens_from_stream(self, stream: io.IOBase):
-        content = stream.read()
-
-        if isinstance(content, bytes):
-            if self._is_binary_file(content):
-                from .binary_tokenizer import BinaryTokenizer
-                tokenizer = BinaryTokenizer(content)
-                return tokenizer.tokenize()
-            else:
-                content = content.decode('utf-8')
+            from .binary_reader import BinaryReader
+            record_filter = None
+            if self._has_filters(options):
+                kept_ids = None
+                if options.object_filter is not None:
+                    kept_ids = self._read_object_filter(data, options.object_filter)
+                record_filter = partial(self._keep_record, options, kept_ids)
+            return BinaryReader(data, record_filter).read()
 
         from .tokenizer import FbxTokenizer
-        tokenizer = FbxTokenizer(content)
-        return tokenizer.tokenize()
+        from .parser import FbxParser
+        content = str(data, 'utf-8')
+        return FbxParser(FbxTokenizer(content).tokenize()).root_scope
 
     def open(self, filename: str, options: Optional['FbxLoadOptions'] = None) -> 'Scene':
         if options is None:
             from .FbxLoadOptions import FbxLoadOptions
             options = FbxLoadOptions()
 
-        tokens = self._get_tokens_from_file(filename)
-
-        from .parser import FbxParser
-        parser = FbxParser(tokens)
+        with open(filename, 'rb') as f:
+            data = f.read()
 
         from aspose.threed import Scene
         scene = Scene()
 
-        self._parse_scene(parser.root_scope, scene)
+        self._parse_scene(self._read_root_scope(data, options), scene, options)
 
         return scene
 
@@ -74,27 +61,23 @@ class FbxImporter(Importer):
             from .FbxLoadOptions import FbxLoadOptions
             options = FbxLoadOptions()
 
-        tokens = self._get_tokens_from_stream(stream)
-
-        from .parser import FbxParser
-        parser = FbxParser(tokens)
+        root_scope = self._read_root_scope(self._read_bytes(stream), options)
 
         from aspose.threed import Scene
         scene = Scene()
 
-        self._parse_scene(parser.root_scope, scene)
+        self._parse_scene(root_scope, scene, options)
 
         return scene
 
     def import_scene(self, scene: 'Scene', stream: io.IOBase, options: 'FbxLoadOptions'):
-        tokens = self._get_tokens_from_stream(stream)
-
-        from .parser import FbxParser
-        parser = FbxParser(tokens)
+        from .FbxLoadOptions import FbxLoadOptions
 
-        self._parse_scene(parser.root_scope, scene)
+        if not isinstance(options, FbxLoadOptions):
+            options = FbxLoadOptions()
+        self._parse_scene(self._read_root_scope(self._read_bytes(stream), options), scene, options)
 
-    def _parse_scene(self, root_scope, scene):
+    def _parse_scene(self, root_scope, scene, options=None):
         objects_element = root_scope.get_first_element('Objects')
         if objects_element is None or objects_element.compound is None:
             return
@@ -106,14 +89,115 @@ class FbxImporter(Importer):
         model_elements = objects_scope.get_elements('Model')
         material_elements = objects_scope.get_elements('Material')
 
-        self._parse_geometries(geometry_elements, scene)
+        # Binary files are filtered while they are read; ASCII files only here.
+        if self._has_filters(options):
+            kept_ids = None
+            if options.object_filter is not None:
+                object_elements = [element for elements in objects_scope.elements.values() for element in elements]
+                kept_ids = self._resolve_object_filter(options.object_filter, object_elements, root_scope)
+            keep = partial(self._keep_record, options, kept_ids, 'Objects')
+            geometry_elements = [element for element in geometry_elements if keep(element)]
+            model_elements = [element for element in model_elements if keep(element)]
+            material_elements = [element for element in material_elements if keep(element)]
+
+        threads = options.decompression_threads
+        if threads:
+            from .binary_reader import decode_arrays
+            decode_arrays([element.compound for element in geometry_elements if element.compound is not None], threads)
+
+        self._parse_geometries(geometry_elements, scene, options)
         self._parse_models(model_elements, scene)
         self._parse_materials(material_elements, scene)
-        self._parse_connections(root_scope, scene)
+        self._parse_connections(root_scope, scene, options is not None and options.object_filter is not None)
+
+    def _has_filters(self, options) -> bool:
+        return options is not None and (not options.load_geometry
+                                        or not options.load_materials
+                                        or not options.load_animation
+                                        or options.object_filter is not None)
+
+    def _keep_record(self, options, kept_ids, parent_key, element) -> bool:
+        """Checks whether a record passes the object filters of the load options.
+
+        ``kept_ids`` holds the IDs of the objects passing the object filter, or
+        None when there is no object filter.
+        """
+        key = element.key
+        if parent_key is None:
+            return key != 'Takes' or options.load_animation
+        if parent_key != 'Objects':
+            return True
+
+        if key == 'Geometry' and not options.load_geometry:
+            return False
+        if key == 'Material' and not options.load_materials:
+            return False
+        if key.startswith('Animation') and not options.load_animation:
+            return False
 
-    def _parse_geometries(self, geometry_elements, scene):
+        if kept_ids is None:
+            return True
+        tokens = element.tokens
+        return bool(tokens) and self._parse_id(tokens[0].text) in kept_ids
+
+    def _read_object_filter(self, data, object_filter):
+        """Resolves the object filter of a binary file from its object headers and connections.
+
+        Only the properties of the object records are read; their contents are skipped.
+        """
+        from .binary_reader import BinaryReader
+
+        object_elements = []
+
+        def collect(parent_key, element):
+            if parent_key == 'Objects':
+                object_elements.append(element)
+                return False
+            return parent_key is not None or element.key in ('Objects', 'Connections')
+
+        root_scope = BinaryReader(data, collect).read()
+        return self._resolve_object_filter(object_filter, object_elements, root_scope)
+
+    def _resolve_object_filter(self, object_filter, object_elements, root_scope) -> set:
+        """Gets the IDs of the objects to load for an object filter.
+
+        Objects whose ID or name is listed are loaded together with the objects
+        connected below them, such as the geometry, node attributes, materials
+        and child models of a model.
+        """
+        kept_ids = set()
+        for element in object_elements:
+            tokens = element.tokens
+            object_id = self._parse_id(tokens[0].text) if tokens else None
+            if object_id is None:
+                continue
+            if object_id in object_filter or (len(tokens) > 1 and self._get_object_name(tokens[1].text) in object_filter):
+                kept_ids.add(object_id)
+
+        children = {}
+        for _, child_id, parent_id in self._get_connections(root_scope):
+            children.setdefault(parent_id, []).append(child_id)
+        pending = list(kept_ids)
+        while pending:
+            for child_id in children.get(pending.pop(), ()):
+                if child_id not in kept_ids:
+                    kept_ids.add(child_id)
+                    pending.append(child_id)
+        return kept_ids
+
+    def _get_object_name(self, text: str) -> str:
+        """Gets an object name without its class, stored as "Class::Name" in ASCII files and "Name\\x00\\x01Class" in binary files."""
+        text = text.strip('"')
+        if '\x00\x01' in text:
+            return text.split('\x00\x01', 1)[0]
+        if '::' in text:
+            return text.split('::', 1)[1]
+        return text
+
+    def _parse_geometries(self, geometry_elements, scene, options=None):
         from aspose.threed.entities import Mesh
-        from aspose.threed.utilities import Vector4
+
+        packed = getattr(options, 'packed_storage', False)
 
         for geom_elem in geometry_elements:
             geom_scope = geom_elem.compound
@@ -124,62 +208,59 @@ class FbxImporter(Importer):
             if geom_id is None:
                 continue
 
-            mesh = Mesh()
+            mesh = Mesh(packed=packed)
             self._object_map[geom_id] = mesh
 
             vertices_element = geom_scope.get_first_element('Vertices')
-            if vertices_element and vertices_element.compound:
-                a_elem = vertices_element.compound.get_first_element('a')
-                if a_elem:
-                    vertices = self._parse_float_array(a_elem.tokens[0].text)
-                    for i in range(0, len(vertices), 3):
-                        if i + 2 < len(vertices):
-                            mesh._control_points.append(Vector4(vertices[i], vertices[i + 1], vertices[i + 2], 1.0))
+            vertices = self._get_array_value(vertices_element)
+            if vertices is not None:
+                vertices = self._parse_float_array(vertices)
+                mesh._extend_control_points(vertices, 3)
 
             polygon_element = geom_scope.get_first_element('PolygonVertexIndex')
-            if polygon_element and polygon_element.compound:
-                a_elem = polygon_element.compound.get_first_element('a')
-                if a_elem:
-                    indices = self._parse_int_array(a_elem.tokens[0].text)
-                    for idx in indices:
-                        if idx < 0:
-                            mesh._polygons.append(abs(idx) - 1)
-                            mesh._polygons.append(0xFFFFFFFF)
-                        else:
-                            mesh._polygons.append(idx)
+            indices = self._get_array_value(polygon_element)
+            if indices is not None:
+                indices = self._parse_int_array(indices)
+                size = 0
+                for idx in indices:
+                    size += 1
+                    if idx < 0:
+                        mesh._polygons.append(~idx)
+                        mesh._polygon_sizes.append(size)
+                        size = 0
+                    else:
+                        mesh._polygons.append(idx)
 
             normal_element = geom_scope.get_first_element('Normals')
-            if normal_element and normal_element.compound:
-                a_elem = normal_element.compound.get_first_element('a')
-                if a_elem:
-                    normals = self._parse_float_array(a_elem.tokens[0].text)
-                    from aspose.threed.entities import VertexElementNormal
-                    from aspose.threed.entities.VertexElementType import VertexElementType
-                    from aspose.threed.utilities.FVector4 import FVector4
-                    vertex_element = mesh.create_element(VertexElementType.NORMAL)
-                    from aspose.threed.entities.MappingMode import MappingMode
-                    vertex_element.mapping_mode = MappingMode.CONTROL_POINT
-                    normal_data = []
-                    for i in range(0, len(normals), 3):
-                        if i + 2 < len(normals):
-                            normal_data.append(FVector4(normals[i], normals[i + 1], normals[i + 2], 0.0))
-                    vertex_element.set_data(normal_data)
+            normals = self._get_array_value(normal_element)
+            if normals is not None:
+                normals = self._parse_float_array(normals)
+                from aspose.threed.entities import VertexElementNormal
+                from aspose.threed.entities.VertexElementType import VertexElementType
+                from aspose.threed.utilities.FVector4 import FVector4
+                vertex_element = mesh.create_element(VertexElementType.NORMAL)
+                from aspose.threed.entities.MappingMode import MappingMode
+                vertex_element.mapping_mode = MappingMode.CONTROL_POINT
+                normal_data = []
+                for i in range(0, len(normals), 3):
+                    if i + 2 < len(normals):
+                        normal_data.append(FVector4(normals[i], normals[i + 1], normals[i + 2], 0.0))
+                vertex_element.set_data(normal_data)
 
             uv_element = geom_scope.get_first_element('UV')
-            if uv_element and uv_element.compound:
-                a_elem = uv_element.compound.get_first_element('a')
-                if a_elem:
-                    uvs = self._parse_float_array(a_elem.tokens[0].text)
-                    from aspose.threed.entities.TextureMapping import TextureMapping
-                    from aspose.threed.utilities.FVector2 import FVector2
-                    vertex_element = mesh.create_element_uv(TextureMapping.DIFFUSE)
-                    from aspose.threed.entities.MappingMode import MappingMode
-                    vertex_element.mapping_mode = MappingMode.CONTROL_POINT
-                    uv_data = []
-                    for i in range(0, len(uvs), 2):
-                        if i + 1 < len(uvs):
-                            uv_data.append(FVector2(uvs[i], uvs[i + 1]))
-                    vertex_element.set_data(uv_data)
+            uvs = self._get_array_value(uv_element)
+            if uvs is not None:
+                uvs = self._parse_float_array(uvs)
+                from aspose.threed.entities.TextureMapping import TextureMapping
+                from aspose.threed.utilities.FVector2 import FVector2
+                vertex_element = mesh.create_element_uv(TextureMapping.DIFFUSE)
+                from aspose.threed.entities.MappingMode import MappingMode
+                vertex_element.mapping_mode = MappingMode.CONTROL_POINT
+                uv_data = []
+                for i in range(0, len(uvs), 2):
+                    if i + 1 < len(uvs):
+                        uv_data.append(FVector2(uvs[i], uvs[i + 1]))
+                vertex_element.set_data(uv_data)
 
     def _parse_models(self, model_elements, scene):
         from aspose.threed import Node
@@ -217,31 +298,34 @@ class FbxImporter(Importer):
             if mat_scope is None:
                 continue
 
-    def _parse_connections(self, root_scope, scene):
+    def _parse_connections(self, root_scope, scene, attach_orphans: bool = False):
+        for conn_type, child_id, parent_id in self._get_connections(root_scope):
+            if conn_type == 'OO':
+                self._connect_objects(child_id, parent_id, scene, attach_orphans)
+
+    def _get_connections(self, root_scope):
+        """Gets the (type, child ID, parent ID) of each connection."""
         connections_element = root_scope.get_first_element('Connections')
         if connections_element is None or connections_element.compound is None:
-            return
+            return []
 
-        connections_scope = connections_element.compound
-        connection_elements = connections_scope.get_elements('C')
-
-        for conn_elem in connection_elements:
+        connections = []
+        for conn_elem in connections_element.compound.get_elements('C'):
             if len(conn_elem.tokens) < 3:
                 continue
 
             conn_type = conn_elem.tokens[0].text
-            if isinstance(conn_type, str):
-                conn_type = conn_type.strip('"')
-            else:
+            if not isinstance(conn_type, str):
                 continue
+            connections.append((conn_type.strip('"'), self._parse_id(conn_elem.tokens[1].text),
+                                self._parse_id(conn_elem.tokens[2].text)))
+        return connections
 
-            if conn_type == 'OO':
-                child_id = self._parse_id(conn_elem.tokens[1].text)
-                parent_id = self._parse_id(conn_elem.tokens[2].text)
-
-                self._connect_objects(child_id, parent_id, scene)
+    def _connect_objects(self, child_id, parent_id, scene, attach_orphans: bool = False):
+        from aspose.threed.entities import Mesh
+        from aspose.threed import Node
+        from aspose.threed.shading import Material
 
-    def _connect_objects(self, child_id, parent_id, scene):
         if child_id is None:
             return
 
@@ -254,11 +338,11 @@ class FbxImporter(Importer):
         else:
             parent_obj = self._object_map.get(parent_id)
             if parent_obj is None:
-                return
-
-        from aspose.threed.entities import Mesh
-        from aspose.threed import Node
-        from aspose.threed.shading import Material
+                # With attach_orphans, a node whose parent was filtered out is
+                # attached to the root node instead.
+                if not attach_orphans or not isinstance(child_obj, Node):
+                    return
+                parent_obj = scene.root_node
 
         if isinstance(child_obj, Mesh) and isinstance(parent_obj, Node):
             parent_obj._entities.append(child_obj)
@@ -279,22 +363,32 @@ class FbxImporter(Importer):
         except (ValueError, TypeError):
             return None
 
+    def _get_array_value(self, element):
+        """Gets the array of an element, held by an ``a`` child in ASCII files and by the element itself in binary files."""
+        if element is None:
+            return None
+        if element.compound is not None:
+            element = element.compound.get_first_element('a')
+            if element is None:
+                return None
+        return element.tokens[0].value if element.tokens else None
+
     def _parse_int_array(self, value):
-        if isinstance(value, list):
+        if isinstance(value, (list, array)):
             return value
-        import re
-        text = str(value)
-        if text.startswith('a:'):
-            text = text[2:]
-        values = re.findall(r'-?\d+', text)
-        return [int(v) for v in values]
+        return array('q', map(int, self._split_array(value)))
 
     def _parse_float_array(self, value):
-        if isinstance(value, list):
+        if isinstance(value, (list, array)):
             return value
-        import re
+        return array('d', map(float, self._split_array(value)))
+
+    def _split_array(self, value) -> List[str]:
+        """Splits the comma-separated values of an ASCII array property."""
         text = str(value)
         if text.startswith('a:'):
             text = text[2:]
-        values = re.findall(r'-?\d+\.?\d*', text)
-        return [float(v) for v in values]
+        values = text.split(',')
+        if not values[-1].strip():
+            values.pop()
+        return values
@@ -11,6 +11,11 @@ class FbxLoadOptions(LoadOptions):
         super().__init__()
         self._keep_builtin_global_settings = False
         self._compatible_mode = False
+        self._decompression_threads = 0
+        self._load_geometry = True
+        self._load_materials = True
+        self._load_animation = True
+        self._object_filter = None
         if format is not None:
             self._file_format = format
 
@@ -29,3 +34,60 @@ class FbxLoadOptions(LoadOptions):
     @compatible_mode.setter
     def compatible_mode(self, value: bool):
         self._compatible_mode = bool(value)
+
+    @property
+    def decompression_threads(self) -> int:
+        """Gets the number of threads decompressing the geometry arrays of binary files, or 0 to decompress them as they are read."""
+        return self._decompression_threads
+
+    @decompression_threads.setter
+    def decompression_threads(self, value: int):
+        value = int(value)
+        if value < 0:
+            raise ValueError("decompression_threads must not be negative")
+        self._decompression_threads = value
+
+    @property
+    def load_geometry(self) -> bool:
+        """Gets whether Geometry objects are loaded; without them only the node hierarchy is imported."""
+        return self._load_geometry
+
+    @load_geometry.setter
+    def load_geometry(self, value: bool):
+        self._load_geometry = bool(value)
+
+    @property
+    def load_materials(self) -> bool:
+        """Gets whether Material objects are loaded."""
+        return self._load_materials
+
+    @load_materials.setter
+    def load_materials(self, value: bool):
+        self._load_materials = bool(value)
+
+    @property
+    def load_animation(self) -> bool:
+        """Gets whether animation objects and takes are read."""
+        return self._load_animation
+
+    @load_animation.setter
+    def load_animation(self, value: bool):
+        self._load_animation = bool(value)
+
+    @property
+    def object_filter(self):
+        """Gets the IDs and names of the objects to load, or None to load all objects.
+
+        Objects connected below a listed object are loaded with it, so listing
+        a model also loads its geometry, materials and child models; a listed
+        model whose parent is not loaded is attached to the root node. A single
+        ID or name may be given on its own. Records of binary files that are
+        filtered out are skipped without reading their contents.
+        """
+        return self._object_filter
+
+    @object_filter.setter
+    def object_filter(self, value):
+        if isinstance(value, (str, int)):
+            value = [value]
+        self._object_filter = None if value is None else frozenset(value)
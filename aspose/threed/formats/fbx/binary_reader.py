@@ -0,0 +1,227 @@
+from array import array
+import struct
+import sys
+import zlib
+
+from .binary_tokenizer import Token, TokenType
+from .parser import FbxElement, FbxScope
+
+
+_UINT32 = struct.Struct('<I')
+_RECORD_HEADER_32 = struct.Struct('<III')
+_RECORD_HEADER_64 = struct.Struct('<QQQ')
+_ARRAY_HEADER = struct.Struct('<III')
+
+_STRING = ord('S')
+_RAW = ord('R')
+
+# Property type code -> struct of the scalar value
+_SCALARS = {
+    ord('Y'): struct.Struct('<h'),
+    ord('C'): struct.Struct('<?'),
+    ord('I'): struct.Struct('<i'),
+    ord('F'): struct.Struct('<f'),
+    ord('D'): struct.Struct('<d'),
+    ord('L'): struct.Struct('<q'),
+}
+
+# Property type code -> array typecode of the array value
+_ARRAYS = {
+    ord('f'): 'f',
+    ord('d'): 'd',
+    ord('i'): 'i',
+    ord('l'): 'q',
+    ord('b'): 'B',
+    ord('c'): 'B',
+}
+
+
+def _decode_array(typecode: str, length: int, encoding: int, stored) -> array:
+    if encoding == 1:
+        stored = zlib.decompress(stored)
+
+    values = array(typecode)
+    if len(stored) != length * values.itemsize:
+        raise ValueError(f"Array length mismatch: type={typecode}, length={length}, actual_len={len(stored)}")
+    values.frombytes(stored)
+    if sys.byteorder == 'big' and values.itemsize > 1:
+        values.byteswap()
+    return values
+
+
+class _ArrayToken(Token):
+    """A DATA token of an array property, decoded into an array when its value is first read."""
+
+    def __init__(self, typecode: str, length: int, encoding: int, stored):
+        super().__init__(None, TokenType.DATA)
+        self._encoded = (typecode, length, encoding, stored)
+
+    @property
+    def value(self):
+        if self._encoded is not None:
+            self._value = _decode_array(*self._encoded)
+            self._encoded = None
+        return self._value
+
+    @property
+    def text(self):
+        return str(self.value)
+
+
+def decode_arrays(scopes, max_workers: int = None):
+    """Decodes the compressed array properties under ``scopes`` on a thread pool.
+
+    zlib releases the GIL while decompressing, so the arrays decompress in
+    parallel. Arrays already read and uncompressed arrays are left as they are.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    pending = []
+    stack = list(scopes)
+    while stack:
+        scope = stack.pop()
+        for elements in scope.elements.values():
+            for element in elements:
+                for token in element.tokens:
+                    if isinstance(token, _ArrayToken) and token._encoded is not None and token._encoded[2] == 1:
+                        pending.append(token)
+                if element.compound is not None:
+                    stack.append(element.compound)
+
+    if not pending:
+        return
+    with ThreadPoolExecutor(max_workers) as executor:
+        decoded = executor.map(lambda token: _decode_array(*token._encoded), pending)
+        for token, values in zip(pending, decoded):
+            token._value = values
+            token._encoded = None
+
+
+class BinaryReader:
+    """Reads a binary FBX file into an FbxScope tree.
+
+    Node records become FbxElement objects directly, without the flat token
+    list of BinaryTokenizer, so memory follows the number of nodes and
+    properties. Array properties keep a view of their stored bytes and are
+    only decompressed and decoded into array objects when read, so subtrees
+    the importer skips cost no decoding.
+    """
+
+    def __init__(self, data, record_filter=None):
+        # Slicing a memoryview does not copy, which matters for large or
+        # memory-mapped inputs.
+        self.data = memoryview(data)
+        # Called as record_filter(parent_key, element) once a record's properties
+        # are read; records it rejects are skipped without reading their children.
+        self.record_filter = record_filter
+        self.is_64bit = False
+        self._record_header = _RECORD_HEADER_32
+        self._sentinel_length = 13
+
+    def read(self) -> FbxScope:
+        data = self.data
+        if len(data) < 27:
+            raise ValueError("File is too short")
+        if bytes(data[0:18]) != b'Kaydara FBX Binary':
+            raise ValueError("Invalid FBX binary file header")
+
+        version = _UINT32.unpack_from(data, 23)[0]
+        self.is_64bit = version >= 7500
+        if self.is_64bit:
+            self._record_header = _RECORD_HEADER_64
+            self._sentinel_length = 25
+
+        scope = FbxScope()
+        cursor = 27
+        header_size = self._record_header.size
+        try:
+            while cursor + header_size <= len(data):
+                if self._record_header.unpack_from(data, cursor)[0] == 0:
+                    break
+                cursor = self._read_element(scope, cursor, None)
+        except struct.error:
+            raise ValueError("Unexpected end of file")
+        return scope
+
+    def _read_element(self, scope: FbxScope, cursor: int, parent_key) -> int:
+        """Reads the node record at ``cursor`` into ``scope`` and returns the offset after it."""
+        data = self.data
+        end_offset, property_count, property_length = self._record_header.unpack_from(data, cursor)
+        if end_offset > len(data):
+            raise ValueError(f"Block offset {end_offset} is out of range")
+        if end_offset < cursor:
+            raise ValueError(f"Block offset {end_offset} is negative")
+        cursor += self._record_header.size
+
+        name_length = data[cursor]
+        name = str(data[cursor + 1:cursor + 1 + name_length], 'utf-8', errors='ignore')
+        cursor += 1 + name_length
+        element = FbxElement(Token(name, TokenType.KEY))
+
+        properties_end = cursor + property_length
+        if properties_end > len(data):
+            raise ValueError("Property length out of bounds")
+        for _ in range(property_count):
+            token, cursor = self._read_property(cursor)
+            element.add_token(token)
+        if cursor != properties_end:
+            raise ValueError("Property length not reached")
+
+        if self.record_filter is not None and not self.record_filter(parent_key, element):
+            return end_offset
+
+        if cursor < end_offset:
+            sentinel_length = self._sentinel_length
+            if end_offset - cursor < sentinel_length:
+                raise ValueError("Insufficient padding bytes at block end")
+
+            child_scope = FbxScope()
+            end = end_offset - sentinel_length
+            while cursor < end:
+                cursor = self._read_element(child_scope, cursor, element.key)
+            if any(data[cursor:cursor + sentinel_length]):
+                raise ValueError("Failed to read nested block sentinel")
+            cursor += sentinel_length
+            element.set_compound(child_scope)
+
+        if cursor != end_offset:
+            raise ValueError("Scope length not reached")
+
+        scope.add_element(element)
+        return cursor
+
+    def _read_property(self, cursor: int):
+        """Reads the property at ``cursor`` and returns its token and the offset after it."""
+        data = self.data
+        type_code = data[cursor]
+        cursor += 1
+
+        scalar = _SCALARS.get(type_code)
+        if scalar is not None:
+            return Token(scalar.unpack_from(data, cursor)[0], TokenType.DATA), cursor + scalar.size
+
+        typecode = _ARRAYS.get(type_code)
+        if typecode is not None:
+            length, encoding, stored_length = _ARRAY_HEADER.unpack_from(data, cursor)
+            cursor += _ARRAY_HEADER.size
+            end = cursor + stored_length
+            if end > len(data):
+                raise ValueError("Array data out of bounds")
+            if encoding == 0:
+                if stored_length != length * array(typecode).itemsize:
+                    raise ValueError(f"Array length mismatch: type={typecode}, length={length}, actual_len={stored_length}")
+            elif encoding != 1:
+                raise ValueError(f"Unknown encoding {encoding}")
+            return _ArrayToken(typecode, length, encoding, data[cursor:end]), end
+
+        if type_code == _STRING or type_code == _RAW:
+            length = _UINT32.unpack_from(data, cursor)[0]
+            cursor += 4
+            end = cursor + length
+            if end > len(data):
+                raise ValueError("String data out of bounds")
+            if type_code == _STRING:
+                return Token(str(data[cursor:end], 'utf-8', errors='ignore'), TokenType.DATA), end
+            return Token(bytes(data[cursor:end]), TokenType.DATA), end
+
+        raise ValueError(f"Unexpected type code: {chr(type_code)}")
@@ -45,7 +45,9 @@ class Token:
 
 class BinaryTokenizer:
     def __init__(self, data):
-        self.data = data
+        # Slicing a memoryview does not copy, which matters for large or
+        # memory-mapped inputs.
+        self.data = memoryview(data)
         self.cursor = 0
         self.is_64bit = False
 
@@ -53,7 +55,7 @@ class BinaryTokenizer:
         if len(self.data) < 27:
             raise ValueError("File is too short")
 
-        magic = self.data[0:18].decode('ascii', errors='ignore')
+        magic = str(self.data[0:18], 'ascii', errors='ignore')
         if magic != 'Kaydara FBX Binary':
             raise ValueError("Invalid FBX binary file header")
 
@@ -138,49 +140,49 @@ class BinaryTokenizer:
     def _read_uint32(self):
         if self.cursor + 4 > len(self.data):
             raise EOFError()
-        value = struct.unpack('<I', self.data[self.cursor:self.cursor + 4])[0]
+        value = struct.unpack_from('<I', self.data, self.cursor)[0]
         self.cursor += 4
         return value
 
     def _read_uint64(self):
         if self.cursor + 8 > len(self.data):
             raise EOFError()
-        value = struct.unpack('<Q', self.data[self.cursor:self.cursor + 8])[0]
+        value = struct.unpack_from('<Q', self.data, self.cursor)[0]
         self.cursor += 8
         return value
 
     def _read_int16(self):
         if self.cursor + 2 > len(self.data):
             raise EOFError()
-        value = struct.unpack('<h', self.data[self.cursor:self.cursor + 2])[0]
+        value = struct.unpack_from('<h', self.data, self.cursor)[0]
         self.cursor += 2
         return value
 
     def _read_int32(self):
         if self.cursor + 4 > len(self.data):
             raise EOFError()
-        value = struct.unpack('<i', self.data[self.cursor:self.cursor + 4])[0]
+        value = struct.unpack_from('<i', self.data, self.cursor)[0]
         self.cursor += 4
         return value
 
     def _read_int64(self):
         if self.cursor + 8 > len(self.data):
             raise EOFError()
-        value = struct.unpack('<q', self.data[self.cursor:self.cursor + 8])[0]
+        value = struct.unpack_from('<q', self.data, self.cursor)[0]
         self.cursor += 8
         return value
 
     def _read_float32(self):
         if self.cursor + 4 > len(self.data):
             raise EOFError()
-        value = struct.unpack('<f', self.data[self.cursor:self.cursor + 4])[0]
+        value = struct.unpack_from('<f', self.data, self.cursor)[0]
         self.cursor += 4
         return value
 
     def _read_float64(self):
         if self.cursor + 8 > len(self.data):
             raise EOFError()
-        value = struct.unpack('<d', self.data[self.cursor:self.cursor + 8])[0]
+        value = struct.unpack_from('<d', self.data, self.cursor)[0]
         self.cursor += 8
         return value
 
@@ -204,7 +206,7 @@ class BinaryTokenizer:
         if self.cursor + length > len(self.data):
             raise EOFError()
 
-        s = self.data[self.cursor:self.cursor + length].decode('utf-8', errors='ignore')
+        s = str(self.data[self.cursor:self.cursor + length], 'utf-8', errors='ignore')
         self.cursor += length
         return s
 
@@ -217,7 +219,7 @@ class BinaryTokenizer:
 
         if type_char == 'Y':
             self.cursor += 2
-            value = struct.unpack('<h', self.data[self.cursor - 2:self.cursor])[0]
+            value = struct.unpack_from('<h', self.data, self.cursor - 2)[0]
         elif type_char == 'C':
             value = bool(self._read_byte())
         elif type_char == 'I':
@@ -230,7 +232,7 @@ class BinaryTokenizer:
             value = self._read_int64()
         elif type_char == 'R':
             length = self._read_uint32()
-            raw_data = self.data[self.cursor:self.cursor + length]
+            raw_data = bytes(self.data[self.cursor:self.cursor + length])
             self.cursor += length
             value = raw_data
         elif type_char in 'fdlic':
@@ -264,7 +266,7 @@ class BinaryTokenizer:
                 elif type_char == 'c':
                     values = list(array_data)
                 else:
-                    values = array_data
+                    values = bytes(array_data)
 
                 value = values
             elif encoding == 1:
@@ -1,4 +1,5 @@
 from typing import List, Tuple, Optional
+import re
 
 
 class TokenType:
@@ -31,6 +32,10 @@ class Token:
     def text(self) -> str:
         return self._text
 
+    @property
+    def value(self) -> str:
+        return self._text
+
     @property
     def type(self) -> int:
         return self._type
@@ -47,123 +52,86 @@ class Token:
         return f"Token({TokenType.to_string(self._type)}, '{self._text}', line={self._line}, col={self._column})"
 
 
+# One alternative per token kind; a word followed by a colon on the same line is a key.
+_TOKEN_PATTERN = re.compile(r'''
+    (?P<space>\s+)
+  | (?P<comment>;[^\n]*)
+  | (?P<string>"[^"]*")
+  | (?P<key>[^\s{},:;"]+)[^\S\n]*:
+  | (?P<word>[^\s{},:;"]+)
+  | (?P<open>\{)
+  | (?P<close>\})
+  | (?P<comma>,)
+  | (?P<colon>:)
+  | (?P<unterminated>"[^"]*)
+''', re.VERBOSE)
+
+# The numbers of an array property up to its closing bracket
+_ARRAY_PATTERN = re.compile(r'[-+0-9.eE,\s]*(?=})')
+
+
 class FbxTokenizer:
+    """Splits ASCII FBX text into tokens with a compiled regular expression.
+
+    The values of an array property (``a: 1,2,3``) become a single DATA token
+    holding the comma-separated text, which the importer splits when it reads
+    the array.
+    """
+
     def __init__(self, data: str):
         self._data = data
         self._tokens: List[Token] = []
 
     def tokenize(self) -> List[Token]:
+        data = self._data
+        tokens = self._tokens
+        match = _TOKEN_PATTERN.match
         line = 1
-        column = 1
-        in_comment = False
-        in_double_quotes = False
-        pending_data = False
-        token_start = None
-        token_end = None
-        i = 0
-
-        while i < len(self._data):
-            c = self._data[i]
-
-            if c == '\n':
-                column = 0
-                line += 1
-                in_comment = False
-                i += 1
-            elif not in_comment:
-                if in_double_quotes:
-                    if c == '"':
-                        in_double_quotes = False
-                        token_end = i
-                        self._process_data_token(token_start, token_end, TokenType.DATA, line, column)
-                        pending_data = False
-                        token_start = None
-                        token_end = None
-                    i += 1
-                    continue
-
-                if c == '"':
-                    token_start = i
-                    in_double_quotes = True
-                    i += 1
-                    continue
-
-                if c == ';':
-                    self._process_data_token(token_start, token_end, TokenType.DATA, line, column)
-                    token_start = None
-                    token_end = None
-                    in_comment = True
-                    i += 1
-                    continue
-
-                if c == '{':
-                    self._process_data_token(token_start, token_end, TokenType.KEY, line, column)
-                    token_start = None
-                    token_end = None
-                    self._tokens.append(Token('{', TokenType.OPEN_BRACKET, line, column))
-                    i += 1
-                    continue
-
-                if c == '}':
-                    self._process_data_token(token_start, token_end, TokenType.DATA, line, column)
-                    token_start = None
-                    token_end = None
-                    self._tokens.append(Token('}', TokenType.CLOSE_BRACKET, line, column))
-                    i += 1
-                    continue
-
-                if c == ',':
-                    if pending_data:
-                        self._process_data_token(token_start, token_end, TokenType.DATA, line, column, True)
-                        token_start = None
-                        token_end = None
-                    self._tokens.append(Token(',', TokenType.COMMA, line, column))
-                    i += 1
-                    continue
-
-                if c == ':':
-                    if pending_data:
-                        self._process_data_token(token_start, token_end, TokenType.KEY, line, column, True)
-                        token_start = None
-                        token_end = None
-                    else:
-                        raise ValueError(f"Unexpected colon at line {line}, column {column}")
-                    i += 1
-                    continue
-
-                if c.isspace():
-                    if token_start is not None:
-                        peek_pos = i + 1
-                        while peek_pos < len(self._data) and self._data[peek_pos].isspace() and self._data[peek_pos] != '\n':
-                            peek_pos += 1
-
-                        token_type = TokenType.DATA
-                        if peek_pos < len(self._data) and self._data[peek_pos] == ':':
-                            token_type = TokenType.KEY
-                            i = peek_pos
-
-                        self._process_data_token(token_start, token_end, token_type, line, column)
-                        token_start = None
-                        token_end = None
-                    pending_data = False
-                    i += 1
-                else:
-                    token_end = i
-                    if token_start is None:
-                        token_start = i
-                    pending_data = True
-                    i += 1
-
-            else:
-                i += 1
-
-            column += 1
-
-        return self._tokens
-
-    def _process_data_token(self, start, end, token_type, line, column, must_have=False):
-        if start is not None and end is not None:
-            token_text = self._data[start:end + 1]
-            self._tokens.append(Token(token_text, token_type, line, start + 1))
-        elif must_have:
-            raise ValueError(f"Unexpected character at line {line}, column {column}, expected data token")
+        line_start = 0
+        position = 0
+
+        while True:
+            m = match(data, position)
+            if m is None:
+                break
+            kind = m.lastgroup
+            start = m.start()
+            position = m.end()
+
+            if kind == 'space' or kind == 'string':
+                if kind == 'string':
+                    tokens.append(Token(m.group(), TokenType.DATA, line, start - line_start + 1))
+                newlines = m.group().count('\n')
+                if newlines:
+                    line += newlines
+                    line_start = m.start() + m.group().rindex('\n') + 1
+            elif kind == 'key':
+                key = m.group('key')
+                tokens.append(Token(key, TokenType.KEY, line, start - line_start + 1))
+                if key == 'a':
+                    values = _ARRAY_PATTERN.match(data, position)
+                    if values is not None and values.group().strip():
+                        text = values.group()
+                        offset = len(text) - len(text.lstrip())
+                        tokens.append(Token(text.strip(), TokenType.DATA, line, position + offset - line_start + 1))
+                        newlines = text.count('\n')
+                        if newlines:
+                            line += newlines
+                            line_start = position + text.rindex('\n') + 1
+                        position = values.end()
+            elif kind == 'word':
+                # A word directly followed by a bracket names the block.
+                token_type = TokenType.KEY if data.startswith('{', position) else TokenType.DATA
+                tokens.append(Token(m.group(), token_type, line, start - line_start + 1))
+            elif kind == 'open':
+                tokens.append(Token('{', TokenType.OPEN_BRACKET, line, start - line_start + 1))
+            elif kind == 'close':
+                tokens.append(Token('}', TokenType.CLOSE_BRACKET, line, start - line_start + 1))
+            elif kind == 'comma':
+                tokens.append(Token(',', TokenType.COMMA, line, start - line_start + 1))
+            elif kind == 'colon':
+                raise ValueError(f"Unexpected colon at line {line}, column {start - line_start + 1}")
+            elif kind == 'unterminated':
+                break
+
+        return tokens
@@ -1,8 +1,14 @@
 from typing import TYPE_CHECKING
+from array import array
+from itertools import chain
+from operator import attrgetter
 import json
 import struct
 import io
+import sys
+import uuid
 import base64
+from functools import partial
 
 from ..Exporter import Exporter
 from ..SaveOptions import SaveOptions
@@ -28,12 +34,15 @@ class GltfExporter(Exporter):
 
         is_binary = options.binary_mode or self._is_stream_binary(stream)
 
-        gltf_json, binary_buffer_data = self._build_gltf_data(scene, options)
+        gltf_json, buffer_builder = self._build_gltf_data(scene, options, not is_binary and options.external_buffers and options.buffer_per_mesh)
 
         if is_binary:
-            self._write_binary_gltf(stream, gltf_json, binary_buffer_data)
+            self._write_binary_gltf(stream, gltf_json, buffer_builder)
+        elif options.external_buffers:
+            self._write_external_buffers(stream, gltf_json, buffer_builder, options)
+            self._get_text_writer(stream)(json.dumps(gltf_json, indent=2))
         else:
-            self._write_ascii_gltf(stream, gltf_json, binary_buffer_data)
+            self._write_ascii_gltf(stream, gltf_json, buffer_builder)
 
     def _is_stream_binary(self, stream):
         if hasattr(stream, 'name'):
@@ -42,17 +51,21 @@ class GltfExporter(Exporter):
                 return True
         return False
 
-    def _build_gltf_data(self, scene: 'Scene', options: 'GltfSaveOptions'):
+    def _build_gltf_data(self, scene: 'Scene', options: 'GltfSaveOptions', buffer_per_mesh: bool = False):
         from aspose.threed.entities import Mesh
 
         all_meshes = []
         all_nodes = []
+        visited = set()
+        mesh_index_map = {}
 
         def visit_node(node):
-            if node not in all_nodes:
+            if node not in visited:
+                visited.add(node)
                 all_nodes.append(node)
                 if node.entity and isinstance(node.entity, Mesh):
-                    if node.entity not in all_meshes:
+                    if node.entity not in mesh_index_map:
+                        mesh_index_map[node.entity] = len(all_meshes)
                         all_meshes.append(node.entity)
                 for child in node.child_nodes:
                     visit_node(child)
@@ -60,17 +73,21 @@ class GltfExporter(Exporter):
         for child in scene.root_node.child_nodes:
             visit_node(child)
 
-        buffers = []
-        buffer_views = []
-        accessors = []
+        # First node of each instanced group -> all nodes of the group; the
+        # others are written as instances of the first one only.
+        instances = {}
+        if options.mesh_instancing:
+            instances = self._group_instances(all_nodes)
+            instanced = set(chain.from_iterable(group[1:] for group in instances.values()))
+            all_nodes = [node for node in all_nodes if node not in instanced]
+
         materials = []
         meshes = []
         nodes = []
-        mesh_to_material = {}
+        mesh_to_materials = {}
 
-        binary_buffer_data = bytearray()
+        buffer_builder = _BufferBuilder()
 
-        mesh_index_map = {}
         node_index_map = {}
 
         for i, node in enumerate(all_nodes):
@@ -78,30 +95,62 @@ class GltfExporter(Exporter):
 
         for node in all_nodes:
             if node.material and node.entity and isinstance(node.entity, Mesh):
-                mesh_to_material[node.entity] = node.material
+                mesh_to_materials[node.entity] = node.materials
+
+        materials, material_index_map = self._build_materials(mesh_to_materials, options)
 
-        materials, material_index_map = self._build_materials(mesh_to_material, options)
+        # Mesh index -> (offset, scale) restoring quantized positions
+        dequantization = {}
 
         for i, mesh in enumerate(all_meshes):
-            mesh_data = self._build_mesh_data(mesh, options, binary_buffer_data, buffer_views, accessors, buffers, i, mesh_to_material, material_index_map)
+            if buffer_per_mesh:
+                buffer_builder.start_buffer()
+            mesh_data = self._build_mesh_data(mesh, options, buffer_builder, i, mesh_to_materials.get(mesh, []), material_index_map, dequantization)
             meshes.append(mesh_data)
-            mesh_index_map[mesh] = i
 
+        quantized_nodes = []
         for node in all_nodes:
             node_data = {}
             if node.name:
                 node_data['name'] = node.name
 
+            mesh_idx = None
             if node.entity and isinstance(node.entity, Mesh):
-                if node.entity in mesh_index_map:
-                    node_data['mesh'] = mesh_index_map[node.entity]
+                mesh_idx = mesh_index_map.get(node.entity)
+
+            if node in instances:
+                # The instance transforms replace the node's own, which stays identity.
+                attributes = self._add_instance_accessors(buffer_builder, instances[node], dequantization.get(mesh_idx))
+                node_data['mesh'] = mesh_idx
+                node_data['extensions'] = {'EXT_mesh_gpu_instancing': {'attributes': attributes}}
+                nodes.append(node_data)
+                continue
 
             translation = node.transform.translation
-            if translation.x != 0 or translation.y != 0 or translation.z != 0:
-                node_data['translation'] = [translation.x, translation.y, translation.z]
+            translation = [translation.x, translation.y, translation.z]
+
+            if mesh_idx in dequantization and not node.child_nodes:
+                offset, scale = dequantization[mesh_idx]
+                node_data['mesh'] = mesh_idx
+                node_data['translation'] = [t + o for t, o in zip(translation, offset)]
+                node_data['scale'] = [scale, scale, scale]
+            elif mesh_idx in dequantization:
+                # The dequantization must not apply to the children, so the mesh
+                # moves to a child node of its own.
+                offset, scale = dequantization[mesh_idx]
+                quantized_nodes.append((len(nodes), {'mesh': mesh_idx, 'translation': list(offset), 'scale': [scale, scale, scale]}))
+            elif mesh_idx is not None:
+                node_data['mesh'] = mesh_idx
+
+            if 'translation' not in node_data and any(translation):
+                node_data['translation'] = translation
 
             nodes.append(node_data)
 
+        for parent_idx, node_data in quantized_nodes:
+            nodes[parent_idx]['children'] = [len(nodes)]
+            nodes.append(node_data)
+
         child_indices = []
         for node in all_nodes:
             if node.parent_node and node.parent_node in node_index_map:
@@ -126,207 +175,457 @@ class GltfExporter(Exporter):
             'scenes': [scene_data],
             'nodes': nodes,
             'meshes': meshes,
-            'buffers': buffers,
-            'bufferViews': buffer_views,
-            'accessors': accessors
+            'buffers': [],
+            'bufferViews': buffer_builder.buffer_views,
+            'accessors': buffer_builder.accessors
         }
 
         if materials:
             gltf_json['materials'] = materials
 
-        return gltf_json, binary_buffer_data
-
-    def _build_mesh_data(self, mesh, options: 'GltfSaveOptions', binary_buffer_data, buffer_views, accessors, buffers, mesh_index, mesh_to_material, material_index_map):
-        from aspose.threed.entities import VertexElementNormal, VertexElementUV, VertexElementVertexColor
-
-        primitive_data = {'attributes': {}, 'mode': 4}
-
-        positions = []
-        for cp in mesh._control_points:
-            positions.extend([cp.x, cp.y, cp.z])
+        extensions_used = []
+        if dequantization:
+            extensions_used.append('KHR_mesh_quantization')
+            gltf_json['extensionsRequired'] = ['KHR_mesh_quantization']
+        if instances:
+            extensions_used.append('EXT_mesh_gpu_instancing')
+        if extensions_used:
+            gltf_json['extensionsUsed'] = extensions_used
 
-        position_bytes = self._encode_float_array(positions)
-        position_buffer_offset = len(binary_buffer_data)
-        binary_buffer_data.extend(position_bytes)
+        return gltf_json, buffer_builder
 
-        position_buffer_view_idx = len(buffer_views)
-        buffer_views.append({
-            'buffer': 0,
-            'byteOffset': position_buffer_offset,
-            'byteLength': len(position_bytes)
-        })
+    def _group_instances(self, nodes):
+        """Groups leaf nodes sharing a parent, mesh and material.
 
-        position_accessor_idx = len(accessors)
-        accessors.append({
-            'bufferView': position_buffer_view_idx,
-            'componentType': 5126,
-            'count': len(positions) // 3,
-            'type': 'VEC3'
-        })
+        Returns the first node of each group with more than one node mapped to the group.
+        """
+        from aspose.threed.entities import Mesh
 
-        primitive_data['attributes']['POSITION'] = position_accessor_idx
+        groups = {}
+        for node in nodes:
+            if isinstance(node.entity, Mesh) and not node.child_nodes:
+                groups.setdefault((node.parent_node, node.entity, node.material), []).append(node)
+        return {group[0]: group for group in groups.values() if len(group) > 1}
+
+    def _add_instance_accessors(self, buffer_builder: '_BufferBuilder', nodes, dequantization=None):
+        """Adds the EXT_mesh_gpu_instancing accessors holding the local transforms of ``nodes``.
+
+        A quantized mesh gets its dequantization folded into each instance transform.
+        """
+        translations = array('f')
+        rotations = array('f')
+        scales = array('f')
+        for node in nodes:
+            transform = node.transform
+            t = transform.translation
+            r = transform.rotation
+            s = transform.scaling
+            tx, ty, tz = t.x, t.y, t.z
+            sx, sy, sz = s.x, s.y, s.z
+            if dequantization is not None:
+                offset, scale = dequantization
+                ox, oy, oz = self._rotate(r, sx * offset[0], sy * offset[1], sz * offset[2])
+                tx, ty, tz = tx + ox, ty + oy, tz + oz
+                sx, sy, sz = sx * scale, sy * scale, sz * scale
+            translations.extend((tx, ty, tz))
+            rotations.extend((r.x, r.y, r.z, r.w))
+            scales.extend((sx, sy, sz))
+
+        count = len(nodes)
+        attributes = {
+            'TRANSLATION': buffer_builder.add_accessor(partial(array, 'f', translations), 'f', 5126, 'VEC3', 3, count)
+        }
+        if rotations != array('f', (0.0, 0.0, 0.0, 1.0) * count):
+            attributes['ROTATION'] = buffer_builder.add_accessor(partial(array, 'f', rotations), 'f', 5126, 'VEC4', 4, count)
+        if scales != array('f', (1.0, 1.0, 1.0) * count):
+            attributes['SCALE'] = buffer_builder.add_accessor(partial(array, 'f', scales), 'f', 5126, 'VEC3', 3, count)
+        return attributes
+
+    def _rotate(self, q, x: float, y: float, z: float):
+        """Rotates a vector by the unit quaternion ``q``."""
+        ux, uy, uz, w = q.x, q.y, q.z, q.w
+        cx = uy * z - uz * y
+        cy = uz * x - ux * z
+        cz = ux * y - uy * x
+        return (x + 2.0 * (w * cx + uy * cz - uz * cy),
+                y + 2.0 * (w * cy + uz * cx - ux * cz),
+                z + 2.0 * (w * cz + ux * cy - uy * cx))
+
+    def _build_mesh_data(self, mesh, options: 'GltfSaveOptions', buffer_builder: '_BufferBuilder', mesh_index, mesh_materials, material_index_map, dequantization=None):
+        from aspose.threed.entities import VertexElementNormal, VertexElementUV, VertexElementVertexColor
 
-        normal_element = None
-        for element in mesh._vertex_elements:
-            if isinstance(element, VertexElementNormal):
-                normal_element = element
-                break
-
-        if normal_element and len(normal_element._data) > 0:
-            normals = []
-            for fv in normal_element._data:
-                normals.extend([fv.x, fv.y, fv.z])
-
-            normal_bytes = self._encode_float_array(normals)
-            normal_buffer_offset = len(binary_buffer_data)
-            binary_buffer_data.extend(normal_bytes)
-
-            normal_buffer_view_idx = len(buffer_views)
-            buffer_views.append({
-                'buffer': 0,
-                'byteOffset': normal_buffer_offset,
-                'byteLength': len(normal_bytes)
-            })
-
-            normal_accessor_idx = len(accessors)
-            accessors.append({
-                'bufferView': normal_buffer_view_idx,
-                'componentType': 5126,
-                'count': len(normals) // 3,
-                'type': 'VEC3'
-            })
-
-            primitive_data['attributes']['NORMAL'] = normal_accessor_idx
-
-        uv_element = None
-        for element in mesh._vertex_elements:
-            if isinstance(element, VertexElementUV):
-                uv_element = element
-                break
-
-        if uv_element and len(uv_element._data) > 0:
-            texcoords = []
-            for fv in uv_element._data:
-                if hasattr(options, 'flip_tex_coord_v') and not options.flip_tex_coord_v:
-                    texcoords.extend([fv.x, -fv.y])
-                else:
-                    texcoords.extend([fv.x, fv.y])
-
-            texcoord_bytes = self._encode_float_array(texcoords)
-            texcoord_buffer_offset = len(binary_buffer_data)
-            binary_buffer_data.extend(texcoord_bytes)
-
-            texcoord_buffer_view_idx = len(buffer_views)
-            buffer_views.append({
-                'buffer': 0,
-                'byteOffset': texcoord_buffer_offset,
-                'byteLength': len(texcoord_bytes)
-            })
-
-            texcoord_accessor_idx = len(accessors)
-            accessors.append({
-                'bufferView': texcoord_buffer_view_idx,
-                'componentType': 5126,
-                'count': len(texcoords) // 2,
-                'type': 'VEC2'
-            })
-
-            primitive_data['attributes']['TEXCOORD_0'] = texcoord_accessor_idx
-
-        color_element = None
-        for element in mesh._vertex_elements:
-            if isinstance(element, VertexElementVertexColor):
-                color_element = element
-                break
-
-        if color_element and len(color_element._data) > 0:
-            colors = []
-            for fv in color_element._data:
-                colors.extend([fv.x, fv.y, fv.z, fv.w])
-
-            color_bytes = self._encode_float_array(colors)
-            color_buffer_offset = len(binary_buffer_data)
-            binary_buffer_data.extend(color_bytes)
-
-            color_buffer_view_idx = len(buffer_views)
-            buffer_views.append({
-                'buffer': 0,
-                'byteOffset': color_buffer_offset,
-                'byteLength': len(color_bytes)
-            })
-
-            color_accessor_idx = len(accessors)
-            accessors.append({
-                'bufferView': color_buffer_view_idx,
-                'componentType': 5126,
-                'count': len(colors) // 4,
-                'type': 'VEC4'
-            })
-
-            primitive_data['attributes']['COLOR_0'] = color_accessor_idx
-
-        indices = []
-        for i in range(mesh.polygon_count):
-            size = mesh.get_polygon_size(i)
-            offset = 0
-            for j in range(i):
-                offset += mesh.get_polygon_size(j)
-            for j in range(size):
-                indices.append(mesh._polygons[offset + j])
-
-        if indices:
-            indices_bytes = self._encode_uint16_array(indices)
-            indices_buffer_offset = len(binary_buffer_data)
-            binary_buffer_data.extend(indices_bytes)
-
-            indices_buffer_view_idx = len(buffer_views)
-            buffer_views.append({
-                'buffer': 0,
-                'byteOffset': indices_buffer_offset,
-                'byteLength': len(indices_bytes)
-            })
-
-            indices_accessor_idx = len(accessors)
-            accessors.append({
-                'bufferView': indices_buffer_view_idx,
-                'componentType': 5123,
-                'count': len(indices),
-                'type': 'SCALAR'
-            })
-
-            primitive_data['indices'] = indices_accessor_idx
-
-        if mesh in mesh_to_material and mesh_to_material[mesh] in material_index_map:
-            material_idx = material_index_map[mesh_to_material[mesh]]
-            primitive_data['material'] = material_idx
+        quantize = options.mesh_quantization and dequantization is not None
+        optimize = options.optimize_vertex_cache
+
+        # glTF attributes hold one value per vertex, so per-polygon, per-corner
+        # and indexed elements are expanded by splitting the shared vertices.
+        elements = [self._find_element(mesh, element_type)
+                    for element_type in (VertexElementNormal, VertexElementUV, VertexElementVertexColor)]
+        elements = [element for element in elements if element is not None]
+        if any(not self._is_per_vertex(mesh, element) for element in elements):
+            from aspose.threed.entities import PolygonModifier
+            mesh = PolygonModifier._split_vertices(mesh, elements)
+
+        quantization = None
+        if quantize and len(mesh._control_points):
+            bounds = self._get_bounds(mesh._control_points, 3, mesh.packed)
+            offset = [(low + high) * 0.5 for low, high in bounds]
+            scale = max((high - low) * 0.5 for low, high in bounds) or 1.0
+            quantization = (offset, scale)
+            dequantization[mesh_index] = quantization
+
+        primitives = []
+        for material_index, polygon_ids, vertex_count in self._split_primitives(mesh, options.max_primitive_vertices):
+            if polygon_ids is None:
+                # Reordering keeps every count and bound used for the layout, so
+                # the optimized copy is only built when the buffer is written.
+                source = None
+                if optimize and len(mesh._polygon_sizes):
+                    from aspose.threed.entities import PolygonModifier
+                    source = _LazyMesh(partial(PolygonModifier.optimize_vertex_order, mesh))
+                primitive_data = self._build_primitive_data(mesh, source, options, buffer_builder, quantize, quantization)
+            else:
+                source = _LazyMesh(partial(self._extract_primitive, mesh, polygon_ids, optimize))
+                primitive_data = self._build_primitive_data(mesh, source, options, buffer_builder, quantize, quantization,
+                                                            polygon_ids, vertex_count)
+
+            if material_index < len(mesh_materials) and mesh_materials[material_index] in material_index_map:
+                primitive_data['material'] = material_index_map[mesh_materials[material_index]]
+            primitives.append(primitive_data)
 
         mesh_name = mesh.name if mesh.name else f'mesh_{mesh_index}'
         mesh_data = {
             'name': mesh_name,
-            'primitives': [primitive_data]
+            'primitives': primitives
         }
 
         return mesh_data
 
-    def _encode_float_array(self, values):
-        data = bytearray()
-        for v in values:
-            data.extend(struct.pack('<f', v))
-        return data
+    def _build_primitive_data(self, mesh, source: '_LazyMesh', options: 'GltfSaveOptions', buffer_builder: '_BufferBuilder',
+                              quantize: bool, quantization=None, polygon_ids=None, vertex_count: int = None):
+        """Lays out the accessors of one primitive.
 
-    def _encode_uint16_array(self, values):
-        data = bytearray()
-        for v in values:
-            data.extend(struct.pack('<H', v))
-        return data
+        Without ``polygon_ids`` the primitive covers the whole mesh. Otherwise it
+        covers those polygons over ``vertex_count`` vertices, which ``source``
+        produces. Only the per-vertex elements of the mesh are written.
+        """
+        from aspose.threed.entities import VertexElementNormal, VertexElementUV, VertexElementVertexColor
+
+        primitive_data = {'attributes': {}, 'mode': 4}
+        attributes = primitive_data['attributes']
 
-    def _build_materials(self, mesh_to_material, options: 'GltfSaveOptions'):
+        if polygon_ids is None:
+            vertex_count = len(mesh._control_points)
+            index_count = self._count_triangle_indices(mesh)
+            max_index = max(mesh._polygons) if index_count else 0
+
+        else:
+            sizes = mesh._polygon_sizes
+            index_count = 3 * sum(sizes[p] - 2 for p in polygon_ids if sizes[p] > 2)
+            max_index = vertex_count - 1
+
+        def find_element(element_type):
+            element = self._find_element(mesh, element_type)
+            if element is None or not self._is_per_vertex(mesh, element):
+                return None, None
+            return element, vertex_count
+
+        # Only sizes are recorded here; the arrays are produced when the buffer is written.
+        if quantization is not None:
+            offset, scale = quantization
+            if polygon_ids is None:
+                bounds = self._get_bounds(mesh._control_points, 3, mesh.packed)
+            else:
+                bounds = self._get_primitive_bounds(mesh, polygon_ids)
+            accessor_idx = buffer_builder.add_accessor(
+                self._producer(source, mesh, None, self._quantize_positions, offset, scale),
+                'h', 5122, 'VEC3', 3, vertex_count, normalized=True, element_components=4)
+            buffer_builder.accessors[accessor_idx]['min'] = [self._quantize(low, o, scale) for (low, _), o in zip(bounds, offset)]
+            buffer_builder.accessors[accessor_idx]['max'] = [self._quantize(high, o, scale) for (_, high), o in zip(bounds, offset)]
+            attributes['POSITION'] = accessor_idx
+        else:
+            attributes['POSITION'] = buffer_builder.add_accessor(
+                self._producer(source, mesh, None, self._pack_positions),
+                'f', 5126, 'VEC3', 3, vertex_count)
+
+        normal_element, count = find_element(VertexElementNormal)
+        if normal_element is not None and quantize:
+            attributes['NORMAL'] = buffer_builder.add_accessor(
+                self._producer(source, mesh, normal_element, self._quantize_normals),
+                'b', 5120, 'VEC3', 3, count, normalized=True, element_components=4)
+        elif normal_element is not None:
+            attributes['NORMAL'] = buffer_builder.add_accessor(
+                self._producer(source, mesh, normal_element, self._pack_element, 3),
+                'f', 5126, 'VEC3', 3, count)
+
+        uv_element, count = find_element(VertexElementUV)
+        if uv_element is not None:
+            flip_v = hasattr(options, 'flip_tex_coord_v') and not options.flip_tex_coord_v
+            if quantize:
+                # Decided over the whole element so every primitive of the mesh agrees.
+                (u_low, u_high), (v_low, v_high) = self._get_bounds(uv_element._data, 2, uv_element.packed)
+                if flip_v:
+                    v_low, v_high = -v_high, -v_low
+                quantize_uv = 0.0 <= min(u_low, v_low) and max(u_high, v_high) <= 1.0
+            else:
+                quantize_uv = False
+
+            if quantize_uv:
+                attributes['TEXCOORD_0'] = buffer_builder.add_accessor(
+                    self._producer(source, mesh, uv_element, self._quantize_texcoords, flip_v),
+                    'H', 5123, 'VEC2', 2, count, normalized=True)
+            else:
+                attributes['TEXCOORD_0'] = buffer_builder.add_accessor(
+                    self._producer(source, mesh, uv_element, self._pack_texcoords, flip_v),
+                    'f', 5126, 'VEC2', 2, count)
+
+        color_element, count = find_element(VertexElementVertexColor)
+        if color_element is not None:
+            attributes['COLOR_0'] = buffer_builder.add_accessor(
+                self._producer(source, mesh, color_element, self._pack_element, 4),
+                'f', 5126, 'VEC4', 4, count)
+
+        if index_count:
+            if max_index < 0xFFFF:
+                typecode, component_type = 'H', 5123
+            else:
+                typecode, component_type = 'I', 5125
+            primitive_data['indices'] = buffer_builder.add_accessor(
+                self._producer(source, mesh, None, self._pack_indices, typecode),
+                typecode, component_type, 'SCALAR', 1, index_count)
+
+        return primitive_data
+
+    def _split_primitives(self, mesh, max_vertices: int = 0):
+        """Splits the polygons of a mesh by material index and vertex count.
+
+        Returns (material index, polygon indices, vertex count) per primitive in
+        order of material index; the polygon indices are None for a single
+        primitive covering the whole mesh.
+        """
+        material_indices, default_index = self._get_polygon_materials(mesh)
+        vertex_count = len(mesh._control_points)
+        if material_indices is None and (not max_vertices or vertex_count <= max_vertices):
+            return [(default_index, None, vertex_count)]
+
+        polygon_count = len(mesh._polygon_sizes)
+        groups = {}
+        if material_indices is None:
+            groups[default_index] = range(polygon_count)
+        else:
+            for p in range(polygon_count):
+                groups.setdefault(material_indices[p], array('I')).append(p)
+            if len(groups) == 1 and (not max_vertices or vertex_count <= max_vertices):
+                return [(material_indices[0], None, vertex_count)]
+
+        polygons = mesh._polygons
+        sizes = mesh._polygon_sizes
+        offsets = mesh._get_polygon_offsets()
+
+        # Chunk number last using each vertex, so a vertex is counted once per chunk
+        last_chunk = [-1] * vertex_count
+        chunk = 0
+        result = []
+        for material_index in sorted(groups):
+            chunk_polygons = array('I')
+            chunk_vertices = 0
+            for p in groups[material_index]:
+                start = offsets[p]
+                corners = polygons[start:start + sizes[p]]
+                added = sum(1 for v in set(corners) if last_chunk[v] != chunk)
+                if max_vertices and chunk_polygons and chunk_vertices + added > max_vertices:
+                    result.append((material_index, chunk_polygons, chunk_vertices))
+                    chunk += 1
+                    chunk_polygons = array('I')
+                    chunk_vertices = 0
+                    added = len(set(corners))
+                for v in corners:
+                    last_chunk[v] = chunk
+                chunk_polygons.append(p)
+                chunk_vertices += added
+            if chunk_polygons:
+                result.append((material_index, chunk_polygons, chunk_vertices))
+                chunk += 1
+        return result
+
+    def _get_polygon_materials(self, mesh):
+        """Gets the material index of each polygon, or None with the index used by every polygon."""
+        from aspose.threed.entities import MappingMode, VertexElementType
+
+        for element in mesh._vertex_elements:
+            if element.vertex_element_type != VertexElementType.MATERIAL or not element._indices:
+                continue
+            if element.mapping_mode == MappingMode.POLYGON and len(element._indices) >= len(mesh._polygon_sizes):
+                return element._indices, 0
+            if element.mapping_mode == MappingMode.ALL_SAME:
+                return None, element._indices[0]
+        return None, 0
+
+    def _is_per_vertex(self, mesh, element) -> bool:
+        """Checks whether an element holds one value per control point, as exported primitives need."""
+        from aspose.threed.entities import MappingMode, ReferenceMode
+
+        if element.mapping_mode not in (None, MappingMode.CONTROL_POINT):
+            return False
+        if element.reference_mode in (ReferenceMode.INDEX, ReferenceMode.INDEX_TO_DIRECT):
+            return False
+        return len(element._data) == len(mesh._control_points)
+
+    def _get_primitive_bounds(self, mesh, polygon_ids):
+        """Gets the (min, max) of x, y and z over the control points used by the polygons."""
+        polygons = mesh._polygons
+        sizes = mesh._polygon_sizes
+        offsets = mesh._get_polygon_offsets()
+        used = set()
+        for p in polygon_ids:
+            start = offsets[p]
+            used.update(polygons[start:start + sizes[p]])
+
+        points = mesh._control_points
+        if mesh.packed:
+            buffer = points.buffer
+            return [(min(buffer[v * 4 + c] for v in used), max(buffer[v * 4 + c] for v in used)) for c in range(3)]
+        bounds = []
+        for name in ('x', 'y', 'z'):
+            component = [getattr(points[v], name) for v in used]
+            bounds.append((min(component), max(component)))
+        return bounds
+
+    def _extract_primitive(self, mesh, polygon_ids, optimize: bool):
+        from aspose.threed.entities import PolygonModifier
+
+        primitive_mesh = PolygonModifier._extract_polygons(mesh, polygon_ids)
+        if optimize:
+            primitive_mesh = PolygonModifier.optimize_vertex_order(primitive_mesh)
+        return primitive_mesh
+
+    def _find_element(self, mesh, element_type):
+        for element in mesh._vertex_elements:
+            if isinstance(element, element_type) and len(element._data) > 0:
+                return element
+        return None
+
+    def _producer(self, source: '_LazyMesh', mesh, element, function, *args):
+        """Gets a function producing ``function(target, *args)`` for the mesh or one of its elements.
+
+        With a lazy source, the target is looked up in the derived mesh instead.
+        """
+        if source is None:
+            return partial(function, mesh if element is None else element, *args)
+        element_index = None if element is None else mesh._vertex_elements.index(element)
+        source.acquire()
+        return partial(self._produce_from, source, element_index, function, *args)
+
+    def _produce_from(self, source: '_LazyMesh', element_index, function, *args) -> array:
+        mesh = source.get()
+        return function(mesh if element_index is None else mesh._vertex_elements[element_index], *args)
+
+    def _pack_positions(self, mesh) -> array:
+        return self._pack_components(mesh._control_points, 3, mesh.packed)
+
+    def _pack_element(self, element, components: int) -> array:
+        return self._pack_components(element._data, components, element.packed)
+
+    def _pack_components(self, values, components: int, packed: bool) -> array:
+        """Packs the first ``components`` components of each vector into a flat array('f')."""
+        if not packed:
+            getter = attrgetter(*('x', 'y', 'z', 'w')[:components])
+            return array('f', chain.from_iterable(map(getter, values)))
+
+        source = values.buffer
+        if source.typecode != 'f':
+            source = array('f', source)
+        if components == 4:
+            return array('f', source)
+        result = array('f', bytes(len(source) // 4 * components * 4))
+        for c in range(components):
+            result[c::components] = source[c::4]
+        return result
+
+    def _get_bounds(self, values, components: int, packed: bool):
+        """Gets the (min, max) of each of the first ``components`` components."""
+        if packed:
+            source = values.buffer
+            return [(min(source[c::4]), max(source[c::4])) for c in range(components)]
+        bounds = []
+        for name in ('x', 'y', 'z', 'w')[:components]:
+            component = [getattr(v, name) for v in values]
+            bounds.append((min(component), max(component)))
+        return bounds
+
+    def _quantize(self, value: float, offset: float, scale: float) -> int:
+        return round((value - offset) / scale * 32767.0)
+
+    def _quantize_positions(self, mesh, offset, scale: float) -> array:
+        """Packs positions as int16 x, y, z plus one padding value per vertex."""
+        positions = self._pack_components(mesh._control_points, 3, mesh.packed)
+        factor = 32767.0 / scale
+        result = array('h', bytes(len(positions) // 3 * 8))
+        for c in range(3):
+            o = offset[c]
+            result[c::4] = array('h', [round((v - o) * factor) for v in positions[c::3]])
+        return result
+
+    def _quantize_normals(self, element) -> array:
+        """Packs normals as int8 x, y, z plus one padding value per vertex."""
+        normals = self._pack_components(element._data, 3, element.packed)
+        result = array('b', bytes(len(normals) // 3 * 4))
+        for c in range(3):
+            result[c::4] = array('b', [max(-127, min(127, round(v * 127.0))) for v in normals[c::3]])
+        return result
+
+    def _quantize_texcoords(self, element, flip_v: bool) -> array:
+        texcoords = self._pack_texcoords(element, flip_v)
+        return array('H', [round(v * 65535.0) for v in texcoords])
+
+    def _pack_texcoords(self, element, flip_v: bool) -> array:
+        texcoords = self._pack_components(element._data, 2, element.packed)
+        if flip_v:
+            texcoords[1::2] = array('f', [-v for v in texcoords[1::2]])
+        return texcoords
+
+    def _pack_indices(self, mesh, typecode: str) -> array:
+        indices = self._triangulate_indices(mesh)
+        if indices.typecode != typecode:
+            indices = array(typecode, indices)
+        return indices
+
+    def _count_triangle_indices(self, mesh) -> int:
+        sizes = mesh._polygon_sizes
+        if sizes.count(3) == len(sizes):
+            return 3 * len(sizes)
+        return 3 * sum(size - 2 for size in sizes if size > 2)
+
+    def _triangulate_indices(self, mesh) -> array:
+        """Gets the triangle list of the mesh as an array('I'), fanning polygons with more than three corners."""
+        polygons = mesh._polygons
+        sizes = mesh._polygon_sizes
+        if sizes.count(3) == len(sizes):
+            if isinstance(polygons, array) and polygons.typecode == 'I':
+                return polygons
+            return array('I', polygons)
+
+        indices = array('I')
+        start = 0
+        for size in sizes:
+            if size == 3:
+                indices.extend(polygons[start:start + 3])
+            elif size > 3:
+                first = polygons[start]
+                for corner in range(start + 1, start + size - 1):
+                    indices.append(first)
+                    indices.append(polygons[corner])
+                    indices.append(polygons[corner + 1])
+            start += size
+        return indices
+
+    def _build_materials(self, mesh_to_materials, options: 'GltfSaveOptions'):
         from aspose.threed.shading import PbrMaterial
 
         materials = []
         material_index_map = {}
 
-        for mesh, mat in mesh_to_material.items():
+        for mat in chain.from_iterable(mesh_to_materials.values()):
             if mat and isinstance(mat, PbrMaterial):
                 if mat not in material_index_map:
                     material_idx = len(materials)
@@ -366,42 +665,99 @@ class GltfExporter(Exporter):
 
         return materials, material_index_map
 
-    def _write_ascii_gltf(self, stream, gltf_json, binary_buffer_data):
-        if binary_buffer_data:
-            uri = f"data:application/octet-stream;base64,{base64.b64encode(binary_buffer_data).decode('utf-8')}"
-            gltf_json['buffers'] = [{
-                'uri': uri,
-                'byteLength': len(binary_buffer_data)
-            }]
-        else:
-            gltf_json['buffers'] = []
+    def _write_ascii_gltf(self, stream, gltf_json, buffer_builder: '_BufferBuilder'):
+        write = self._get_text_writer(stream)
 
-        json_str = json.dumps(gltf_json, indent=2)
+        if not buffer_builder.byte_length:
+            gltf_json['buffers'] = []
+            write(json.dumps(gltf_json, indent=2))
+            return
+
+        # The data URI is streamed in place of a marker, so the base64 text of
+        # the whole buffer is never held in memory.
+        marker = uuid.uuid4().hex
+        gltf_json['buffers'] = [{
+            'uri': f"data:application/octet-stream;base64,{marker}",
+            'byteLength': buffer_builder.byte_length
+        }]
+        head, tail = json.dumps(gltf_json, indent=2).split(marker, 1)
+
+        write(head)
+        encoder = _Base64Writer(write)
+        buffer_builder.write_to(encoder.write)
+        encoder.close()
+        write(tail)
+
+    def _write_external_buffers(self, stream, gltf_json, buffer_builder: '_BufferBuilder', options: 'GltfSaveOptions'):
+        import os
+        from urllib.parse import quote
+
+        file_name = options.file_name or getattr(stream, 'name', None)
+        if not isinstance(file_name, str) or not file_name:
+            raise ValueError("file_name is required to write external glTF buffers")
+
+        directory, base_name = os.path.split(file_name)
+        stem = os.path.splitext(base_name)[0]
+        per_buffer = len(buffer_builder.buffer_lengths) > 1
 
-        if hasattr(stream, 'write'):
+        buffers = []
+        if not buffer_builder.buffer_views:
+            gltf_json['buffers'] = buffers
+            return
+
+        for index, byte_length in enumerate(buffer_builder.buffer_lengths):
+            bin_name = f"{stem}_{index}.bin" if per_buffer else f"{stem}.bin"
+            bin_path = os.path.join(directory, bin_name)
+
+            if options.file_system is not None:
+                output = options.file_system.write_file(bin_path, options)
+            else:
+                output = open(bin_path, 'wb')
             try:
-                stream.write(json_str)
-            except TypeError:
-                stream.write(json_str.encode('utf-8'))
-
-    def _write_binary_gltf(self, stream, gltf_json, binary_buffer_data):
-        json_str = json.dumps(gltf_json, separators=(',', ':'))
-        json_bytes = json_str.encode('utf-8')
-
-        if binary_buffer_data:
-            gltf_json['buffers'] = [{'byteLength': len(binary_buffer_data)}]
+                buffer_builder.write_to(output.write, index)
+            finally:
+                output.close()
+
+            buffers.append({'uri': quote(bin_name), 'byteLength': byte_length})
+
+        gltf_json['buffers'] = buffers
+
+    def _get_text_writer(self, stream):
+        """Gets a function writing text to the stream, UTF-8 encoded if the stream only accepts bytes."""
+        encode = None
+
+        def write(text: str):
+            nonlocal encode
+            if encode is None:
+                try:
+                    stream.write(text)
+                    encode = False
+                    return
+                except TypeError:
+                    encode = True
+            stream.write(text.encode('utf-8') if encode else text)
+
+        return write
+
+    def _write_binary_gltf(self, stream, gltf_json, buffer_builder: '_BufferBuilder'):
+        binary_chunk_length = buffer_builder.byte_length
+        if binary_chunk_length:
+            gltf_json['buffers'] = [{'byteLength': binary_chunk_length}]
+        else:
+            gltf_json['buffers'] = []
 
-        json_bytes = json_str.encode('utf-8')
+        json_bytes = json.dumps(gltf_json, separators=(',', ':')).encode('utf-8')
 
         json_chunk_length = len(json_bytes)
         json_chunk_padding = (4 - json_chunk_length % 4) % 4
+        json_chunk_length += json_chunk_padding
 
-        binary_chunk_length = len(binary_buffer_data)
         binary_chunk_padding = (4 - binary_chunk_length % 4) % 4
+        binary_chunk_length += binary_chunk_padding
 
-        total_length = 12 + 8 + json_chunk_length + json_chunk_padding
-        if binary_buffer_data:
-            total_length += 8 + binary_chunk_length + binary_chunk_padding
+        total_length = 12 + 8 + json_chunk_length
+        if binary_chunk_length:
+            total_length += 8 + binary_chunk_length
 
         magic = b'glTF'
         version = 2
@@ -410,9 +766,139 @@ class GltfExporter(Exporter):
 
         stream.write(struct.pack('<II', json_chunk_length, 0x4E4F534A))
         stream.write(json_bytes)
-        stream.write(b'\x00' * json_chunk_padding)
+        stream.write(b' ' * json_chunk_padding)
 
-        if binary_buffer_data:
+        if binary_chunk_length:
             stream.write(struct.pack('<II', binary_chunk_length, 0x004E4942))
-            stream.write(binary_buffer_data)
+            buffer_builder.write_to(stream.write)
             stream.write(b'\x00' * binary_chunk_padding)
+
+
+class _BufferBuilder:
+    """Lays out attribute arrays in one binary buffer with 4-byte aligned views.
+
+    Each view is registered with its size and a function producing its array,
+    so offsets and the JSON document are known before any data exists.
+    write_to() then produces and writes the views one at a time.
+    """
+
+    def __init__(self):
+        self.buffer_lengths = [0]
+        self.buffer_views = []
+        self.accessors = []
+        self._parts = [[]]
+
+    @property
+    def byte_length(self) -> int:
+        """Gets the byte length of the first buffer."""
+        return self.buffer_lengths[0]
+
+    def start_buffer(self):
+        """Places the following views in a new buffer, unless the current one is still empty."""
+        if self._parts[-1]:
+            self.buffer_lengths.append(0)
+            self._parts.append([])
+
+    def add_view(self, producer, byte_length: int) -> int:
+        buffer_index = len(self.buffer_lengths) - 1
+        offset = (self.buffer_lengths[buffer_index] + 3) & ~3
+        self.buffer_lengths[buffer_index] = offset + byte_length
+        self._parts[buffer_index].append((offset, byte_length, producer))
+
+        self.buffer_views.append({
+            'buffer': buffer_index,
+            'byteOffset': offset,
+            'byteLength': byte_length
+        })
+        return len(self.buffer_views) - 1
+
+    def add_accessor(self, producer, typecode: str, component_type: int, accessor_type: str, components: int, count: int,
+                     normalized: bool = False, element_components: int = None) -> int:
+        """Adds an accessor over a new view.
+
+        ``element_components`` is the number of values per element in the
+        produced array when elements are padded, which sets the view's byteStride.
+        """
+        item_size = array(typecode).itemsize
+        element_components = element_components or components
+        view_idx = self.add_view(producer, count * element_components * item_size)
+        if element_components != components:
+            self.buffer_views[view_idx]['byteStride'] = element_components * item_size
+
+        accessor = {
+            'bufferView': view_idx,
+            'componentType': component_type,
+            'count': count,
+            'type': accessor_type
+        }
+        if normalized:
+            accessor['normalized'] = True
+        self.accessors.append(accessor)
+        return len(self.accessors) - 1
+
+    def write_to(self, write, buffer_index: int = 0):
+        """Produces each view of a buffer and passes its bytes, with alignment padding, to ``write``."""
+        position = 0
+        for offset, byte_length, producer in self._parts[buffer_index]:
+            if offset > position:
+                write(bytes(offset - position))
+
+            values = producer()
+            if sys.byteorder == 'big':
+                values = array(values.typecode, values)
+                values.byteswap()
+
+            data = memoryview(values).cast('B')
+            if len(data) != byte_length:
+                raise RuntimeError("Mesh data changed while the glTF buffer was being written")
+            write(data)
+            position = offset + byte_length
+
+    def getvalue(self, buffer_index: int = 0) -> bytes:
+        output = io.BytesIO()
+        self.write_to(output.write, buffer_index)
+        return output.getvalue()
+
+
+class _LazyMesh:
+    """Creates a derived mesh on first use and drops it after its last acquired use."""
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._mesh = None
+        self._uses = 0
+
+    def acquire(self):
+        self._uses += 1
+
+    def get(self):
+        mesh = self._mesh
+        if mesh is None:
+            mesh = self._mesh = self._factory()
+        self._uses -= 1
+        if self._uses <= 0:
+            self._mesh = None
+        return mesh
+
+
+class _Base64Writer:
+    """Base64-encodes written bytes incrementally, passing the text to ``write``."""
+
+    def __init__(self, write):
+        self._write = write
+        self._pending = b''
+
+    def write(self, data):
+        if self._pending:
+            data = memoryview(self._pending + bytes(data))
+        else:
+            data = memoryview(data).cast('B')
+        end = len(data) - len(data) % 3
+        self._pending = bytes(data[end:])
+        if end:
+            self._write(base64.b64encode(data[:end]).decode('ascii'))
+
+    def close(self):
+        if self._pending:
+            self._write(base64.b64encode(self._pending).decode('ascii'))
+            self._pending = b''
@@ -1,7 +1,9 @@
 from typing import TYPE_CHECKING
+from array import array
 import json
 import struct
 import io
+import sys
 
 from ..Importer import Importer
 
@@ -10,6 +12,19 @@ if TYPE_CHECKING:
     from .GltfLoadOptions import GltfLoadOptions
 
 
+# componentType -> (array typecode, byte size, divisor for normalized values)
+_COMPONENT_TYPES = {
+    5120: ('b', 1, 127.0),
+    5121: ('B', 1, 255.0),
+    5122: ('h', 2, 32767.0),
+    5123: ('H', 2, 65535.0),
+    5125: ('I', 4, 4294967295.0),
+    5126: ('f', 4, None),
+}
+
+_TYPE_COMPONENTS = {'SCALAR': 1, 'VEC2': 2, 'VEC3': 3, 'VEC4': 4, 'MAT2': 4, 'MAT3': 9, 'MAT4': 16}
+
+
 class GltfImporter(Importer):
     def __init__(self):
         super().__init__()
@@ -22,12 +37,11 @@ class GltfImporter(Importer):
         from .GltfLoadOptions import GltfLoadOptions
         from aspose.threed import Node
         from aspose.threed.entities import Mesh
-        from aspose.threed.utilities import Vector4
 
         if not isinstance(options, GltfLoadOptions):
             options = GltfLoadOptions()
 
-        content = self._read_stream(stream)
+        content = self._read_bytes(stream)
         if len(content) == 0:
             return
 
@@ -36,22 +50,12 @@ class GltfImporter(Importer):
         if is_binary:
             gltf_json, binary_data = self._parse_binary_gltf(content)
         else:
-            gltf_json = json.loads(content.decode('utf-8'))
+            gltf_json = json.loads(str(content, 'utf-8'))
             binary_data = b''
 
         base_path = self._get_base_path(stream, options)
         self._build_scene(scene, gltf_json, binary_data, options, base_path)
 
-    def _read_stream(self, stream) -> bytes:
-        if hasattr(stream, 'read'):
-            if hasattr(stream, 'seek'):
-                stream.seek(0)
-            data = stream.read()
-            if isinstance(data, str):
-                return data.encode('utf-8', errors='ignore')
-            return data
-        raise TypeError("Stream must support read() method")
-
     def _is_binary_gltf(self, content: bytes) -> bool:
         if len(content) < 12:
             return False
@@ -59,7 +63,8 @@ class GltfImporter(Importer):
         return magic == b'glTF'
 
     def _parse_binary_gltf(self, content: bytes):
-        magic, version, length = struct.unpack('<4sII', content[:12])
+        content = memoryview(content)
+        magic, version, length = struct.unpack_from('<4sII', content)
 
         if magic != b'glTF':
             raise ValueError("Invalid glTF binary file magic")
@@ -75,7 +80,7 @@ class GltfImporter(Importer):
             if chunk_offset + 8 > len(content):
                 break
 
-            chunk_length, chunk_type = struct.unpack('<II', content[chunk_offset:chunk_offset + 8])
+            chunk_length, chunk_type = struct.unpack_from('<II', content, chunk_offset)
 
             chunk_data = content[chunk_offset + 8:chunk_offset + 8 + chunk_length]
 
@@ -89,7 +94,7 @@ class GltfImporter(Importer):
         if json_chunk is None:
             raise ValueError("Missing JSON chunk in glTF binary file")
 
-        gltf_json = json.loads(json_chunk.decode('utf-8'))
+        gltf_json = json.loads(str(json_chunk, 'utf-8'))
         return gltf_json, binary_chunk if binary_chunk else b''
 
     def _get_base_path(self, stream, options):
@@ -101,11 +106,17 @@ class GltfImporter(Importer):
         return ''
 
     def _build_scene(self, scene, gltf_json, binary_data, options, base_path=''):
+        buffers = self._load_buffers(gltf_json, binary_data, base_path, getattr(options, 'lazy_buffers', False))
+        try:
+            self._build_scene_objects(scene, gltf_json, buffers, options)
+        finally:
+            if isinstance(buffers, _LazyBuffers):
+                buffers.close()
+
+    def _build_scene_objects(self, scene, gltf_json, buffers, options):
         from aspose.threed import Node
-        from aspose.threed.entities import Mesh
-        from aspose.threed.utilities import Vector4
+        from aspose.threed.entities import Mesh, VertexElementMaterial, MappingMode, ReferenceMode
 
-        buffers = self._load_buffers(gltf_json, binary_data, base_path)
         buffer_views = gltf_json.get('bufferViews', [])
         accessors = gltf_json.get('accessors', [])
         meshes = gltf_json.get('meshes', [])
@@ -115,12 +126,29 @@ class GltfImporter(Importer):
         mesh_objects = {}
         material_objects = self._load_materials(materials)
 
+        # Decoded accessors by index, so accessors shared by several meshes are
+        # decoded once. Nodes referencing the same mesh share its Mesh entity.
+        accessor_cache = {}
+
         for mesh_idx, mesh_data in enumerate(meshes):
+            primitives = mesh_data.get('primitives', [])
             mesh_name = mesh_data.get('name', f'mesh_{mesh_idx}')
-            mesh = Mesh(mesh_name)
-
-            for primitive in mesh_data.get('primitives', []):
-                self._build_primitive(mesh, primitive, accessors, buffer_views, buffers, options, material_objects)
+            mesh = Mesh(mesh_name, packed=options.packed_storage)
+
+            material_order = self._get_primitive_materials(primitives, len(material_objects))
+            polygon_materials = []
+            for primitive in primitives:
+                polygon_count = len(mesh._polygon_sizes)
+                self._build_primitive(mesh, primitive, accessors, buffer_views, buffers, options, material_objects, accessor_cache)
+                if len(material_order) > 1:
+                    material_index = material_order.index(primitive['material'])
+                    polygon_materials.extend([material_index] * (len(mesh._polygon_sizes) - polygon_count))
+            self._finish_vertex_elements(mesh)
+
+            if polygon_materials:
+                element = VertexElementMaterial("", MappingMode.POLYGON, ReferenceMode.INDEX)
+                element.set_indices(polygon_materials)
+                mesh.add_element(element)
 
             mesh_objects[mesh_idx] = mesh
 
@@ -133,29 +161,20 @@ class GltfImporter(Importer):
             if 'mesh' in node_data:
                 mesh_idx = node_data['mesh']
                 if mesh_idx in mesh_objects:
-                    node.entity = mesh_objects[mesh_idx]
                     mesh_data = gltf_json['meshes'][mesh_idx]
                     primitives = mesh_data.get('primitives', [])
-                    if primitives:
-                        material_idx = primitives[0].get('material')
-                        if material_idx is not None and material_idx < len(material_objects):
-                            node.material = material_objects[material_idx]
-
-            if 'translation' in node_data:
-                translation = node_data['translation']
-                node.transform.translation = Vector4(translation[0], translation[1], translation[2], 1)
-
-            if 'rotation' in node_data:
-                rotation = node_data['rotation']
-                quaternion = node.transform.euler
-                quaternion.x = rotation[0]
-                quaternion.y = rotation[1]
-                quaternion.z = rotation[2]
-                quaternion.w = rotation[3]
-
-            if 'scale' in node_data:
-                scale = node_data['scale']
-                node.transform.scale = Vector4(scale[0], scale[1], scale[2], 1)
+                    node_materials = [material_objects[i] for i in self._get_primitive_materials(primitives, len(material_objects))]
+
+                    instancing = node_data.get('extensions', {}).get('EXT_mesh_gpu_instancing')
+                    if instancing is not None:
+                        attributes = {name: self._get_accessor(idx, accessors, buffer_views, buffers, accessor_cache)[0]
+                                      for name, idx in instancing.get('attributes', {}).items()}
+                        self._expand_instances(node, mesh_objects[mesh_idx], node_materials, attributes)
+                    else:
+                        node.entity = mesh_objects[mesh_idx]
+                        node._materials.extend(node_materials)
+
+            self._set_transform(node.transform, node_data.get('translation'), node_data.get('rotation'), node_data.get('scale'))
 
             node_objects[node_idx] = node
 
@@ -176,9 +195,67 @@ class GltfImporter(Importer):
                 if node_idx in node_objects:
                     node_objects[node_idx].parent_node = scene.root_node
 
-    def _build_primitive(self, mesh, primitive, accessors, buffer_views, buffers, options, materials):
-        from aspose.threed.utilities import Vector4
+    def _set_transform(self, transform, translation=None, rotation=None, scale=None):
+        from aspose.threed.utilities import Vector3, Quaternion
+
+        if translation is not None:
+            transform.translation = Vector3(translation[0], translation[1], translation[2])
+        if rotation is not None:
+            transform.rotation = Quaternion(rotation[3], rotation[0], rotation[1], rotation[2])
+        if scale is not None:
+            transform.scaling = Vector3(scale[0], scale[1], scale[2])
+
+    def _get_primitive_materials(self, primitives, material_count: int):
+        """Gets the material indices used by the primitives in order of first use.
+
+        When a primitive has no valid material only the first primitive's material
+        is used, as the mesh then cannot map every polygon to a node material.
+        """
+        order = []
+        for primitive in primitives:
+            material_idx = primitive.get('material')
+            if material_idx is None or material_idx >= material_count:
+                break
+            if material_idx not in order:
+                order.append(material_idx)
+        else:
+            return order
+
+        material_idx = primitives[0].get('material')
+        if material_idx is not None and material_idx < material_count:
+            return [material_idx]
+        return []
+
+    def _expand_instances(self, node, mesh, materials, attributes):
+        """Adds a child node sharing ``mesh`` for each EXT_mesh_gpu_instancing instance.
+
+        ``attributes`` maps TRANSLATION, ROTATION and SCALE to their decoded values.
+        """
+        from aspose.threed import Node
 
+        translations = attributes.get('TRANSLATION')
+        rotations = attributes.get('ROTATION')
+        scales = attributes.get('SCALE')
+        if translations is not None:
+            count = len(translations) // 3
+        elif rotations is not None:
+            count = len(rotations) // 4
+        elif scales is not None:
+            count = len(scales) // 3
+        else:
+            return
+
+        for i in range(count):
+            instance = Node(f'{node.name}_{i}')
+            instance.entity = mesh
+            instance._materials.extend(materials)
+            self._set_transform(instance.transform,
+                                None if translations is None else translations[i * 3:i * 3 + 3],
+                                None if rotations is None else rotations[i * 4:i * 4 + 4],
+                                None if scales is None else scales[i * 3:i * 3 + 3])
+            instance.parent_node = node
+
+    def _build_primitive(self, mesh, primitive, accessors, buffer_views, buffers, options, materials, accessor_cache=None):
         attributes = primitive.get('attributes', {})
         indices_accessor_idx = primitive.get('indices')
         mode = primitive.get('mode', 4)
@@ -186,6 +263,12 @@ class GltfImporter(Importer):
         if mode != 4:
             return
 
+        if accessor_cache is None:
+            accessor_cache = {}
+
+        def read(accessor_idx):
+            return self._get_accessor(accessor_idx, accessors, buffer_views, buffers, accessor_cache)
+
         position_accessor_idx = attributes.get('POSITION')
         normal_accessor_idx = attributes.get('NORMAL')
         tangent_accessor_idx = attributes.get('TANGENT')
@@ -195,101 +278,171 @@ class GltfImporter(Importer):
         if position_accessor_idx is None:
             return
 
-        position_accessor = accessors[position_accessor_idx]
-        positions = self._read_accessor_data(position_accessor, buffer_views, buffers, 'VEC3')
+        positions, components = read(position_accessor_idx)
+        if components != 3:
+            return
 
-        vertex_count = len(positions)
+        vertex_count = len(positions) // 3
         base_vertex_index = len(mesh._control_points)
 
-        for position in positions:
-            mesh._control_points.append(Vector4(position[0], position[1], position[2], 1))
+        mesh._extend_control_points(positions, 3)
 
         if normal_accessor_idx is not None:
-            self._add_normals_to_mesh(mesh, accessors[normal_accessor_idx], buffer_views, buffers, vertex_count, base_vertex_index)
+            self._add_normals_to_mesh(mesh, *read(normal_accessor_idx), vertex_count)
 
         if tangent_accessor_idx is not None:
-            self._add_tangents_to_mesh(mesh, accessors[tangent_accessor_idx], buffer_views, buffers, vertex_count, base_vertex_index)
+            self._add_tangents_to_mesh(mesh, *read(tangent_accessor_idx), vertex_count)
 
         if texcoord_accessor_idx is not None:
-            self._add_uvs_to_mesh(mesh, accessors[texcoord_accessor_idx], buffer_views, buffers, vertex_count, base_vertex_index, options)
+            self._add_uvs_to_mesh(mesh, *read(texcoord_accessor_idx), vertex_count, options)
 
         if color_accessor_idx is not None:
-            self._add_colors_to_mesh(mesh, accessors[color_accessor_idx], buffer_views, buffers, vertex_count, base_vertex_index)
+            self._add_colors_to_mesh(mesh, *read(color_accessor_idx), vertex_count)
 
         if indices_accessor_idx is not None:
-            indices_accessor = accessors[indices_accessor_idx]
-            indices = self._read_accessor_data(indices_accessor, buffer_views, buffers, 'SCALAR')
-
-            if indices_accessor.get('componentType') == 5123:
-                for i in range(0, len(indices), 3):
-                    mesh.create_polygon(base_vertex_index + indices[i],
-                                       base_vertex_index + indices[i + 1],
-                                       base_vertex_index + indices[i + 2])
-            else:
-                for i in range(0, len(indices), 3):
-                    mesh.create_polygon(base_vertex_index + int(indices[i]),
-                                       base_vertex_index + int(indices[i + 1]),
-                                       base_vertex_index + int(indices[i + 2]))
+            indices, _ = read(indices_accessor_idx)
+            if base_vertex_index:
+                indices = array('I', [base_vertex_index + i for i in indices])
+            elif indices.typecode != 'I':
+                indices = array('I', indices)
         else:
-            for i in range(0, vertex_count, 3):
-                mesh.create_polygon(base_vertex_index + i,
-                                   base_vertex_index + i + 1,
-                                   base_vertex_index + i + 2)
+            indices = array('I', range(base_vertex_index, base_vertex_index + vertex_count))
 
-    def _load_buffers(self, gltf_json, binary_data, base_path=''):
-        import os
-        buffers = gltf_json.get('buffers', [])
-        loaded_buffers = []
+        mesh._extend_polygons(indices, 3)
 
-        for buffer in buffers:
-            uri = buffer.get('uri')
-            byte_length = buffer.get('byteLength', 0)
+    def _load_buffers(self, gltf_json, binary_data, base_path='', lazy=False):
+        buffers = gltf_json.get('buffers', [])
+        if lazy:
+            return _LazyBuffers(self, buffers, binary_data, base_path)
+        return [self._load_buffer(buffer, binary_data, base_path) for buffer in buffers]
 
-            if uri is None:
-                loaded_buffers.append(binary_data)
-            elif uri.startswith('data:'):
-                loaded_buffers.append(self._decode_data_uri(uri))
-            else:
-                buffer_path = uri
-                if base_path:
-                    buffer_path = os.path.join(base_path, uri)
-                try:
-                    with open(buffer_path, 'rb') as f:
-                        buffer_data = f.read()
-                    loaded_buffers.append(buffer_data)
-                except (IOError, FileNotFoundError):
-                    loaded_buffers.append(b'')
-
-        return loaded_buffers
+    def _load_buffer(self, buffer, binary_data, base_path='', use_mmap=False):
+        import os
+        from urllib.parse import unquote
+
+        uri = buffer.get('uri')
+
+        if uri is None:
+            return binary_data
+        if uri.startswith('data:'):
+            return self._decode_data_uri(uri)
+
+        buffer_path = unquote(uri)
+        if base_path:
+            buffer_path = os.path.join(base_path, buffer_path)
+        try:
+            with open(buffer_path, 'rb') as f:
+                if use_mmap and os.fstat(f.fileno()).st_size > 0:
+                    import mmap
+                    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                return f.read()
+        except OSError as e:
+            raise IOError(f"Cannot read glTF buffer '{uri}': {e.strerror or e}") from e
 
     def _decode_data_uri(self, uri):
         import base64
         header, data = uri.split(',', 1)
         return base64.b64decode(data)
 
-    def _read_accessor_data(self, accessor, buffer_views, buffers, expected_type):
-        buffer_view_idx = accessor.get('bufferView')
-        byte_offset = accessor.get('byteOffset', 0)
+    def _get_accessor(self, accessor_idx, accessors, buffer_views, buffers, accessor_cache):
+        """Gets a decoded accessor, decoding it on first use.
+
+        Cached arrays are shared between primitives and must not be modified.
+        """
+        decoded = accessor_cache.get(accessor_idx)
+        if decoded is None:
+            decoded = accessor_cache[accessor_idx] = self._read_accessor(accessors[accessor_idx], buffer_views, buffers)
+        return decoded
+
+    def _read_accessor(self, accessor, buffer_views, buffers):
+        """Decodes an accessor into a flat array of component values.
+
+        Returns the array together with the number of components per element.
+        Interleaved views are gathered with strided copies, sparse substitutions
+        are applied and normalized integer components are converted to floats.
+        """
+        component_type = _COMPONENT_TYPES.get(accessor.get('componentType'))
+        components = _TYPE_COMPONENTS.get(accessor.get('type'))
+        if component_type is None or components is None:
+            return array('f'), 1
+
+        typecode, size, divisor = component_type
         count = accessor.get('count', 0)
-        accessor_type = accessor.get('type')
+        buffer_view_idx = accessor.get('bufferView')
 
-        if buffer_view_idx is None or buffer_view_idx >= len(buffer_views):
-            return []
+        if buffer_view_idx is None:
+            values = array(typecode, bytes(count * components * size))
+        else:
+            values = self._read_view(buffer_views, buffers, buffer_view_idx, accessor.get('byteOffset', 0),
+                                     count, components * size, typecode)
+
+        sparse = accessor.get('sparse')
+        if sparse:
+            self._apply_sparse(values, sparse, components, component_type, buffer_views, buffers)
+
+        if divisor is not None and accessor.get('normalized'):
+            scale = 1.0 / divisor
+            if typecode in 'bh':
+                values = array('f', [max(v * scale, -1.0) for v in values])
+            else:
+                values = array('f', [v * scale for v in values])
+
+        return values, components
+
+    def _read_view(self, buffer_views, buffers, buffer_view_idx, byte_offset, count, element_size, typecode):
+        """Reads ``count`` elements of ``element_size`` bytes from a buffer view into an array."""
+        values = array(typecode)
+        if buffer_view_idx >= len(buffer_views):
+            return values
 
         buffer_view = buffer_views[buffer_view_idx]
         buffer_idx = buffer_view.get('buffer', 0)
-        view_byte_offset = buffer_view.get('byteOffset', 0)
-        view_byte_length = buffer_view.get('byteLength', 0)
-
         if buffer_idx >= len(buffers):
-            return []
+            return values
 
-        buffer = buffers[buffer_idx]
-        data_start = view_byte_offset + byte_offset
-        data_end = data_start + view_byte_length
-        data = buffer[data_start:data_end]
+        data = memoryview(buffers[buffer_idx]).cast('B')
+        start = buffer_view.get('byteOffset', 0) + byte_offset
+        end = min(buffer_view.get('byteOffset', 0) + buffer_view.get('byteLength', 0), len(data))
+        stride = buffer_view.get('byteStride') or element_size
 
-        return self._decode_buffer(data, accessor.get('componentType'), accessor_type, count)
+        if end - start < element_size:
+            return values
+        count = min(count, (end - start - element_size) // stride + 1)
+
+        if stride == element_size:
+            values.frombytes(data[start:start + count * element_size])
+        else:
+            packed = bytearray(count * element_size)
+            last = start + (count - 1) * stride + 1
+            for lane in range(element_size):
+                packed[lane::element_size] = data[start + lane:last + lane:stride]
+            values.frombytes(packed)
+
+        if sys.byteorder == 'big':
+            values.byteswap()
+        return values
+
+    def _apply_sparse(self, values, sparse, components, component_type, buffer_views, buffers):
+        count = sparse.get('count', 0)
+        indices_info = sparse.get('indices', {})
+        values_info = sparse.get('values', {})
+
+        index_type = _COMPONENT_TYPES.get(indices_info.get('componentType'))
+        if index_type is None or 'bufferView' not in indices_info or 'bufferView' not in values_info:
+            return
+
+        index_typecode, index_size, _ = index_type
+        typecode, size, _ = component_type
+        indices = self._read_view(buffer_views, buffers, indices_info['bufferView'], indices_info.get('byteOffset', 0),
+                                  count, index_size, index_typecode)
+        substitutes = self._read_view(buffer_views, buffers, values_info['bufferView'], values_info.get('byteOffset', 0),
+                                      count, components * size, typecode)
+
+        total = len(values)
+        for i, index in enumerate(indices[:len(substitutes) // components]):
+            offset = index * components
+            if offset + components <= total:
+                values[offset:offset + components] = substitutes[i * components:(i + 1) * components]
 
     def _load_materials(self, materials):
         from aspose.threed.shading import PbrMaterial
@@ -326,115 +479,93 @@ class GltfImporter(Importer):
 
         return material_objects
 
-    def _decode_buffer(self, data, component_type, accessor_type, count):
-        components_per_value = 1
-        if accessor_type == 'VEC2':
-            components_per_value = 2
-        elif accessor_type == 'VEC3':
-            components_per_value = 3
-        elif accessor_type == 'VEC4':
-            components_per_value = 4
-
-        total_components = count * components_per_value
-
-        if component_type == 5120:
-            fmt = '<{}b'.format(total_components)
-            values = struct.unpack(fmt, data[:total_components])
-        elif component_type == 5121:
-            fmt = '<{}B'.format(total_components)
-            values = struct.unpack(fmt, data[:total_components])
-        elif component_type == 5122:
-            fmt = '<{}h'.format(total_components)
-            values = struct.unpack(fmt, data[:total_components * 2])
-        elif component_type == 5123:
-            fmt = '<{}H'.format(total_components)
-            values = struct.unpack(fmt, data[:total_components * 2])
-        elif component_type == 5125:
-            fmt = '<{}i'.format(total_components)
-            values = struct.unpack(fmt, data[:total_components * 4])
-        elif component_type == 5126:
-            fmt = '<{}f'.format(total_components)
-            values = struct.unpack(fmt, data[:total_components * 4])
-        else:
-            return []
-
-        if accessor_type == 'SCALAR':
-            return list(values)
-        elif accessor_type == 'VEC2':
-            return [(values[i], values[i + 1]) for i in range(0, len(values), 2)]
-        elif accessor_type == 'VEC3':
-            return [(values[i], values[i + 1], values[i + 2]) for i in range(0, len(values), 3)]
-        elif accessor_type == 'VEC4':
-            return [(values[i], values[i + 1], values[i + 2], values[i + 3]) for i in range(0, len(values), 4)]
-        else:
-            return []
-
-    def _add_normals_to_mesh(self, mesh, accessor, buffer_views, buffers, vertex_count, base_vertex_index):
-        from aspose.threed.entities import VertexElementNormal
-        from aspose.threed.utilities.FVector4 import FVector4
+    def _add_vertex_element(self, mesh, element, values, components, vertex_count, w=0.0):
+        """Appends the values of the primitive just added to the mesh's element of the same type.
 
-        normals = self._read_accessor_data(accessor, buffer_views, buffers, 'VEC3')
+        The primitives of a mesh share one element per type so that it holds one
+        value per control point; vertices of primitives without the attribute
+        are filled with zeros.
+        """
+        from aspose.threed.utilities.PackedFVector4List import PackedFVector4List
 
-        if len(normals) < vertex_count:
+        if components > 4 or len(values) < vertex_count * components:
             return
 
-        normal_element = VertexElementNormal()
-        for i in range(vertex_count):
-            normal = normals[i]
-            normal_element._data.append(FVector4(normal[0], normal[1], normal[2], 0))
+        for existing in mesh._vertex_elements:
+            if type(existing) is type(element):
+                element = existing
+                break
+        else:
+            element._data = PackedFVector4List()
+            mesh._vertex_elements.append(element)
+
+        self._pad_vertex_element(element, len(mesh._control_points) - vertex_count)
+        element._data.extend_components(values[:vertex_count * components], components, w)
+
+    def _pad_vertex_element(self, element, count: int):
+        missing = count - len(element._data)
+        if missing > 0:
+            element._data.extend_components(array('f', bytes(16 * missing)), 4)
+
+    def _finish_vertex_elements(self, mesh):
+        """Pads the elements of a built mesh to its control points, unpacking them for unpacked meshes."""
+        vertex_count = len(mesh._control_points)
+        for element in mesh._vertex_elements:
+            self._pad_vertex_element(element, vertex_count)
+            if not mesh.packed:
+                element._data = list(element._data)
+
+    def _add_normals_to_mesh(self, mesh, normals, components, vertex_count):
+        from aspose.threed.entities import VertexElementNormal
 
-        mesh._vertex_elements.append(normal_element)
+        self._add_vertex_element(mesh, VertexElementNormal(), normals, components, vertex_count)
 
-    def _add_tangents_to_mesh(self, mesh, accessor, buffer_views, buffers, vertex_count, base_vertex_index):
+    def _add_tangents_to_mesh(self, mesh, tangents, components, vertex_count):
         from aspose.threed.entities import VertexElementTangent
-        from aspose.threed.utilities.FVector4 import FVector4
-
-        tangents = self._read_accessor_data(accessor, buffer_views, buffers, 'VEC3')
 
-        if len(tangents) < vertex_count:
-            return
+        self._add_vertex_element(mesh, VertexElementTangent(), tangents, components, vertex_count)
 
-        tangent_element = VertexElementTangent()
-        for i in range(vertex_count):
-            tangent = tangents[i]
-            tangent_element._data.append(FVector4(tangent[0], tangent[1], tangent[2], 0))
+    def _add_uvs_to_mesh(self, mesh, uvs, components, vertex_count, options):
+        from aspose.threed.entities import VertexElementUV
 
-        mesh._vertex_elements.append(tangent_element)
+        if not options.flip_tex_coord_v and components > 1:
+            uvs = array('f', uvs)
+            uvs[1::components] = array('f', [-v for v in uvs[1::components]])
+        self._add_vertex_element(mesh, VertexElementUV(), uvs, components, vertex_count)
 
-    def _add_uvs_to_mesh(self, mesh, accessor, buffer_views, buffers, vertex_count, base_vertex_index, options):
-        from aspose.threed.entities import VertexElementUV
-        from aspose.threed.utilities.FVector4 import FVector4
+    def _add_colors_to_mesh(self, mesh, colors, components, vertex_count):
+        from aspose.threed.entities import VertexElementVertexColor
 
-        uvs = self._read_accessor_data(accessor, buffer_views, buffers, 'VEC2')
+        self._add_vertex_element(mesh, VertexElementVertexColor(), colors, components, vertex_count, 1.0)
 
-        if len(uvs) < vertex_count:
-            return
 
-        uv_element = VertexElementUV()
-        for i in range(vertex_count):
-            uv = uvs[i]
-            v = uv[1] if options.flip_tex_coord_v else -uv[1]
-            uv_element._data.append(FVector4(uv[0], v, 0.0, 0.0))
+class _LazyBuffers:
+    """Sequence of glTF buffers that loads each buffer on first access.
 
-        mesh._vertex_elements.append(uv_element)
+    External files are memory-mapped; the mappings are closed by close().
+    """
 
-    def _add_colors_to_mesh(self, mesh, accessor, buffer_views, buffers, vertex_count, base_vertex_index):
-        from aspose.threed.entities import VertexElementVertexColor
-        from aspose.threed.utilities.FVector4 import FVector4
+    def __init__(self, importer: GltfImporter, buffers, binary_data, base_path: str):
+        self._importer = importer
+        self._buffers = buffers
+        self._binary_data = binary_data
+        self._base_path = base_path
+        self._loaded = {}
 
-        colors = self._read_accessor_data(accessor, buffer_views, buffers, 'VEC3')
-        if len(colors) < vertex_count:
-            colors = self._read_accessor_data(accessor, buffer_views, buffers, 'VEC4')
+    def __len__(self):
+        return len(self._buffers)
 
-        if len(colors) < vertex_count:
-            return
+    def __getitem__(self, index: int):
+        data = self._loaded.get(index)
+        if data is None:
+            data = self._importer._load_buffer(self._buffers[index], self._binary_data, self._base_path, True)
+            self._loaded[index] = data
+        return data
 
-        color_element = VertexElementVertexColor()
-        for i in range(vertex_count):
-            color = colors[i]
-            if len(color) == 3:
-                color_element._data.append(FVector4(color[0], color[1], color[2], 1.0))
-            else:
-                color_element._data.append(FVector4(color[0], color[1], color[2], color[3]))
+    def close(self):
+        import mmap
 
-        mesh._vertex_elements.append(color_element)
+        for data in self._loaded.values():
+            if isinstance(data, mmap.mmap):
+                data.close()
+        self._loaded.clear()
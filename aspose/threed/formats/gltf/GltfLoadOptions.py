@@ -10,6 +10,7 @@ class GltfLoadOptions(LoadOptions):
     def __init__(self):
         super().__init__()
         self._flip_tex_coord_v = True
+        self._lazy_buffers = False
 
     @property
     def flip_tex_coord_v(self) -> bool:
@@ -18,3 +19,17 @@ class GltfLoadOptions(LoadOptions):
     @flip_tex_coord_v.setter
     def flip_tex_coord_v(self, value: bool):
         self._flip_tex_coord_v = bool(value)
+
+    @property
+    def lazy_buffers(self) -> bool:
+        """Gets whether buffers are loaded on first use.
+
+        External buffer files are memory-mapped and data URIs are decoded only
+        when an accessor reads from them, so buffers holding data the importer
+        does not use, such as images, are never read.
+        """
+        return self._lazy_buffers
+
+    @lazy_buffers.setter
+    def lazy_buffers(self, value: bool):
+        self._lazy_buffers = bool(value)
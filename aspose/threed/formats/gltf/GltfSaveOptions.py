@@ -13,6 +13,12 @@ class GltfSaveOptions(SaveOptions):
             self._file_format = file_format
         self._binary_mode = False
         self._flip_tex_coord_v = True
+        self._external_buffers = False
+        self._buffer_per_mesh = False
+        self._mesh_quantization = False
+        self._optimize_vertex_cache = False
+        self._mesh_instancing = False
+        self._max_primitive_vertices = 0
 
     @property
     def file_format(self) -> 'FileFormat':
@@ -33,3 +39,76 @@ class GltfSaveOptions(SaveOptions):
     @flip_tex_coord_v.setter
     def flip_tex_coord_v(self, value: bool):
         self._flip_tex_coord_v = bool(value)
+
+    @property
+    def external_buffers(self) -> bool:
+        """Gets whether geometry of a .gltf file is written to sidecar .bin files.
+
+        The files are named after file_name and written next to it; binary
+        (GLB) output always embeds its buffer.
+        """
+        return self._external_buffers
+
+    @external_buffers.setter
+    def external_buffers(self, value: bool):
+        self._external_buffers = bool(value)
+
+    @property
+    def buffer_per_mesh(self) -> bool:
+        """Gets whether each mesh gets its own .bin file when external_buffers is set."""
+        return self._buffer_per_mesh
+
+    @buffer_per_mesh.setter
+    def buffer_per_mesh(self, value: bool):
+        self._buffer_per_mesh = bool(value)
+
+    @property
+    def mesh_quantization(self) -> bool:
+        """Gets whether vertex attributes are quantized using KHR_mesh_quantization.
+
+        Positions are stored as normalized int16 with the dequantization applied
+        by the node transform, normals as normalized int8 and UVs in the [0, 1]
+        range as normalized uint16.
+        """
+        return self._mesh_quantization
+
+    @mesh_quantization.setter
+    def mesh_quantization(self, value: bool):
+        self._mesh_quantization = bool(value)
+
+    @property
+    def optimize_vertex_cache(self) -> bool:
+        """Gets whether meshes are reordered for GPU vertex cache and fetch locality on export.
+
+        See PolygonModifier.optimize_vertex_order; the scene itself is not modified.
+        """
+        return self._optimize_vertex_cache
+
+    @optimize_vertex_cache.setter
+    def optimize_vertex_cache(self, value: bool):
+        self._optimize_vertex_cache = bool(value)
+
+    @property
+    def mesh_instancing(self) -> bool:
+        """Gets whether leaf nodes sharing a parent, mesh and material are written as one node using EXT_mesh_gpu_instancing."""
+        return self._mesh_instancing
+
+    @mesh_instancing.setter
+    def mesh_instancing(self, value: bool):
+        self._mesh_instancing = bool(value)
+
+    @property
+    def max_primitive_vertices(self) -> int:
+        """Gets the maximum number of vertices of an exported primitive, or 0 for no limit.
+
+        Meshes are always split into one primitive per material; larger
+        primitives are split further. 65535 keeps every primitive on 16-bit indices.
+        """
+        return self._max_primitive_vertices
+
+    @max_primitive_vertices.setter
+    def max_primitive_vertices(self, value: int):
+        value = int(value)
+        if value != 0 and value < 3:
+            raise ValueError("max_primitive_vertices must be 0 or at least 3")
+        self._max_primitive_vertices = value
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Dict
+from typing import TYPE_CHECKING, Dict, List
+import io
 
 from ..Exporter import Exporter
 
@@ -8,6 +9,9 @@ if TYPE_CHECKING:
 
 
 class ObjExporter(Exporter):
+    # Characters buffered before each write to the output stream.
+    _CHUNK_SIZE = 1 << 20
+
     def __init__(self):
         super().__init__()
 
@@ -25,42 +29,46 @@ class ObjExporter(Exporter):
         self._write_obj(scene, stream, options)
 
     def _write_obj(self, scene: 'Scene', stream, options: 'SaveOptions'):
-        lines = []
+        if not hasattr(stream, 'write'):
+            raise TypeError("Stream must support write() method")
+
         node_map = {}
         material_map = {}
-        mat_index = 1
         
         self._collect_nodes(scene.root_node, node_map, material_map)
         
+        writer = _ChunkWriter(stream, self._CHUNK_SIZE)
+
         for mat_id, mat in material_map.items():
-            lines.extend(self._write_material(mat, mat_id))
+            writer.write("\n".join(self._write_material(mat, mat_id)) + "\n")
         
-        lines.append("")
+        writer.write("\n")
         
+        # OBJ indices are global across the file, so each mesh's indices are
+        # shifted by the number of records written before it.
+        offsets = [1, 1, 1]
         for node_id, node in sorted(node_map.items()):
-            lines.extend(self._write_node(node, node_id))
-            mesh = node.entity
-            if mesh is not None:
-                lines.extend(self._write_mesh_data(mesh, options))
-                lines.extend(self._write_faces(mesh))
+            writer.write("\n".join(self._write_node(node, node_id)) + "\n")
+            self._write_mesh(writer, node.entity, options, offsets)
         
-        content = '\n'.join(lines)
+        writer.flush()
         
-        if hasattr(stream, 'write'):
-            stream.write(content)
-        else:
-            raise TypeError("Stream must support write() method")
+    def _collect_nodes(self, node, node_map: Dict, material_map: Dict, node_id: int = 0, visited=None):
+        from aspose.threed.entities import Mesh
 
-    def _collect_nodes(self, node, node_map: Dict, material_map: Dict, node_id: int = 0):
-        if node.entity is not None and node not in node_map.values():
+        if visited is None:
+            visited = set()
+
+        if isinstance(node.entity, Mesh) and node not in visited:
+            visited.add(node)
             node_map[node_id] = node
             
             material = node.material
             if material is not None and id(material) not in material_map:
                 material_map[id(material)] = material
             
-            for child in node.child_nodes:
-                node_id = self._collect_nodes(child, node_map, material_map, node_id + 1)
+        for child in node.child_nodes:
+            node_id = self._collect_nodes(child, node_map, material_map, node_id + 1, visited)
         
         return node_id
 
@@ -91,27 +99,164 @@ class ObjExporter(Exporter):
         lines.append(f"o {node.name or f'Node_{node_id}'}")
         return lines
 
-    def _write_mesh_data(self, mesh, options):
-        lines = []
+    def _write_mesh(self, writer: '_ChunkWriter', mesh, options, offsets: List[int]):
+        from aspose.threed.entities import VertexElementNormal, VertexElementUV
         
-        for cp in mesh.control_points:
-            if hasattr(options, 'flip_coordinate_system') and options.flip_coordinate_system:
-                lines.append(f"v {cp.x:.6f} {cp.z:.6f} {cp.y:.6f}")
+        flip = options.flip_coordinate_system
+        precision = options.float_precision
+
+        self._write_vertices(writer, mesh, flip, options.serialize_w, precision)
+
+        uv_indices = normal_indices = None
+        uv_element = self._find_element(mesh, VertexElementUV)
+        if uv_element is not None:
+            uv_indices = self._get_corner_indices(mesh, uv_element)
+        if uv_indices is not None:
+            line = f"vt {{:.{precision}f}} {{:.{precision}f}}\n".format
+            writer.write_lines(line(uv.x, uv.y) for uv in uv_element._data)
+
+        normal_element = self._find_element(mesh, VertexElementNormal)
+        if normal_element is not None:
+            normal_indices = self._get_corner_indices(mesh, normal_element)
+        if normal_indices is not None:
+            line = f"vn {{:.{precision}f}} {{:.{precision}f}} {{:.{precision}f}}\n".format
+            if flip:
+                writer.write_lines(line(n.x, n.z, n.y) for n in normal_element._data)
             else:
-                lines.append(f"v {cp.x:.6f} {cp.y:.6f} {cp.z:.6f}")
+                writer.write_lines(line(n.x, n.y, n.z) for n in normal_element._data)
         
-        lines.append("")
-        return lines
+        writer.write("\n")
+        self._write_faces(writer, mesh, offsets, uv_indices, normal_indices)
 
-    def _write_faces(self, mesh):
-        lines = []
-        polygons = mesh.polygons
+        offsets[0] += len(mesh._control_points)
+        if uv_indices is not None:
+            offsets[1] += len(uv_element._data)
+        if normal_indices is not None:
+            offsets[2] += len(normal_element._data)
         
-        for face_indices in polygons:
-            line = self._format_face(face_indices)
-            lines.append(line)
+    def _write_vertices(self, writer: '_ChunkWriter', mesh, flip: bool, serialize_w: bool, precision: int):
+        if serialize_w:
+            line = f"v {{:.{precision}f}} {{:.{precision}f}} {{:.{precision}f}} {{:.{precision}f}}\n".format
+        else:
+            line = f"v {{:.{precision}f}} {{:.{precision}f}} {{:.{precision}f}}\n".format
         
-        return lines
+        if mesh.packed:
+            it = iter(mesh._control_points.buffer)
+            points = zip(it, it, it, it)
+        else:
+            points = ((cp.x, cp.y, cp.z, cp.w) for cp in mesh._control_points)
+
+        if flip:
+            writer.write_lines(line(x, z, y, w) for x, y, z, w in points)
+        else:
+            writer.write_lines(line(x, y, z, w) for x, y, z, w in points)
+
+    def _write_faces(self, writer: '_ChunkWriter', mesh, offsets: List[int], uv_indices=None, normal_indices=None):
+        polygons = mesh._polygons
+        v_offset, vt_offset, vn_offset = offsets
+
+        if uv_indices is None and normal_indices is None:
+            start = 0
+            for size in mesh._polygon_sizes:
+                writer.write("f " + " ".join([str(i + v_offset) for i in polygons[start:start + size]]) + "\n")
+                start += size
+            return
+
+        start = 0
+        for size in mesh._polygon_sizes:
+            corners = []
+            for corner in range(start, start + size):
+                v = polygons[corner] + v_offset
+                if normal_indices is None:
+                    corners.append(f"{v}/{uv_indices(corner) + vt_offset}")
+                elif uv_indices is None:
+                    corners.append(f"{v}//{normal_indices(corner) + vn_offset}")
+                else:
+                    corners.append(f"{v}/{uv_indices(corner) + vt_offset}/{normal_indices(corner) + vn_offset}")
+            writer.write("f " + " ".join(corners) + "\n")
+            start += size
+
+    def _find_element(self, mesh, element_type):
+        for element in mesh._vertex_elements:
+            if isinstance(element, element_type):
+                return element
+        return None
+
+    def _get_corner_indices(self, mesh, element):
+        """Gets a function mapping a corner's position in _polygons to an index
+        into the element data, or None if the element cannot be written."""
+        from aspose.threed.entities import MappingMode, ReferenceMode
+
+        data_count = len(element._data)
+        if data_count == 0:
+            return None
+
+        polygons = mesh._polygons
+        mapping_mode = element.mapping_mode
+        if mapping_mode == MappingMode.CONTROL_POINT:
+            key = polygons.__getitem__
+            key_count = len(mesh._control_points)
+        elif mapping_mode == MappingMode.POLYGON_VERTEX:
+            key = None
+            key_count = len(polygons)
+        else:
+            return None
 
-    def _format_face(self, indices):
-        return "f " + " ".join(str(idx + 1) for idx in indices)
+        if element.reference_mode == ReferenceMode.DIRECT:
+            if data_count < key_count:
+                return None
+            if key is None:
+                return lambda corner: corner
+            return key
+
+        indices = element._indices
+        if len(indices) < key_count:
+            return None
+        if key is None:
+            return indices.__getitem__
+        return lambda corner: indices[polygons[corner]]
+
+
+class _ChunkWriter:
+    """Buffers text in a reusable StringIO and writes it to the stream in chunks.
+
+    Streams that only accept bytes get the text UTF-8 encoded.
+    """
+
+    def __init__(self, stream, chunk_size: int):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._buffer = io.StringIO()
+        self._encode = None
+
+    def write(self, text: str):
+        self._buffer.write(text)
+        if self._buffer.tell() >= self._chunk_size:
+            self.flush()
+
+    def write_lines(self, lines):
+        """Writes newline-terminated lines."""
+        buffer = self._buffer
+        chunk_size = self._chunk_size
+        for line in lines:
+            buffer.write(line)
+            if buffer.tell() >= chunk_size:
+                self.flush()
+
+    def flush(self):
+        text = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        if not text:
+            return
+        if self._encode is None:
+            try:
+                self._stream.write(text)
+                self._encode = False
+                return
+            except TypeError:
+                self._encode = True
+        if self._encode:
+            self._stream.write(text.encode('utf-8'))
+        else:
+            self._stream.write(text)
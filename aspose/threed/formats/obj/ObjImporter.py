@@ -1,5 +1,6 @@
 from typing import TYPE_CHECKING, List, Dict, Tuple
-import io
+from array import array
+import re
 
 from ..Importer import Importer
 
@@ -9,6 +10,10 @@ if TYPE_CHECKING:
 
 
 class ObjImporter(Importer):
+    _CHUNK_SIZE = 1 << 20
+    # Minimum size of the blocks handed to worker processes in parallel mode.
+    _PARALLEL_BLOCK_SIZE = 4 << 20
+
     def __init__(self):
         super().__init__()
 
@@ -18,150 +23,382 @@ class ObjImporter(Importer):
 
     def import_scene(self, scene: 'Scene', stream, options: 'ObjLoadOptions'):
         from .ObjLoadOptions import ObjLoadOptions
-        from aspose.threed import Node
-        from aspose.threed.entities import Mesh
-        from aspose.threed.utilities import Vector4, Vector2
         
         if not isinstance(options, ObjLoadOptions):
             options = ObjLoadOptions()
         
-        vertices: List[Vector4] = []
-        normals: List[Vector4] = []
-        uvs: List[Vector2] = []
-        
-        current_object_name = None
-        current_group_name = None
-        current_mesh = None
-        current_node = None
-        current_vertex_map: Dict[int, int] = {}
-        smoothing_group = 0
-        
-        content = ""
-        if hasattr(stream, 'read'):
-            if hasattr(stream, 'seek'):
-                stream.seek(0)
-            content = stream.read()
-            if isinstance(content, bytes):
-                content = content.decode('utf-8', errors='ignore')
-        else:
-            raise TypeError("Stream must support read() method")
+        settings = (options.scale, options.flip_coordinate_system, options.normalize_normal)
+        # Current object and group names, carried across blocks.
+        names = [None, None]
+        
+        if options.parallel:
+            self._import_parallel(scene, stream, options, settings, names)
+            return
+        
+        parser = _ObjParser(*settings)
+        for text in self._iter_text(stream):
+            parser.feed(text.split(b'\n'))
+            self._apply_events(scene, parser.events, names, parser, options)
+            parser.events.clear()
+        parser.close()
+        self._apply_events(scene, parser.events, names, parser, options)
+
+    def _import_parallel(self, scene: 'Scene', stream, options: 'ObjLoadOptions', settings, names):
+        from concurrent.futures import ProcessPoolExecutor
+        from collections import deque
+        import os
         
-        lines = content.split('\n')
+        pools = _ObjParser(*settings)
+        counts = (0, 0, 0)
+        workers = os.cpu_count() or 1
+        pending = deque()
         
-        scale = options.scale
+        def collect(future):
+            vertices, uvs, normals, events = future.result()
+            pools.vertices.extend(vertices)
+            pools.uvs.extend(uvs)
+            pools.normals.extend(normals)
+            self._apply_events(scene, events, names, pools, options)
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for block in self._iter_object_blocks(stream):
+                # Relative face indices need the pool sizes at the start of the block.
+                pending.append(executor.submit(_parse_obj_block, block, settings, counts))
+                counts = (counts[0] + len(_V_RECORD.findall(block)),
+                          counts[1] + len(_VT_RECORD.findall(block)),
+                          counts[2] + len(_VN_RECORD.findall(block)))
+                if len(pending) >= workers * 2:
+                    collect(pending.popleft())
+            while pending:
+                collect(pending.popleft())
+
+    def _apply_events(self, scene: 'Scene', events, names, pools: '_ObjParser', options: 'ObjLoadOptions'):
+        from aspose.threed import Node
+        from aspose.threed.entities import Mesh
+        
+        for keyword, value in events:
+            if keyword == b'f':
+                mesh = Mesh(names[0] or "mesh", packed=options.packed_storage)
+                value.build(mesh, pools.vertices, pools.uvs, pools.normals)
+                node = Node(names[0] or "mesh")
+                node.entity = mesh
+                node.parent_node = scene.root_node
+            elif keyword == b'o':
+                names[0] = value
+                names[1] = None
+            else:
+                names[1] = value
+                if names[0] is None:
+                    names[0] = value
+
+    def _iter_text(self, stream):
+        """Yields the stream as bytes in fixed-size chunks that end on a line boundary."""
+        if not hasattr(stream, 'read'):
+            raise TypeError("Stream must support read() method")
+        if hasattr(stream, 'seek'):
+            stream.seek(0)
+        
+        carry = b''
+        while True:
+            chunk = stream.read(self._CHUNK_SIZE)
+            if not chunk:
+                break
+            if isinstance(chunk, str):
+                chunk = chunk.encode('utf-8')
+            end = chunk.rfind(b'\n')
+            if end < 0:
+                carry += chunk
+                continue
+            yield carry + chunk[:end + 1]
+            carry = chunk[end + 1:]
+        if carry:
+            yield carry
+
+    def _iter_object_blocks(self, stream):
+        """Yields blocks of at least _PARALLEL_BLOCK_SIZE bytes that start at an o/g record."""
+        block = []
+        size = 0
+        for text in self._iter_text(stream):
+            pos = 0
+            while True:
+                start = pos + max(self._PARALLEL_BLOCK_SIZE - size, 1)
+                match = _OBJECT_RECORD.search(text, start) if start < len(text) else None
+                if match is None:
+                    block.append(text[pos:])
+                    size += len(text) - pos
+                    break
+                cut = match.start()
+                block.append(text[pos:cut])
+                yield b''.join(block)
+                block = []
+                size = 0
+                pos = cut
+        if size:
+            yield b''.join(block)
+
+
+# Record patterns used to split and count blocks for parallel parsing. They
+# follow the keyword rules of _ObjParser.feed: the first whitespace-separated
+# token of the line, case-insensitive.
+_OBJECT_RECORD = re.compile(rb'^[ \t\r\f\v]*[oOgG](?:[ \t\r\f\v]|$)', re.M)
+_V_RECORD = re.compile(rb'^[ \t\r\f\v]*[vV][ \t\r\f\v]', re.M)
+_VT_RECORD = re.compile(rb'^[ \t\r\f\v]*[vV][tT][ \t\r\f\v]', re.M)
+_VN_RECORD = re.compile(rb'^[ \t\r\f\v]*[vV][nN][ \t\r\f\v]', re.M)
+
+
+def _parse_obj_block(data: bytes, settings, counts):
+    """Parses one block in a worker process of the parallel import."""
+    parser = _ObjParser(*settings, counts)
+    parser.feed(data.split(b'\n'))
+    parser.close()
+    for keyword, value in parser.events:
+        if keyword == b'f':
+            value.release_maps()
+    return parser.vertices, parser.uvs, parser.normals, parser.events
+
+
+class _ObjParser:
+    """Parses OBJ lines into v/vt/vn pools and a list of events.
+
+    Events are ``(b'o', name)``, ``(b'g', name)`` and ``(b'f', builder)``; a
+    builder holds the faces read between two o/g records. ``counts`` gives the
+    pool sizes before the first line, so that relative indices resolve to
+    global ones when a block is parsed on its own.
+    """
+
+    def __init__(self, scale: float = 1.0, flip: bool = False, normalize_normal: bool = True, counts=(0, 0, 0)):
+        self.scale = scale
+        self.flip = flip
+        self.normalize_normal = normalize_normal
+        self.counts = counts
+        self.vertices = array('d')
+        self.uvs = array('d')
+        self.normals = array('d')
+        self.events = []
+        self.builder = None
+
+    def feed(self, lines):
+        vertices = self.vertices
+        normals = self.normals
+        uvs = self.uvs
+        scale = self.scale
+        flip = self.flip
+        normalize_normal = self.normalize_normal
+        plain_vertices = not flip and scale == 1.0
+        base_v, base_vt, base_vn = self.counts
         
         for line in lines:
-            line = line.strip()
-            
-            if not line or line.startswith('#'):
+            # Dispatch on the leading bytes; only unusual lines (indented,
+            # upper-case keywords) need a split to find the keyword.
+            head = line[:2]
+            if head == b'v ':
+                keyword = b'v'
+            elif head == b'f ':
+                keyword = b'f'
+            elif (head == b'vn' or head == b'vt') and line[2:3] == b' ':
+                keyword = head
+            elif not head or head[0] == 35:
                 continue
+            else:
+                line = line.strip()
+                if not line or line[0] == 35:
+                    continue
+                keyword = line.split(None, 1)[0].lower()
             
             parts = line.split()
-            if not parts:
-                continue
             
-            keyword = parts[0].lower()
-            
-            if keyword == 'v':
+            if keyword == b'v':
+                if plain_vertices and len(parts) == 4:
+                    vertices.extend(map(float, parts[1:]))
+                    vertices.append(1.0)
+                    continue
+                
                 x, y, z = float(parts[1]), float(parts[2]), float(parts[3])
                 w = float(parts[4]) if len(parts) > 4 else 1.0
                 
-                if options.flip_coordinate_system:
+                if flip:
                     y, z = z, y
                 
-                vertices.append(Vector4(x * scale, y * scale, z * scale, w))
+                vertices.extend((x * scale, y * scale, z * scale, w))
             
-            elif keyword == 'vn':
+            elif keyword == b'vn':
                 nx, ny, nz = float(parts[1]), float(parts[2]), float(parts[3])
                 
-                if options.normalize_normal:
+                if normalize_normal:
                     length = (nx * nx + ny * ny + nz * nz) ** 0.5
                     if length > 0:
                         nx, ny, nz = nx / length, ny / length, nz / length
                 
-                if options.flip_coordinate_system:
+                if flip:
                     ny, nz = nz, ny
                 
-                normals.append(Vector4(nx, ny, nz, 0))
+                normals.extend((nx, ny, nz))
             
-            elif keyword == 'vt':
+            elif keyword == b'vt':
                 u = float(parts[1])
                 v = float(parts[2]) if len(parts) > 2 else 0.0
-                uvs.append(Vector2(u, v))
+                uvs.extend((u, v))
             
-            elif keyword == 'f':
-                if current_mesh is None:
-                    current_mesh = Mesh(current_object_name or "mesh")
-                    current_node = Node(current_object_name or "mesh")
-                    current_node.entity = current_mesh
-                    current_node.parent_node = scene.root_node
-                    current_vertex_map = {}
-                
-                face_indices = []
-                vertex_normals = []
-                vertex_uvs = []
-                
-                for part in parts[1:]:
-                    indices = part.split('/')
-                    
-                    v_idx = int(indices[0]) if indices[0] else 0
-                    vt_idx = int(indices[1]) if len(indices) > 1 and indices[1] else 0
-                    vn_idx = int(indices[2]) if len(indices) > 2 and indices[2] else 0
-                    
-                    if v_idx < 0:
-                        v_idx = len(vertices) + v_idx
-                    else:
-                        v_idx = v_idx - 1
-                    
-                    if v_idx < 0:
-                        v_idx = 0
-                    
-                    if v_idx not in current_vertex_map:
-                        if v_idx < len(vertices):
-                            current_vertex_map[v_idx] = len(current_mesh._control_points)
-                            current_mesh._control_points.append(vertices[v_idx])
-                        else:
-                            current_vertex_map[v_idx] = len(current_mesh._control_points)
-                            current_mesh._control_points.append(Vector4(0, 0, 0, 1))
-                    
-                    local_idx = current_vertex_map[v_idx]
-                    face_indices.append(local_idx)
-                    
-                    if vt_idx < 0:
-                        vt_idx = len(uvs) + vt_idx
-                    else:
-                        vt_idx = vt_idx - 1
-                    
-                    if vn_idx < 0:
-                        vn_idx = len(normals) + vn_idx
-                    else:
-                        vn_idx = vn_idx - 1
-                    
-                    if vt_idx >= 0:
-                        vertex_uvs.append((len(face_indices) - 1, vt_idx))
-                    if vn_idx >= 0:
-                        vertex_normals.append((len(face_indices) - 1, vn_idx))
-                
-                if len(face_indices) >= 3:
-                    current_mesh.create_polygon(face_indices)
+            elif keyword == b'f':
+                if self.builder is None:
+                    self.builder = _ObjMeshBuilder()
+                self.builder.add_face(parts, base_v + (len(vertices) >> 2),
+                                      base_vt + (len(uvs) >> 1), base_vn + len(normals) // 3)
+            
+            elif keyword == b'o' or keyword == b'g':
+                self.close()
+                name = parts[1].decode('utf-8', errors='ignore') if len(parts) > 1 else None
+                self.events.append((keyword, name))
             
-            elif keyword == 'o':
-                current_object_name = parts[1] if len(parts) > 1 else None
-                current_group_name = None
-                current_mesh = None
-                current_node = None
-                current_vertex_map = {}
+            elif keyword == b's':
+                smoothing_group = int(parts[1]) if len(parts) > 1 and parts[1] != b'off' else 0
+
+    def close(self):
+        """Ends the current mesh, if any faces were read since the last o/g record."""
+        builder = self.builder
+        if builder is not None:
+            base_v, base_vt, base_vn = self.counts
+            builder.limits = (base_v + (len(self.vertices) >> 2),
+                              base_vt + (len(self.uvs) >> 1),
+                              base_vn + len(self.normals) // 3)
+            self.events.append((b'f', builder))
+            self.builder = None
+
+
+class _ObjAttribute:
+    """Per-mesh references into one of the global v/vt/vn pools.
+
+    ``references`` lists the pool entries used by the mesh in first-use order;
+    ``indices`` holds one position in ``references`` per polygon corner, or -1
+    for corners that do not reference the pool.
+    """
+
+    def __init__(self):
+        self.index_map: Dict[int, int] = {}
+        self.references = array('q')
+        self.indices = array('i')
+
+    def gather(self, pool: array, stride: int, limit: int, fill) -> array:
+        """Copies the referenced pool entries; entries at or past ``limit`` become ``fill``."""
+        count = min(len(pool) // stride, limit)
+        data = array('d')
+        for index in self.references:
+            if 0 <= index < count:
+                data.extend(pool[index * stride:index * stride + stride])
+            else:
+                data.extend(fill)
+        return data
+
+
+class _ObjMeshBuilder:
+    """Collects the faces of one OBJ mesh as flat arrays."""
+
+    def __init__(self):
+        self.vertices = _ObjAttribute()
+        self.uvs = _ObjAttribute()
+        self.normals = _ObjAttribute()
+        self.sizes = array('I')
+        # Pool sizes when the mesh ended; later entries are out of range.
+        self.limits = (0, 0, 0)
+
+    def release_maps(self):
+        """Drops the lookup maps, which are only needed while faces are added."""
+        self.vertices.index_map = None
+        self.uvs.index_map = None
+        self.normals.index_map = None
+
+    def add_face(self, parts, vertex_count: int, uv_count: int, normal_count: int):
+        """Adds an ``f`` record; the counts are the pool sizes read so far."""
+        vertices, uvs, normals = self.vertices, self.uvs, self.normals
+        vertex_map, vertex_refs, corners = vertices.index_map, vertices.references, vertices.indices
+        uv_map, uv_refs, uv_corners = uvs.index_map, uvs.references, uvs.indices
+        normal_map, normal_refs, normal_corners = normals.index_map, normals.references, normals.indices
+        
+        # OBJ indices are 1-based; negative ones are relative to the end of
+        # the pool as read so far.
+        for part in parts[1:]:
+            vt_idx = vn_idx = 0
+            if b'/' in part:
+                indices = part.split(b'/')
+                part = indices[0]
+                if len(indices) > 1 and indices[1]:
+                    vt_idx = int(indices[1])
+                if len(indices) > 2 and indices[2]:
+                    vn_idx = int(indices[2])
             
-            elif keyword == 'g':
-                current_group_name = parts[1] if len(parts) > 1 else None
-                if current_object_name is None:
-                    current_object_name = current_group_name
-                current_mesh = None
-                current_node = None
-                current_vertex_map = {}
+            v_idx = int(part) if part else 0
+            v_idx = vertex_count + v_idx if v_idx < 0 else v_idx - 1
+            if v_idx < 0:
+                v_idx = 0
+            local = vertex_map.get(v_idx)
+            if local is None:
+                local = vertex_map[v_idx] = len(vertex_refs)
+                vertex_refs.append(v_idx)
+            corners.append(local)
             
-            elif keyword == 's':
-                smoothing_group = int(parts[1]) if len(parts) > 1 and parts[1] != 'off' else 0
+            if vt_idx:
+                vt_idx = uv_count + vt_idx if vt_idx < 0 else vt_idx - 1
+                local = uv_map.get(vt_idx)
+                if local is None:
+                    local = uv_map[vt_idx] = len(uv_refs)
+                    uv_refs.append(vt_idx)
+                uv_corners.append(local)
+            else:
+                uv_corners.append(-1)
             
-            elif keyword == 'usemtl' and options.enable_materials:
-                pass
+            if vn_idx:
+                vn_idx = normal_count + vn_idx if vn_idx < 0 else vn_idx - 1
+                local = normal_map.get(vn_idx)
+                if local is None:
+                    local = normal_map[vn_idx] = len(normal_refs)
+                    normal_refs.append(vn_idx)
+                normal_corners.append(local)
+            else:
+                normal_corners.append(-1)
+        
+        size = len(parts) - 1
+        if size >= 3:
+            self.sizes.append(size)
+        elif size > 0:
+            # Degenerate faces are dropped, but their vertices stay referenced.
+            del corners[-size:]
+            del uv_corners[-size:]
+            del normal_corners[-size:]
+
+    def build(self, mesh, vertices: array, uvs: array, normals: array):
+        from aspose.threed.entities import VertexElementNormal, VertexElementUV, MappingMode, ReferenceMode, TextureMapping
+        
+        mesh._extend_control_points(self.vertices.gather(vertices, 4, self.limits[0], (0.0, 0.0, 0.0, 1.0)), 4)
+        mesh._extend_polygons(array('I', self.vertices.indices), self.sizes)
+        
+        if self.normals.references:
+            element = VertexElementNormal("", MappingMode.POLYGON_VERTEX, ReferenceMode.INDEX_TO_DIRECT)
+            self._fill_element(element, self.normals, normals, 3, self.limits[2], mesh.packed)
+            mesh.add_element(element)
+        if self.uvs.references:
+            element = VertexElementUV(TextureMapping.DIFFUSE, "", MappingMode.POLYGON_VERTEX, ReferenceMode.INDEX_TO_DIRECT)
+            self._fill_element(element, self.uvs, uvs, 2, self.limits[1], mesh.packed)
+            mesh.add_element(element)
+
+    def _fill_element(self, element, attribute: _ObjAttribute, pool: array, stride: int, limit: int, packed: bool):
+        from aspose.threed.utilities import FVector4
+        
+        zero = (0.0,) * stride
+        data = attribute.gather(pool, stride, limit, zero)
+        indices = attribute.indices
+        if -1 in indices:
+            # Corners without a reference share one zero entry.
+            missing = len(data) // stride
+            data.extend(zero)
+            indices = array('i', (missing if i < 0 else i for i in indices))
+        
+        if packed:
+            element.set_array(data, stride)
+            element._indices = array('I', indices)
+        else:
+            it = iter(data)
+            if stride == 3:
+                element._data.extend(FVector4(x, y, z, 0.0) for x, y, z in zip(it, it, it))
+            else:
+                element._data.extend(FVector4(u, v, 0.0, 0.0) for u, v in zip(it, it))
+            element.set_indices(indices)
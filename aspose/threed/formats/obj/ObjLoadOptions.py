@@ -13,6 +13,7 @@ class ObjLoadOptions(LoadOptions):
         self._enable_materials = True
         self._scale = 1.0
         self._normalize_normal = True
+        self._parallel = False
 
     @property
     def flip_coordinate_system(self) -> bool:
@@ -45,3 +46,16 @@ class ObjLoadOptions(LoadOptions):
     @normalize_normal.setter
     def normalize_normal(self, value: bool):
         self._normalize_normal = bool(value)
+
+    @property
+    def parallel(self) -> bool:
+        """Gets whether object blocks are parsed in worker processes.
+
+        The file is split at o/g records into blocks of several megabytes, which
+        are parsed by a process pool and assembled in file order.
+        """
+        return self._parallel
+
+    @parallel.setter
+    def parallel(self, value: bool):
+        self._parallel = bool(value)
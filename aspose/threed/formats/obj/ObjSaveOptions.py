@@ -16,6 +16,7 @@ class ObjSaveOptions(SaveOptions):
         self._enable_materials = True
         self._flip_coordinate_system = False
         self._axis_system = None
+        self._float_precision = 6
 
     @property
     def apply_unit_scale(self) -> bool:
@@ -72,3 +73,15 @@ class ObjSaveOptions(SaveOptions):
     @axis_system.setter
     def axis_system(self, value: 'AxisSystem'):
         self._axis_system = value
+
+    @property
+    def float_precision(self) -> int:
+        """Gets the number of decimal places written for coordinates, UVs and normals."""
+        return self._float_precision
+
+    @float_precision.setter
+    def float_precision(self, value: int):
+        value = int(value)
+        if value < 0:
+            raise ValueError("float_precision must not be negative")
+        self._float_precision = value
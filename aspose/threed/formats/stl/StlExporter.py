@@ -1,6 +1,5 @@
 from typing import TYPE_CHECKING
 import struct
-import io
 
 from ..Exporter import Exporter
 
@@ -11,6 +10,10 @@ if TYPE_CHECKING:
 
 
 class StlExporter(Exporter):
+    _FACET = struct.Struct('<12fH')
+    # Facets buffered before each write to the output stream.
+    _CHUNK_FACETS = 4096
+
     def __init__(self):
         super().__init__()
 
@@ -56,9 +59,34 @@ class StlExporter(Exporter):
                 return False
         return True
 
+    def _iter_facets(self, meshes, options: 'StlSaveOptions'):
+        """Yields (nx, ny, nz, x1, y1, z1, x2, y2, z2, x3, y3, z3) per triangle."""
+        scale = options.scale
+        flip = options.flip_coordinate_system
+        compute_normal = self._compute_normal
+
+        for mesh in meshes:
+            control_points = mesh._control_points
+            polygons = mesh._polygons
+            for i in range(0, mesh.polygon_count * 3, 3):
+                v1 = control_points[polygons[i]]
+                v2 = control_points[polygons[i + 1]]
+                v3 = control_points[polygons[i + 2]]
+
+                normal = compute_normal(v1, v2, v3)
+
+                if flip:
+                    yield (normal.x, normal.z, normal.y,
+                           v1.x * scale, v1.z * scale, v1.y * scale,
+                           v2.x * scale, v2.z * scale, v2.y * scale,
+                           v3.x * scale, v3.z * scale, v3.y * scale)
+                else:
+                    yield (normal.x, normal.y, normal.z,
+                           v1.x * scale, v1.y * scale, v1.z * scale,
+                           v2.x * scale, v2.y * scale, v2.z * scale,
+                           v3.x * scale, v3.y * scale, v3.z * scale)
+
     def _write_ascii_stl(self, stream, meshes, scene: 'Scene', options: 'StlSaveOptions'):
-        from aspose.threed.utilities import Vector4
-        
         header_name = options.file_name if options.file_name else "exported"
         header_name = header_name.split('/')[-1].split('\\')[-1]
         header_name = header_name.rsplit('.', 1)[0] if '.' in header_name else header_name
@@ -66,102 +94,62 @@ class StlExporter(Exporter):
         
         if not header_name:
             header_name = "exported"
-        
-        lines = [f"solid {header_name}"]
-        
-        for mesh in meshes:
-            for i in range(mesh.polygon_count):
-                v0_idx = mesh._polygons[i * 3]
-                v1_idx = mesh._polygons[i * 3 + 1]
-                v2_idx = mesh._polygons[i * 3 + 2]
-                
-                v1 = mesh._control_points[v0_idx]
-                v2 = mesh._control_points[v1_idx]
-                v3 = mesh._control_points[v2_idx]
-                
-                normal = self._compute_normal(v1, v2, v3)
-                
-                if options.flip_coordinate_system:
-                    y1, z1 = v1.y, v1.z
-                    v1 = Vector4(v1.x, z1, y1, v1.w)
-                    y2, z2 = v2.y, v2.z
-                    v2 = Vector4(v2.x, z2, y2, v2.w)
-                    y3, z3 = v3.y, v3.z
-                    v3 = Vector4(v3.x, z3, y3, v3.w)
-                    ny, nz = normal.y, normal.z
-                    normal = Vector4(normal.x, nz, ny, normal.w)
-                
-                nx = normal.x
-                ny = normal.y
-                nz = normal.z
-                
-                x1, y1, z1 = v1.x * options.scale, v1.y * options.scale, v1.z * options.scale
-                x2, y2, z2 = v2.x * options.scale, v2.y * options.scale, v2.z * options.scale
-                x3, y3, z3 = v3.x * options.scale, v3.y * options.scale, v3.z * options.scale
-                
-                lines.append(f"  facet normal {nx:.6e} {ny:.6e} {nz:.6e}")
-                lines.append("    outer loop")
-                lines.append(f"      vertex {x1:.6e} {y1:.6e} {z1:.6e}")
-                lines.append(f"      vertex {x2:.6e} {y2:.6e} {z2:.6e}")
-                lines.append(f"      vertex {x3:.6e} {y3:.6e} {z3:.6e}")
-                lines.append("    endloop")
-                lines.append("  endfacet")
-        
-        lines.append(f"endsolid {header_name}")
-        
-        content = '\n'.join(lines)
-        if hasattr(stream, 'write'):
-            try:
-                stream.write(content)
-            except TypeError:
-                stream.write(content.encode('utf-8'))
+
+        if not hasattr(stream, 'write'):
+            return
+
+        write = stream.write
+        try:
+            write(f"solid {header_name}\n")
+        except TypeError:
+            def write(text, _write=stream.write):
+                _write(text.encode('utf-8'))
+            write(f"solid {header_name}\n")
+
+        facet_format = ("  facet normal {:.6e} {:.6e} {:.6e}\n"
+                        "    outer loop\n"
+                        "      vertex {:.6e} {:.6e} {:.6e}\n"
+                        "      vertex {:.6e} {:.6e} {:.6e}\n"
+                        "      vertex {:.6e} {:.6e} {:.6e}\n"
+                        "    endloop\n"
+                        "  endfacet\n").format
+        chunk = []
+        for facet in self._iter_facets(meshes, options):
+            chunk.append(facet_format(*facet))
+            if len(chunk) == self._CHUNK_FACETS:
+                write(''.join(chunk))
+                chunk.clear()
+        if chunk:
+            write(''.join(chunk))
+
+        write(f"endsolid {header_name}")
 
     def _write_binary_stl(self, stream, meshes, scene: 'Scene', options: 'StlSaveOptions'):
-        from aspose.threed.utilities import Vector4
-        
-        triangles_data = b""
-        
-        for mesh in meshes:
-            for i in range(mesh.polygon_count):
-                v0_idx = mesh._polygons[i * 3]
-                v1_idx = mesh._polygons[i * 3 + 1]
-                v2_idx = mesh._polygons[i * 3 + 2]
-                
-                v1 = mesh._control_points[v0_idx]
-                v2 = mesh._control_points[v1_idx]
-                v3 = mesh._control_points[v2_idx]
-                
-                normal = self._compute_normal(v1, v2, v3)
-                
-                if options.flip_coordinate_system:
-                    y1, z1 = v1.y, v1.z
-                    v1 = Vector4(v1.x, z1, y1, v1.w)
-                    y2, z2 = v2.y, v2.z
-                    v2 = Vector4(v2.x, z2, y2, v2.w)
-                    y3, z3 = v3.y, v3.z
-                    v3 = Vector4(v3.x, z3, y3, v3.w)
-                    ny, nz = normal.y, normal.z
-                    normal = Vector4(normal.x, nz, ny, normal.w)
-                
-                x1, y1, z1 = v1.x * options.scale, v1.y * options.scale, v1.z * options.scale
-                x2, y2, z2 = v2.x * options.scale, v2.y * options.scale, v2.z * options.scale
-                x3, y3, z3 = v3.x * options.scale, v3.y * options.scale, v3.z * options.scale
-                
-                nx, ny, nz = normal.x, normal.y, normal.z
-                
-                triangles_data += struct.pack('<12f', nx, ny, nz, x1, y1, z1, x2, y2, z2, x3, y3, z3)
-                triangles_data += struct.pack('<H', 0)
-        
         header_name = options.file_name if options.file_name else "exported"
         header_name = header_name.encode('utf-8', errors='ignore')[:80]
         header = header_name.ljust(80, b'\x00')
         
-        facet_count = len(triangles_data) // 50
-        
-        content = header + struct.pack('<I', facet_count) + triangles_data
-        
-        if hasattr(stream, 'write'):
-            stream.write(content)
+        facet_count = sum(mesh.polygon_count for mesh in meshes)
+
+        if not hasattr(stream, 'write'):
+            return
+
+        stream.write(header + struct.pack('<I', facet_count))
+
+        facet_size = self._FACET.size
+        pack_into = self._FACET.pack_into
+        chunk_size = self._CHUNK_FACETS * facet_size
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        offset = 0
+        for facet in self._iter_facets(meshes, options):
+            pack_into(buffer, offset, *facet, 0)
+            offset += facet_size
+            if offset == chunk_size:
+                stream.write(view)
+                offset = 0
+        if offset:
+            stream.write(view[:offset])
 
     def _compute_normal(self, v1, v2, v3):
         from aspose.threed.utilities import Vector4
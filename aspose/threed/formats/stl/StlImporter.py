@@ -1,4 +1,8 @@
 from typing import TYPE_CHECKING
+from array import array
+from itertools import chain, repeat
+from math import isfinite
+import operator
 import struct
 import io
 
@@ -10,6 +14,8 @@ if TYPE_CHECKING:
 
 
 class StlImporter(Importer):
+    _FACET = struct.Struct('<12f2x')
+
     def __init__(self):
         super().__init__()
 
@@ -21,22 +27,11 @@ class StlImporter(Importer):
         from .StlLoadOptions import StlLoadOptions
         from aspose.threed import Node
         from aspose.threed.entities import Mesh
-        from aspose.threed.utilities import Vector4
         
         if not isinstance(options, StlLoadOptions):
             options = StlLoadOptions()
         
-        content = b""
-        if hasattr(stream, 'read'):
-            if hasattr(stream, 'seek'):
-                stream.seek(0)
-            data = stream.read()
-            if isinstance(data, str):
-                content = data.encode('utf-8', errors='ignore')
-            else:
-                content = data
-        else:
-            raise TypeError("Stream must support read() method")
+        content = self._read_bytes(stream)
         
         if len(content) == 0:
             return
@@ -44,24 +39,23 @@ class StlImporter(Importer):
         is_binary = self._is_binary_stl(content)
         
         mesh_name = "mesh"
-        vertices = []
-        normals = []
         
         if is_binary:
-            mesh_name, vertices, normals = self._read_binary_stl(content, options)
+            mesh_name, positions, normals = self._read_binary_stl(content, options)
         else:
-            if isinstance(content, bytes):
-                content_text = content.decode('utf-8', errors='ignore')
-            else:
-                content_text = content
-            mesh_name, vertices, normals = self._read_ascii_stl(content_text, options)
+            content_text = str(content, 'utf-8', errors='ignore')
+            mesh_name, positions, normals = self._read_ascii_stl(content_text, options)
         
-        mesh = Mesh(mesh_name)
-        for v in vertices:
-            mesh._control_points.append(v)
+        mesh = Mesh(mesh_name, packed=options.packed_storage)
+        if options.weld_vertices:
+            positions, indices = self._weld_vertices(positions, options.weld_tolerance)
+        else:
+            indices = range(len(positions) // 3)
+        mesh._extend_control_points(positions, 3)
+        mesh._extend_polygons(indices, 3)
         
-        for i in range(0, len(vertices), 3):
-            mesh.create_polygon(i, i + 1, i + 2)
+        if options.import_normals and len(normals) > 0:
+            mesh.add_element(self._create_normal_element(normals, mesh.packed))
         
         node = Node(mesh_name)
         node.entity = mesh
@@ -80,17 +74,15 @@ class StlImporter(Importer):
             pass
         
         try:
-            text = content.decode('utf-8', errors='ignore').strip().lower()
+            text = str(content[:512], 'utf-8', errors='ignore').strip().lower()
             return not text.startswith('solid')
         except:
             return True
 
     def _read_ascii_stl(self, content: str, options: 'StlLoadOptions'):
-        from aspose.threed.utilities import Vector4
-        
         mesh_name = "mesh"
-        vertices = []
-        normals = []
+        positions = array('d')
+        normals = array('d')
         
         lines = content.split('\n')
         
@@ -115,28 +107,24 @@ class StlImporter(Importer):
                     nx, ny, nz = float(parts[2]), float(parts[3]), float(parts[4])
                     if options.flip_coordinate_system:
                         ny, nz = nz, ny
-                    current_normal = Vector4(nx, ny, nz, 0)
+                    current_normal = (nx, ny, nz)
             
             elif keyword == 'vertex':
                 x, y, z = float(parts[1]), float(parts[2]), float(parts[3])
                 if options.flip_coordinate_system:
                     y, z = z, y
-                vertices.append(Vector4(x * options.scale, y * options.scale, z * options.scale, 1))
-                current_vertices.append(len(vertices) - 1)
+                positions.extend((x * options.scale, y * options.scale, z * options.scale))
+                current_vertices.append(len(positions) // 3 - 1)
             
             elif keyword == 'endfacet':
-                if current_normal:
-                    for _ in range(len(current_vertices)):
-                        normals.append(current_normal)
+                normals.extend(current_normal or (0.0, 0.0, 0.0))
                 current_normal = None
                 current_vertices = []
         
-        return mesh_name, vertices, normals
+        return mesh_name, positions, normals
 
-    def _read_binary_stl(self, content: bytes, options: 'StlLoadOptions'):
-        from aspose.threed.utilities import Vector4
-        
-        header = content[:80]
+    def _read_binary_stl(self, content, options: 'StlLoadOptions'):
+        header = bytes(content[:80])
         try:
             mesh_name = header.decode('utf-8', errors='ignore').strip()
             if not mesh_name:
@@ -145,32 +133,124 @@ class StlImporter(Importer):
             mesh_name = "mesh"
         
         facet_count = struct.unpack('<I', content[80:84])[0]
+        facet_count = min(facet_count, (len(content) - 84) // 50)
+        facets = memoryview(content)[84:84 + facet_count * 50]
+        
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
         
-        vertices = []
-        normals = []
+        if np is not None:
+            return (mesh_name,) + self._decode_facets_numpy(np, facets, facet_count, options)
+        return (mesh_name,) + self._decode_facets(facets, facet_count, options)
+
+    def _decode_facets(self, facets, facet_count: int, options: 'StlLoadOptions'):
+        values = array('f', chain.from_iterable(self._FACET.iter_unpack(facets)))
         
-        offset = 84
-        for _ in range(facet_count):
-            if offset + 50 > len(content):
-                break
-            
-            facet_data = content[offset:offset + 50]
-            values = struct.unpack('<12fH', facet_data)
-            
-            nx, ny, nz = values[0], values[1], values[2]
-            if options.flip_coordinate_system:
-                ny, nz = nz, ny
-            normal = Vector4(nx, ny, nz, 0)
-            
-            for i in range(3):
-                vx, vy, vz = values[3 + i * 3], values[4 + i * 3], values[5 + i * 3]
-                if options.flip_coordinate_system:
-                    vy, vz = vz, vy
-                vertices.append(Vector4(vx * options.scale, vy * options.scale, vz * options.scale, 1))
-            
-            for _ in range(3):
-                normals.append(normal)
-            
-            offset += 50
+        axes = (0, 2, 1) if options.flip_coordinate_system else (0, 1, 2)
+        normals = array('d', bytes(facet_count * 24))
+        positions = array('d', bytes(facet_count * 72))
+        for c, axis in enumerate(axes):
+            normals[c::3] = array('d', values[axis::12])
+            for v in range(3):
+                positions[v * 3 + c::9] = array('d', values[3 + v * 3 + axis::12])
         
-        return mesh_name, vertices, normals
+        if options.scale != 1.0:
+            positions = array('d', map(operator.mul, positions, repeat(options.scale)))
+        return positions, normals
+
+    def _decode_facets_numpy(self, np, facets, facet_count: int, options: 'StlLoadOptions'):
+        dtype = np.dtype([('normal', '<f4', (3,)), ('vertices', '<f4', (3, 3)), ('attribute', '<u2')])
+        records = np.frombuffer(facets, dtype=dtype, count=facet_count)
+        
+        vertices = records['vertices'].reshape(-1, 3).astype(np.float64)
+        normals = records['normal'].astype(np.float64)
+        if options.flip_coordinate_system:
+            vertices = vertices[:, [0, 2, 1]]
+            normals = normals[:, [0, 2, 1]]
+        if options.scale != 1.0:
+            vertices *= options.scale
+        
+        positions = array('d')
+        positions.frombytes(memoryview(np.ascontiguousarray(vertices)).cast('B'))
+        normal_values = array('d')
+        normal_values.frombytes(memoryview(np.ascontiguousarray(normals)).cast('B'))
+        return positions, normal_values
+
+    def _weld_vertices(self, positions, tolerance: float):
+        """Merges vertices whose coordinates round to the same multiple of ``tolerance``.
+        
+        Both implementations key vertices by round(coordinate / tolerance), or by
+        the exact coordinates for a zero tolerance, so they weld the same
+        vertices. Vertices with a NaN or infinite coordinate are never merged.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        
+        if np is not None:
+            return self._weld_vertices_numpy(np, positions, tolerance)
+        return self._weld_vertices_python(positions, tolerance)
+
+    def _weld_vertices_python(self, positions, tolerance: float):
+        welded = array('d')
+        indices = array('I')
+        lookup = {}
+        it = iter(positions)
+        for x, y, z in zip(it, it, it):
+            if not (isfinite(x) and isfinite(y) and isfinite(z)):
+                key = None
+            elif tolerance > 0:
+                key = (round(x / tolerance), round(y / tolerance), round(z / tolerance))
+            else:
+                key = (x, y, z)
+            index = None if key is None else lookup.get(key)
+            if index is None:
+                index = len(welded) // 3
+                if key is not None:
+                    lookup[key] = index
+                welded.extend((x, y, z))
+            indices.append(index)
+        return welded, indices
+
+    def _weld_vertices_numpy(self, np, positions, tolerance: float):
+        points = np.frombuffer(positions, dtype=np.float64).reshape(-1, 3)
+        finite = np.isfinite(points).all(axis=1)
+        keys = points[finite]
+        if tolerance > 0:
+            # Kept as float64: rounded values compare like the Python integers.
+            keys = np.round(keys / tolerance)
+        
+        # Group of each vertex, with a group of its own for every non-finite vertex
+        groups = np.empty(len(points), dtype=np.int64)
+        group_count = 0
+        if len(keys):
+            unique_keys, key_groups = np.unique(keys, axis=0, return_inverse=True)
+            groups[finite] = key_groups.ravel()
+            group_count = len(unique_keys)
+        groups[~finite] = np.arange(group_count, group_count + int((~finite).sum()))
+        
+        _, first, inverse = np.unique(groups, return_index=True, return_inverse=True)
+        order = np.argsort(first)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        
+        welded = array('d')
+        welded.frombytes(memoryview(np.ascontiguousarray(points[first[order]])).cast('B'))
+        indices = array('I')
+        indices.frombytes(memoryview(rank[inverse.ravel()].astype(np.uint32)).cast('B'))
+        return welded, indices
+
+    def _create_normal_element(self, normals, packed: bool):
+        from aspose.threed.entities import VertexElementNormal, MappingMode, ReferenceMode
+        from aspose.threed.utilities import FVector4
+        
+        element = VertexElementNormal("", MappingMode.POLYGON, ReferenceMode.DIRECT)
+        if packed:
+            element.set_array(normals, 3)
+        else:
+            it = iter(normals)
+            element._data.extend(FVector4(x, y, z, 0.0) for x, y, z in zip(it, it, it))
+        return element
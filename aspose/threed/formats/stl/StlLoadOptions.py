@@ -11,6 +11,9 @@ class StlLoadOptions(LoadOptions):
         super().__init__()
         self._flip_coordinate_system = False
         self._scale = 1.0
+        self._import_normals = False
+        self._weld_vertices = False
+        self._weld_tolerance = 1e-6
 
     @property
     def flip_coordinate_system(self) -> bool:
@@ -27,3 +30,27 @@ class StlLoadOptions(LoadOptions):
     @scale.setter
     def scale(self, value: float):
         self._scale = float(value)
+
+    @property
+    def import_normals(self) -> bool:
+        return self._import_normals
+
+    @import_normals.setter
+    def import_normals(self, value: bool):
+        self._import_normals = bool(value)
+
+    @property
+    def weld_vertices(self) -> bool:
+        return self._weld_vertices
+
+    @weld_vertices.setter
+    def weld_vertices(self, value: bool):
+        self._weld_vertices = bool(value)
+
+    @property
+    def weld_tolerance(self) -> float:
+        return self._weld_tolerance
+
+    @weld_tolerance.setter
+    def weld_tolerance(self, value: float):
+        self._weld_tolerance = float(value)
@@ -1,4 +1,5 @@
 from typing import TYPE_CHECKING, Dict, List
+from array import array
 import io
 import zipfile
 import xml.etree.ElementTree as ET
@@ -137,7 +138,7 @@ class ThreeMfImporter(Importer):
             mesh_elem = obj_elem.find(f'{ns}mesh') if ns else obj_elem.find('mesh')
             
             if mesh_elem is not None:
-                vertices = []
+                vertices = array('d')
                 triangles = []
                 
                 verts_elem = mesh_elem.find(f'{ns}vertices') if ns else mesh_elem.find('vertices')
@@ -153,7 +154,7 @@ class ThreeMfImporter(Importer):
                         if options.flip_coordinate_system:
                             y, z = z, y
                         
-                        vertices.append(Vector4(x, y, z, 1.0))
+                        vertices.extend((x, y, z))
                 
                 tris_elem = mesh_elem.find(f'{ns}triangles') if ns else mesh_elem.find('triangles')
                 
@@ -213,12 +214,11 @@ class ThreeMfImporter(Importer):
             transform = self._parse_transform(transform_str)
             
             if obj_id in resources and resources[obj_id]['type'] == 'mesh':
-                self._create_mesh_node(scene, obj_id, item_name, transform, vertices_map, triangles_map, object_materials, triangle_materials)
+                self._create_mesh_node(scene, obj_id, item_name, transform, vertices_map, triangles_map, object_materials, triangle_materials, options.packed_storage)
 
-    def _create_mesh_node(self, scene, obj_id, name, transform, vertices_map, triangles_map, object_materials, triangle_materials):
+    def _create_mesh_node(self, scene, obj_id, name, transform, vertices_map, triangles_map, object_materials, triangle_materials, packed=False):
         from aspose.threed import Node
         from aspose.threed.entities import Mesh
-        from aspose.threed.utilities import Vector4
         from aspose.threed.shading import LambertMaterial
         from aspose.threed.utilities import Vector3
         
@@ -228,10 +228,8 @@ class ThreeMfImporter(Importer):
         vertices = vertices_map[obj_id]
         triangles = triangles_map[obj_id]
         
-        mesh = Mesh(name)
-        
-        for v in vertices:
-            mesh._control_points.append(v)
+        mesh = Mesh(name, packed=packed)
+        mesh._extend_control_points(vertices, 3)
         
         for tri in triangles:
             if len(tri) == 3:
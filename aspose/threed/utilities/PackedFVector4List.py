@@ -0,0 +1,9 @@
+from .FVector4 import FVector4
+from .PackedVector4List import PackedVector4List
+
+
+class PackedFVector4List(PackedVector4List):
+    """List-compatible sequence of FVector4 values packed into a flat array('f')."""
+
+    _typecode = 'f'
+    _element_type = FVector4
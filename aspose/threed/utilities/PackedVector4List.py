@@ -0,0 +1,148 @@
+from array import array
+from typing import Iterable, Iterator, List
+
+from .Vector4 import Vector4
+
+
+class PackedVector4List:
+    """List-compatible sequence of Vector4 values packed into a flat array('d').
+
+    Components are stored as consecutive x, y, z, w values. Vectors are
+    materialized on access, so changing a returned vector does not write it
+    back; assign it with ``items[i] = v`` instead.
+    """
+
+    _typecode = 'd'
+    _element_type = Vector4
+
+    def __init__(self, data: Iterable = None):
+        self._buffer = array(self._typecode)
+        if data is not None:
+            self.extend(data)
+
+    @property
+    def buffer(self) -> array:
+        """Gets the underlying flat component array."""
+        return self._buffer
+
+    def _make(self, index: int):
+        b = self._buffer
+        o = index << 2
+        return self._element_type(b[o], b[o + 1], b[o + 2], b[o + 3])
+
+    def _normalize_index(self, index: int) -> int:
+        count = len(self._buffer) >> 2
+        if index < 0:
+            index += count
+        if index < 0 or index >= count:
+            raise IndexError("list index out of range")
+        return index
+
+    def __len__(self) -> int:
+        return len(self._buffer) >> 2
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._make(i) for i in range(*index.indices(len(self)))]
+        return self._make(self._normalize_index(index))
+
+    def __setitem__(self, index: int, value):
+        o = self._normalize_index(index) << 2
+        self._buffer[o:o + 4] = array(self._typecode, (value.x, value.y, value.z, value.w))
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                for i in sorted(range(start, stop, step), reverse=True):
+                    del self._buffer[i << 2:(i << 2) + 4]
+                return
+            del self._buffer[start << 2:stop << 2]
+            return
+        o = self._normalize_index(index) << 2
+        del self._buffer[o:o + 4]
+
+    def __iter__(self) -> Iterator:
+        element_type = self._element_type
+        it = iter(self._buffer)
+        for x, y, z, w in zip(it, it, it, it):
+            yield element_type(x, y, z, w)
+
+    def __contains__(self, item) -> bool:
+        try:
+            self.index(item)
+        except (ValueError, AttributeError):
+            return False
+        return True
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, PackedVector4List):
+            return self._buffer == other._buffer
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return False
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+    def append(self, item):
+        self._buffer.extend((item.x, item.y, item.z, item.w))
+
+    def append_components(self, x: float, y: float, z: float, w: float = 1.0):
+        """Appends a vector given by its components without creating a vector object."""
+        self._buffer.extend((x, y, z, w))
+
+    def extend(self, items: Iterable):
+        if isinstance(items, PackedVector4List) and items._typecode == self._typecode:
+            self._buffer.extend(items._buffer)
+            return
+        buffer = self._buffer
+        for item in items:
+            buffer.extend((item.x, item.y, item.z, item.w))
+
+    def extend_components(self, values, stride: int = 4, w: float = 1.0):
+        """Appends vectors from a flat component sequence.
+
+        Each vector takes ``stride`` consecutive values; missing components are
+        filled with 0 and the last one with ``w``.
+        """
+        if stride < 1 or stride > 4:
+            raise ValueError("stride must be between 1 and 4")
+        if not isinstance(values, array) or values.typecode != self._typecode:
+            values = array(self._typecode, values)
+        if stride == 4:
+            self._buffer.extend(values)
+            return
+        count = len(values) // stride
+        if count == 0:
+            return
+        block = array(self._typecode, (0.0, 0.0, 0.0, w)) * count
+        for c in range(stride):
+            block[c::4] = values[c:count * stride:stride]
+        self._buffer.extend(block)
+
+    def insert(self, index: int, item):
+        count = len(self)
+        if index < 0:
+            index = max(0, index + count)
+        index = min(index, count)
+        o = index << 2
+        self._buffer[o:o] = array(self._typecode, (item.x, item.y, item.z, item.w))
+
+    def remove(self, item):
+        del self[self.index(item)]
+
+    def index(self, item) -> int:
+        target = tuple(array(self._typecode, (item.x, item.y, item.z, item.w)))
+        it = iter(self._buffer)
+        for i, components in enumerate(zip(it, it, it, it)):
+            if components == target:
+                return i
+        raise ValueError(f"{item!r} is not in list")
+
+    def clear(self):
+        del self._buffer[:]
+
+    def to_list(self) -> List:
+        return list(self)
@@ -27,6 +27,8 @@ from .VertexFieldDataType import VertexFieldDataType
 from .VertexFieldSemantic import VertexFieldSemantic
 from .Watermark import Watermark
 from .ArrayList import ArrayListAdapter
+from .PackedVector4List import PackedVector4List
+from .PackedFVector4List import PackedFVector4List
 
 __all__ = [
     'Vector2', 'Vector3', 'Vector4', 'Quaternion', 'Matrix4', 'BoundingBox',
@@ -35,5 +37,5 @@ __all__ = [
     'IOExtension', 'MathUtils', 'ParseException', 'Rect', 'RelativeRectangle',
     'RotationOrder', 'SemanticAttribute', 'TransformBuilder', 'Vertex',
     'VertexDeclaration', 'VertexField', 'VertexFieldDataType', 'VertexFieldSemantic', 'Watermark',
-    'ArrayListAdapter'
+    'ArrayListAdapter', 'PackedVector4List', 'PackedFVector4List'
 ]
@@ -0,0 +1,77 @@
+import unittest
+import io
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aspose.threed import Scene
+from aspose.threed.formats.fbx.tokenizer import FbxTokenizer, TokenType
+from aspose.threed.formats.fbx.parser import FbxParser
+from aspose.threed.formats.fbx.FbxImporter import FbxImporter
+from aspose.threed.formats.fbx.FbxLoadOptions import FbxLoadOptions
+
+
+_TRIANGLE = """; FBX 7.4.0 project file
+Objects:  {
+    Geometry: 100, "Geometry::Tri", "Mesh" {
+        Vertices: *9 {
+            a: 0,0,0,1.5e+01,0,0,
+               0,1,-2.5E-07
+        }
+        PolygonVertexIndex: *3 {
+            a: 0,1,-3
+        }
+    }
+    Model: 200, "Model::Tri", "Mesh" {
+    }
+}
+Connections:  {
+    C: "OO",100,200
+    C: "OO",200,0
+}
+"""
+
+
+class TestFbxAsciiTokenizer(unittest.TestCase):
+    def test_tokens(self):
+        tokens = FbxTokenizer('Model : 1, "a, b" ; comment\n  Name{ }').tokenize()
+        self.assertEqual([(t.type, t.text) for t in tokens], [
+            (TokenType.KEY, 'Model'),
+            (TokenType.DATA, '1'),
+            (TokenType.COMMA, ','),
+            (TokenType.DATA, '"a, b"'),
+            (TokenType.KEY, 'Name'),
+            (TokenType.OPEN_BRACKET, '{'),
+            (TokenType.CLOSE_BRACKET, '}'),
+        ])
+        self.assertEqual([(t.line, t.column) for t in tokens][4:], [(2, 3), (2, 7), (2, 9)])
+
+        with self.assertRaises(ValueError):
+            FbxTokenizer('"Model": 1').tokenize()
+
+    def test_array_is_one_token(self):
+        tokens = FbxTokenizer(_TRIANGLE).tokenize()
+        arrays = [tokens[i + 1] for i, t in enumerate(tokens) if t.type == TokenType.KEY and t.text == 'a']
+        self.assertEqual([t.text for t in arrays], ['0,0,0,1.5e+01,0,0,\n               0,1,-2.5E-07', '0,1,-3'])
+        self.assertEqual(arrays[1].line, 9)
+
+        root = FbxParser(tokens).root_scope
+        self.assertEqual(len(root.get_first_element('Connections').compound.elements['C']), 2)
+
+    def test_import_ascii(self):
+        scene = Scene()
+        FbxImporter().import_scene(scene, io.BytesIO(_TRIANGLE.encode('utf-8')), FbxLoadOptions())
+
+        mesh = scene.root_node._child_nodes[0].entity
+        self.assertEqual(mesh.polygons, [[0, 1, 2]])
+        self.assertEqual(mesh.control_points[1].x, 15.0)
+        self.assertEqual(mesh.control_points[2].z, -2.5e-07)
+
+        importer = FbxImporter()
+        self.assertEqual(list(importer._parse_float_array('1,2e3,')), [1.0, 2000.0])
+        self.assertEqual(list(importer._parse_int_array('a: 4,-5')), [4, -5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,264 @@
+import unittest
+import io
+import struct
+import sys
+import os
+import zlib
+from functools import partial
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aspose.threed import Scene
+from aspose.threed.formats.fbx.binary_reader import BinaryReader, decode_arrays
+from aspose.threed.formats.fbx.binary_tokenizer import BinaryTokenizer
+from aspose.threed.formats.fbx.parser import FbxParser
+from aspose.threed.formats.fbx.FbxImporter import FbxImporter
+from aspose.threed.formats.fbx.FbxLoadOptions import FbxLoadOptions
+
+
+def _property(value, compress=False):
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        data = value.encode('utf-8')
+        return b'S' + struct.pack('<I', len(data)) + data
+    if isinstance(value, int):
+        return b'L' + struct.pack('<q', value)
+    if isinstance(value, float):
+        return b'D' + struct.pack('<d', value)
+    code, values = value
+    payload = struct.pack(f'<{len(values)}{code}', *values)
+    type_code = {'d': b'd', 'i': b'i', 'q': b'l'}[code]
+    if compress:
+        payload = zlib.compress(payload)
+    return type_code + struct.pack('<III', len(values), 1 if compress else 0, len(payload)) + payload
+
+
+def _record(offset, name, properties=(), children=(), is_64bit=False, compress=False):
+    """Encodes a node record starting at ``offset``; children are (name, properties, children) tuples."""
+    header = struct.Struct('<QQQ' if is_64bit else '<III')
+    sentinel = bytes(header.size + 1)
+    props = b''.join(_property(p, compress) for p in properties)
+    body = bytes([len(name)]) + name.encode('ascii') + props
+    cursor = offset + header.size + len(body)
+    nested = b''
+    if children:
+        for child in children:
+            data = _record(cursor, *child, is_64bit=is_64bit, compress=compress)
+            nested += data
+            cursor += len(data)
+        nested += sentinel
+    end = offset + header.size + len(body) + len(nested)
+    return header.pack(end, len(properties), len(props)) + body + nested
+
+
+def _binary_fbx(records, version=7400, compress=False):
+    is_64bit = version >= 7500
+    data = b'Kaydara FBX Binary  \x00\x1a\x00' + struct.pack('<I', version)
+    for record in records:
+        data += _record(len(data), *record, is_64bit=is_64bit, compress=compress)
+    return data + bytes(25 if is_64bit else 13)
+
+
+def _cube_fbx(version=7400, compress=False):
+    geometry = ('Geometry', [100, 'Tri\x00\x01Geometry', 'Mesh'], [
+        ('Vertices', [('d', [0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 2.5e-07])], []),
+        ('PolygonVertexIndex', [('i', [0, 1, -3])], []),
+    ])
+    model = ('Model', [200, 'Tri\x00\x01Model', 'Mesh'], [])
+    connections = ('Connections', [], [
+        ('C', ['OO', 100, 200], []),
+        ('C', ['OO', 200, 0], []),
+    ])
+    return _binary_fbx([('FBXHeaderExtension', [], [('FBXHeaderVersion', [1003], [])]),
+                        ('Objects', [], [geometry, model]),
+                        connections], version, compress)
+
+
+class TestFbxBinaryReader(unittest.TestCase):
+    def test_matches_tokenizer_tree(self):
+        data = _cube_fbx()
+        expected = FbxParser(BinaryTokenizer(data).tokenize()).root_scope
+        actual = BinaryReader(data).read()
+
+        def flatten(scope):
+            return [(key, [list(t.value) if hasattr(t.value, 'typecode') else t.value for t in element.tokens],
+                     None if element.compound is None else flatten(element.compound))
+                    for key, elements in scope.elements.items() for element in elements]
+
+        self.assertEqual(flatten(actual), flatten(expected))
+
+    def test_arrays_decoded(self):
+        for version, compress in ((7400, False), (7500, True)):
+            scope = BinaryReader(_cube_fbx(version, compress)).read()
+            geometry = scope.get_first_element('Objects').compound.get_first_element('Geometry')
+            vertices = geometry.compound.get_first_element('Vertices').tokens[0].value
+            self.assertEqual(vertices.typecode, 'd')
+            self.assertEqual(vertices[-1], 2.5e-07)
+            indices = geometry.compound.get_first_element('PolygonVertexIndex').tokens[0].value
+            self.assertEqual(list(indices), [0, 1, -3])
+
+    def test_invalid_files(self):
+        with self.assertRaises(ValueError):
+            BinaryReader(b'Kaydara FBX Binary').read()
+        data = _cube_fbx()
+        with self.assertRaises(ValueError):
+            BinaryReader(data[:60]).read()
+
+    def test_import_binary(self):
+        scene = Scene()
+        FbxImporter().import_scene(scene, io.BytesIO(_cube_fbx(7500, True)), FbxLoadOptions())
+
+        node = scene.root_node._child_nodes[0]
+        self.assertEqual(node.name, 'Tri\x00\x01Model')
+        mesh = node.entity
+        self.assertEqual(mesh.polygons, [[0, 1, 2]])
+        self.assertEqual(mesh.control_points[2].z, 2.5e-07)
+
+    def test_arrays_decoded_on_first_read(self):
+        corrupt = b'd' + struct.pack('<III', 2, 1, 4) + b'\xff' * 4
+        data = _binary_fbx([('Takes', [], [('Curve', [corrupt], [])])], 7500)
+
+        scope = BinaryReader(data).read()
+        token = scope.get_first_element('Takes').compound.get_first_element('Curve').tokens[0]
+        with self.assertRaises(zlib.error):
+            token.value
+
+        scope = BinaryReader(_cube_fbx(7500, True)).read()
+        geometry = scope.get_first_element('Objects').compound.get_first_element('Geometry')
+        token = geometry.compound.get_first_element('PolygonVertexIndex').tokens[0]
+        self.assertIs(token.value, token.value)
+
+    def test_decode_arrays_in_parallel(self):
+        options = FbxLoadOptions()
+        self.assertEqual(options.decompression_threads, 0)
+        with self.assertRaises(ValueError):
+            options.decompression_threads = -1
+        options.decompression_threads = 2
+
+        scope = BinaryReader(_cube_fbx(7500, True)).read()
+        objects = scope.get_first_element('Objects').compound
+        decode_arrays([objects.get_first_element('Geometry').compound], 2)
+        vertices = objects.get_first_element('Geometry').compound.get_first_element('Vertices').tokens[0]
+        self.assertIsNone(vertices._encoded)
+        self.assertEqual(vertices.value[4], 0.0)
+
+        scene = Scene()
+        FbxImporter().import_scene(scene, io.BytesIO(_cube_fbx(7500, True)), options)
+        self.assertEqual(scene.root_node._child_nodes[0].entity.polygons, [[0, 1, 2]])
+
+    def _filtered_fbx(self):
+        # The nested record of the geometry claims to end past the file, which
+        # only a reader that descends into the geometry notices.
+        broken = struct.pack('<QQQ', 1 << 40, 0, 0) + b'\x01a'
+        geometry = ('Geometry', [100, 'Tri\x00\x01Geometry', 'Mesh'], [('Vertices', [], [])])
+        data = _binary_fbx([('Objects', [], [geometry,
+                                             ('Model', [200, 'Kept\x00\x01Model', 'Mesh'], []),
+                                             ('Model', [201, 'Dropped\x00\x01Model', 'Mesh'], []),
+                                             ('Material', [300, 'Red\x00\x01Material', ''], []),
+                                             ('AnimationCurve', [400, '\x00\x01AnimCurve', ''], [])]),
+                            ('Connections', [], [('C', ['OO', 100, 200], []),
+                                                 ('C', ['OO', 300, 200], []),
+                                                 ('C', ['OO', 200, 0], []),
+                                                 ('C', ['OO', 201, 0], [])]),
+                            ('Takes', [], [('Current', [''], [])])], 7500)
+        start = data.index(b'Vertices') - 25
+        return data[:start] + broken + data[start + len(broken):]
+
+    def test_filters_skip_records(self):
+        options = FbxLoadOptions()
+        self.assertTrue(options.load_geometry and options.load_materials and options.load_animation)
+        self.assertIsNone(options.object_filter)
+        data = self._filtered_fbx()
+        with self.assertRaises(ValueError):
+            FbxImporter().import_scene(Scene(), io.BytesIO(data), options)
+
+        options.load_geometry = False
+        options.load_animation = False
+        scene = Scene()
+        FbxImporter().import_scene(scene, io.BytesIO(data), options)
+        self.assertEqual([node.name for node in scene.root_node._child_nodes], ['Kept\x00\x01Model', 'Dropped\x00\x01Model'])
+        self.assertIsNone(scene.root_node._child_nodes[0].entity)
+        self.assertEqual(len(scene.root_node._child_nodes[0]._materials), 1)
+
+        importer = FbxImporter()
+        scope = BinaryReader(data, partial(importer._keep_record, options, None)).read()
+        self.assertEqual(list(scope.get_first_element('Objects').compound.elements), ['Model', 'Material'])
+        self.assertEqual(list(scope.elements), ['Objects', 'Connections'])
+
+        options.load_materials = False
+        options.object_filter = ['Kept']
+        scene = Scene()
+        FbxImporter().import_scene(scene, io.BytesIO(data), options)
+        self.assertEqual([node.name for node in scene.root_node._child_nodes], ['Kept\x00\x01Model'])
+        self.assertEqual(scene.root_node._child_nodes[0]._materials, [])
+
+    def test_filters_apply_to_ascii(self):
+        content = """Objects:  {
+    Geometry: 100, "Geometry::Tri", "Mesh" {
+        Vertices: *9 {
+            a: 0,0,0,1,0,0,0,1,0
+        }
+        PolygonVertexIndex: *3 {
+            a: 0,1,-3
+        }
+    }
+    Model: 200, "Model::Kept", "Mesh" {
+    }
+    Model: 201, "Model::Dropped", "Mesh" {
+    }
+}
+Connections:  {
+    C: "OO",100,200
+    C: "OO",200,0
+    C: "OO",201,0
+}
+"""
+        options = FbxLoadOptions()
+        options.object_filter = [200, 100]
+        scene = Scene()
+        FbxImporter().import_scene(scene, io.BytesIO(content.encode('utf-8')), options)
+        self.assertEqual(len(scene.root_node._child_nodes), 1)
+        self.assertEqual(scene.root_node._child_nodes[0].entity.polygons, [[0, 1, 2]])
+
+        options.object_filter = ['Kept']
+        scene = Scene()
+        FbxImporter().import_scene(scene, io.BytesIO(content.encode('utf-8')), options)
+        self.assertEqual([node.name for node in scene.root_node._child_nodes], ['Model::Kept'])
+        self.assertEqual(scene.root_node._child_nodes[0].entity.polygons, [[0, 1, 2]])
+
+    def test_filter_keeps_connected_objects(self):
+        options = FbxLoadOptions()
+        options.object_filter = [200]
+        scene = Scene()
+        FbxImporter().import_scene(scene, io.BytesIO(_cube_fbx(7500, True)), options)
+        node = scene.root_node._child_nodes[0]
+        self.assertEqual(node.entity.polygons, [[0, 1, 2]])
+
+        options.object_filter = [100]
+        scene = Scene()
+        FbxImporter().import_scene(scene, io.BytesIO(_cube_fbx(7500, True)), options)
+        self.assertEqual(scene.root_node._child_nodes, [])
+
+    def test_filter_attaches_nested_models_to_root(self):
+        data = _binary_fbx([('Objects', [], [('Model', [200, 'Root\x00\x01Model', 'Null'], []),
+                                             ('Model', [201, 'Child\x00\x01Model', 'Null'], [])]),
+                            ('Connections', [], [('C', ['OO', 201, 200], []),
+                                                 ('C', ['OO', 200, 0], [])])], 7500)
+        options = FbxLoadOptions()
+        options.object_filter = 'Child'
+        self.assertEqual(options.object_filter, frozenset(['Child']))
+        scene = Scene()
+        FbxImporter().import_scene(scene, io.BytesIO(data), options)
+        self.assertEqual([node.name for node in scene.root_node._child_nodes], ['Child\x00\x01Model'])
+
+        options.object_filter = 200
+        scene = Scene()
+        FbxImporter().import_scene(scene, io.BytesIO(data), options)
+        root = scene.root_node._child_nodes
+        self.assertEqual([node.name for node in root], ['Root\x00\x01Model'])
+        self.assertEqual([node.name for node in root[0]._child_nodes], ['Child\x00\x01Model'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,8 @@ import os
 import io
 import json
 import struct
+import base64
+import tempfile
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
@@ -393,6 +395,462 @@ class TestGltfExporter(unittest.TestCase):
         material_data = gltf_data['materials'][0]
         self.assertEqual(material_data['alphaMode'], 'BLEND')
 
+    def _export_ascii(self, scene, options=None):
+        from aspose.threed.formats.gltf import GltfExporter
+
+        stream = io.BytesIO()
+        options = options or GltfSaveOptions()
+        options.binary_mode = False
+        GltfExporter().export(scene, stream, options)
+
+        gltf_data = json.loads(stream.getvalue().decode('utf-8'))
+        buffer = base64.b64decode(gltf_data['buffers'][0]['uri'].split(',', 1)[1])
+        return gltf_data, buffer
+
+    def _read_accessor(self, gltf_data, buffer, index, fmt):
+        accessor = gltf_data['accessors'][index]
+        view = gltf_data['bufferViews'][accessor['bufferView']]
+        self.assertEqual(view['byteOffset'] % 4, 0)
+        count = view['byteLength'] // struct.calcsize('<' + fmt)
+        return list(struct.unpack_from(f'<{count}{fmt}', buffer, view['byteOffset']))
+
+    def test_polygons_fanned_into_short_indices(self):
+        scene = Scene()
+        mesh = Mesh('Quad')
+        mesh._control_points.append(Vector4(0.0, 0.0, 0.0, 1.0))
+        mesh._control_points.append(Vector4(1.0, 0.0, 0.0, 1.0))
+        mesh._control_points.append(Vector4(1.0, 1.0, 0.0, 1.0))
+        mesh._control_points.append(Vector4(0.0, 1.0, 0.0, 1.0))
+        mesh._control_points.append(Vector4(0.5, 2.0, 0.0, 1.0))
+        mesh.create_polygon(0, 1, 2, 3)
+        mesh.create_polygon(3, 2, 4)
+        scene.root_node.create_child_node('QuadNode').entity = mesh
+
+        gltf_data, buffer = self._export_ascii(scene)
+
+        primitive = gltf_data['meshes'][0]['primitives'][0]
+        self.assertEqual(gltf_data['accessors'][primitive['indices']]['componentType'], 5123)
+        self.assertEqual(gltf_data['accessors'][primitive['indices']]['count'], 9)
+        self.assertEqual(self._read_accessor(gltf_data, buffer, primitive['indices'], 'H'),
+                         [0, 1, 2, 0, 2, 3, 3, 2, 4])
+        positions = self._read_accessor(gltf_data, buffer, primitive['attributes']['POSITION'], 'f')
+        self.assertEqual(positions[12:], [0.5, 2.0, 0.0])
+
+    def test_large_mesh_uses_int_indices(self):
+        count = 70000
+        scene = Scene()
+        for packed in (False, True):
+            mesh = Mesh('Strip', packed=packed)
+            mesh._extend_control_points([float(i) for i in range(3 * count)], 3)
+            mesh._extend_polygons([0, 1, count - 1], 3)
+            scene.root_node.create_child_node('Strip').entity = mesh
+
+        gltf_data, buffer = self._export_ascii(scene)
+
+        self.assertEqual(len(gltf_data['meshes']), 2)
+        for mesh_data in gltf_data['meshes']:
+            primitive = mesh_data['primitives'][0]
+            self.assertEqual(gltf_data['accessors'][primitive['indices']]['componentType'], 5125)
+            self.assertEqual(self._read_accessor(gltf_data, buffer, primitive['indices'], 'I'), [0, 1, count - 1])
+            positions = self._read_accessor(gltf_data, buffer, primitive['attributes']['POSITION'], 'f')
+            self.assertEqual(len(positions), 3 * count)
+            self.assertEqual(positions[-3:], [3.0 * count - 3, 3.0 * count - 2, 3.0 * count - 1])
+
+    def test_indexed_elements_expanded_per_vertex(self):
+        from aspose.threed.formats.obj import ObjImporter, ObjLoadOptions
+
+        obj_content = """v 0 0 0
+v 1 0 0
+v 1 1 0
+v 0 1 0
+vt 0.25 0.5
+vt 0.75 0.5
+vn 0 0 1
+f 1/1/1 2/2/1 3/1/1 4/2/1
+f 3/2/1 2/1/1 1/1/1
+"""
+        scene = Scene()
+        ObjImporter().import_scene(scene, io.StringIO(obj_content), ObjLoadOptions())
+        gltf_data, buffer = self._export_ascii(scene)
+
+        primitive = gltf_data['meshes'][0]['primitives'][0]
+        counts = {name: gltf_data['accessors'][index]['count'] for name, index in primitive['attributes'].items()}
+        self.assertEqual(sorted(counts), ['NORMAL', 'POSITION', 'TEXCOORD_0'])
+        self.assertEqual(set(counts.values()), {6})
+        indices = self._read_accessor(gltf_data, buffer, primitive['indices'], 'H')
+        positions = self._read_accessor(gltf_data, buffer, primitive['attributes']['POSITION'], 'f')
+        uvs = self._read_accessor(gltf_data, buffer, primitive['attributes']['TEXCOORD_0'], 'f')
+        corners = [(tuple(positions[i * 3:i * 3 + 2]), uvs[i * 2]) for i in indices]
+        self.assertEqual(corners[:3], [((0.0, 0.0), 0.25), ((1.0, 0.0), 0.75), ((1.0, 1.0), 0.25)])
+        self.assertEqual(corners[6:], [((1.0, 1.0), 0.75), ((1.0, 0.0), 0.25), ((0.0, 0.0), 0.25)])
+        self.assertEqual(self._read_accessor(gltf_data, buffer, primitive['attributes']['NORMAL'], 'f')[:3], [0.0, 0.0, 1.0])
+
+    def test_binary_round_trip(self):
+        from aspose.threed.formats.gltf import GltfExporter, GltfImporter, GltfLoadOptions
+        from aspose.threed.entities import VertexElementNormal
+        from aspose.threed.utilities.FVector4 import FVector4
+
+        scene = Scene()
+        for name, packed in (('first', False), ('second', True)):
+            mesh = Mesh(name, packed=packed)
+            mesh._extend_control_points([0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 0.0], 3)
+            mesh._extend_polygons([0, 1, 2, 3], 4)
+            normals = VertexElementNormal()
+            normals._data.extend([FVector4(0.0, 0.0, 1.0, 0.0)] * 4)
+            mesh._vertex_elements.append(normals)
+            scene.root_node.create_child_node(name).entity = mesh
+
+        stream = io.BytesIO()
+        options = GltfSaveOptions()
+        options.binary_mode = True
+        GltfExporter().export(scene, stream, options)
+
+        content = stream.getvalue()
+        magic, version, length = struct.unpack_from('<4sII', content)
+        self.assertEqual(length, len(content))
+        json_length = struct.unpack_from('<I', content, 12)[0]
+        gltf_data = json.loads(content[20:20 + json_length].decode('utf-8'))
+        self.assertEqual(gltf_data['buffers'], [{'byteLength': 2 * (48 + 48 + 12)}])
+
+        imported = Scene()
+        GltfImporter().import_scene(imported, io.BytesIO(content), GltfLoadOptions())
+        self.assertEqual(len(imported.root_node.child_nodes), 2)
+        for node in imported.root_node.child_nodes:
+            self.assertEqual(node.entity.polygons, [[0, 1, 2], [0, 2, 3]])
+            self.assertEqual(node.entity.control_points[2], Vector4(1.0, 1.0, 0.0, 1.0))
+            self.assertEqual(node.entity._vertex_elements[0]._data[3], FVector4(0.0, 0.0, 1.0, 0.0))
+
+    def test_ascii_export_to_text_stream(self):
+        from aspose.threed.formats.gltf import GltfExporter
+
+        scene = Scene()
+        mesh = Mesh('TestMesh')
+        mesh._control_points.append(Vector4(0.0, 0.0, 0.0, 1.0))
+        mesh._control_points.append(Vector4(1.0, 0.0, 0.0, 1.0))
+        mesh._control_points.append(Vector4(0.0, 1.0, 0.0, 1.0))
+        mesh.create_polygon(0, 1, 2)
+        scene.root_node.create_child_node('TestNode').entity = mesh
+
+        stream = io.StringIO()
+        GltfExporter().export(scene, stream, GltfSaveOptions())
+
+        gltf_data = json.loads(stream.getvalue())
+        buffer = base64.b64decode(gltf_data['buffers'][0]['uri'].split(',', 1)[1])
+        self.assertEqual(len(buffer), gltf_data['buffers'][0]['byteLength'])
+        self.assertEqual(struct.unpack_from('<9f3H', buffer), (0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0, 1, 2))
+
+    def _create_two_mesh_scene(self):
+        scene = Scene()
+        for name in ('first mesh', 'second mesh'):
+            mesh = Mesh(name)
+            mesh._control_points.append(Vector4(0.0, 0.0, 0.0, 1.0))
+            mesh._control_points.append(Vector4(1.0, 0.0, 0.0, 1.0))
+            mesh._control_points.append(Vector4(0.0, 1.0, 0.0, 1.0))
+            mesh.create_polygon(0, 1, 2)
+            scene.root_node.create_child_node(name).entity = mesh
+        return scene
+
+    def test_save_options_external_buffers(self):
+        options = GltfSaveOptions()
+        self.assertFalse(options.external_buffers)
+        self.assertFalse(options.buffer_per_mesh)
+
+        stream = io.StringIO()
+        options.external_buffers = True
+        from aspose.threed.formats.gltf import GltfExporter
+        with self.assertRaises(ValueError):
+            GltfExporter().export(self._create_two_mesh_scene(), stream, options)
+
+    def test_external_buffer(self):
+        from aspose.threed.formats.gltf import GltfLoadOptions
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'my scene.gltf')
+            options = GltfSaveOptions()
+            options.external_buffers = True
+            self._create_two_mesh_scene().save(path, options)
+
+            with open(path, 'rb') as f:
+                gltf_data = json.loads(f.read().decode('utf-8'))
+            self.assertEqual(gltf_data['buffers'], [{'uri': 'my%20scene.bin', 'byteLength': 86}])
+            self.assertEqual(os.path.getsize(os.path.join(directory, 'my scene.bin')), 86)
+
+            scene = Scene()
+            scene.open(path, GltfLoadOptions())
+            self.assertEqual(len(scene.root_node.child_nodes), 2)
+            self.assertEqual(scene.root_node.child_nodes[1].entity.control_points[2], Vector4(0.0, 1.0, 0.0, 1.0))
+
+    def test_external_buffer_per_mesh(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'scene.gltf')
+            options = GltfSaveOptions()
+            options.external_buffers = True
+            options.buffer_per_mesh = True
+            self._create_two_mesh_scene().save(path, options)
+
+            with open(path, 'rb') as f:
+                gltf_data = json.loads(f.read().decode('utf-8'))
+            self.assertEqual([buffer['uri'] for buffer in gltf_data['buffers']], ['scene_0.bin', 'scene_1.bin'])
+            self.assertEqual([view['buffer'] for view in gltf_data['bufferViews']], [0, 0, 1, 1])
+
+            with open(os.path.join(directory, 'scene_1.bin'), 'rb') as f:
+                data = f.read()
+            self.assertEqual(struct.unpack('<9f3H', data[:42]), (0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0, 1, 2))
+
+    def _create_quantizable_scene(self, uv_scale=1.0):
+        from aspose.threed.entities import VertexElementNormal, VertexElementUV
+        from aspose.threed.utilities.FVector4 import FVector4
+
+        scene = Scene()
+        mesh = Mesh('Quantized')
+        mesh._control_points.append(Vector4(-1.0, 2.0, 0.0, 1.0))
+        mesh._control_points.append(Vector4(3.0, 2.0, 0.0, 1.0))
+        mesh._control_points.append(Vector4(-1.0, 4.0, 1.0, 1.0))
+        mesh.create_polygon(0, 1, 2)
+
+        normals = VertexElementNormal()
+        normals._data.extend([FVector4(0.0, 0.0, 1.0, 0.0), FVector4(0.6, 0.0, 0.8, 0.0), FVector4(0.0, -1.0, 0.0, 0.0)])
+        mesh._vertex_elements.append(normals)
+        uvs = VertexElementUV()
+        uvs._data.extend([FVector4(0.0, 0.0, 0.0, 0.0), FVector4(uv_scale, 0.25, 0.0, 0.0), FVector4(0.5, 1.0, 0.0, 0.0)])
+        mesh._vertex_elements.append(uvs)
+
+        node = scene.root_node.create_child_node('Part')
+        node.entity = mesh
+        node.transform.translation = Vector3(10.0, 0.0, 0.0)
+        return scene
+
+    def test_mesh_quantization_round_trip(self):
+        from aspose.threed.formats.gltf import GltfExporter, GltfImporter, GltfLoadOptions
+
+        options = GltfSaveOptions()
+        self.assertFalse(options.mesh_quantization)
+        options.mesh_quantization = True
+        options.binary_mode = True
+
+        stream = io.BytesIO()
+        GltfExporter().export(self._create_quantizable_scene(), stream, options)
+        content = stream.getvalue()
+
+        json_length = struct.unpack_from('<I', content, 12)[0]
+        gltf_data = json.loads(content[20:20 + json_length].decode('utf-8'))
+        self.assertEqual(gltf_data['extensionsRequired'], ['KHR_mesh_quantization'])
+        attributes = gltf_data['meshes'][0]['primitives'][0]['attributes']
+        position = gltf_data['accessors'][attributes['POSITION']]
+        self.assertEqual((position['componentType'], position['normalized']), (5122, True))
+        self.assertEqual(position['min'], [-32767, -16384, -8192])
+        self.assertEqual(gltf_data['bufferViews'][position['bufferView']]['byteStride'], 8)
+        self.assertEqual(gltf_data['accessors'][attributes['NORMAL']]['componentType'], 5120)
+        self.assertEqual(gltf_data['accessors'][attributes['TEXCOORD_0']]['componentType'], 5123)
+        self.assertEqual(gltf_data['nodes'][0]['translation'], [11.0, 3.0, 0.5])
+        self.assertEqual(gltf_data['nodes'][0]['scale'], [2.0, 2.0, 2.0])
+
+        imported = Scene()
+        GltfImporter().import_scene(imported, io.BytesIO(content), GltfLoadOptions())
+        node = imported.root_node.child_nodes[0]
+        points = [(p.x * 2.0 + 1.0, p.y * 2.0 + 3.0, p.z * 2.0 + 0.5) for p in node.entity.control_points]
+        for actual, expected in zip(points, [(-1.0, 2.0, 0.0), (3.0, 2.0, 0.0), (-1.0, 4.0, 1.0)]):
+            for a, e in zip(actual, expected):
+                self.assertAlmostEqual(a, e, delta=1e-4)
+
+        normal = node.entity._vertex_elements[0]._data[1]
+        self.assertAlmostEqual(normal.x, 0.6, delta=0.01)
+        self.assertAlmostEqual(normal.z, 0.8, delta=0.01)
+        uv = node.entity._vertex_elements[1]._data[1]
+        self.assertAlmostEqual(uv.y, 0.25, delta=1e-4)
+
+    def test_mesh_quantization_keeps_tiled_uvs_and_children(self):
+        options = GltfSaveOptions()
+        options.mesh_quantization = True
+
+        scene = self._create_quantizable_scene(uv_scale=2.0)
+        scene.root_node.child_nodes[0].create_child_node('Child')
+        gltf_data, _ = self._export_ascii(scene, options)
+
+        attributes = gltf_data['meshes'][0]['primitives'][0]['attributes']
+        self.assertEqual(gltf_data['accessors'][attributes['TEXCOORD_0']]['componentType'], 5126)
+
+        self.assertNotIn('mesh', gltf_data['nodes'][0])
+        self.assertEqual(gltf_data['nodes'][0]['translation'], [10.0, 0.0, 0.0])
+        self.assertEqual(gltf_data['nodes'][0]['children'], [2, 1])
+        self.assertEqual(gltf_data['nodes'][2], {'mesh': 0, 'translation': [1.0, 3.0, 0.5], 'scale': [2.0, 2.0, 2.0]})
+
+    def test_optimize_vertex_cache(self):
+        from aspose.threed.entities import VertexElementNormal
+        from aspose.threed.utilities.FVector4 import FVector4
+
+        mesh = Mesh('Fan')
+        mesh._extend_control_points([0.0, 0.0, 0.0, 5.0, 5.0, 5.0, 1.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 0.0], 3)
+        mesh._extend_polygons([4, 3, 2, 2, 0, 4], 3)
+        normals = VertexElementNormal()
+        normals._data.extend([FVector4(float(i), 0.0, 0.0, 0.0) for i in range(5)])
+        mesh._vertex_elements.append(normals)
+        scene = Scene()
+        scene.root_node.create_child_node('Fan').entity = mesh
+
+        options = GltfSaveOptions()
+        self.assertFalse(options.optimize_vertex_cache)
+        options.optimize_vertex_cache = True
+        gltf_data, buffer = self._export_ascii(scene, options)
+
+        primitive = gltf_data['meshes'][0]['primitives'][0]
+        indices = self._read_accessor(gltf_data, buffer, primitive['indices'], 'H')
+        positions = self._read_accessor(gltf_data, buffer, primitive['attributes']['POSITION'], 'f')
+        normals = self._read_accessor(gltf_data, buffer, primitive['attributes']['NORMAL'], 'f')
+
+        self.assertEqual(indices[:3], [0, 1, 2])
+        self.assertEqual(positions[12:], [5.0, 5.0, 5.0])
+        self.assertEqual(normals[12], 1.0)
+        triangles = sorted(tuple(sorted(tuple(positions[i * 3:i * 3 + 2]) for i in indices[t:t + 3]))
+                           for t in range(0, 6, 3))
+        self.assertEqual(triangles, [((0.0, 0.0), (0.0, 1.0), (1.0, 0.0)), ((0.0, 1.0), (1.0, 0.0), (1.0, 1.0))])
+        original_index = {(0.0, 0.0): 0.0, (1.0, 0.0): 2.0, (1.0, 1.0): 3.0, (0.0, 1.0): 4.0}
+        for v in range(4):
+            self.assertEqual(normals[v * 3], original_index[tuple(positions[v * 3:v * 3 + 2])])
+        self.assertEqual(mesh._polygons, [4, 3, 2, 2, 0, 4])
+
+    def test_mesh_instancing(self):
+        from aspose.threed.formats.gltf import GltfImporter, GltfLoadOptions
+        from aspose.threed.utilities import Quaternion
+
+        mesh = Mesh('Shared')
+        mesh._extend_control_points([0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0], 3)
+        mesh._extend_polygons([0, 1, 2], 3)
+        scene = Scene()
+        for i in range(3):
+            node = scene.root_node.create_child_node(f'Instance{i}')
+            node.entity = mesh
+            node.transform.translation = Vector3(float(i), 2.0, 0.0)
+        scene.root_node.child_nodes[1].transform.rotation = Quaternion(0.0, 0.0, 0.0, 1.0)
+        scene.root_node.create_child_node('Empty')
+
+        options = GltfSaveOptions()
+        self.assertFalse(options.mesh_instancing)
+        options.mesh_instancing = True
+        gltf_data, buffer = self._export_ascii(scene, options)
+
+        self.assertEqual(gltf_data['extensionsUsed'], ['EXT_mesh_gpu_instancing'])
+        self.assertEqual(len(gltf_data['nodes']), 2)
+        self.assertEqual(gltf_data['scenes'][0]['nodes'], [0, 1])
+        attributes = gltf_data['nodes'][0]['extensions']['EXT_mesh_gpu_instancing']['attributes']
+        self.assertEqual(sorted(attributes), ['ROTATION', 'TRANSLATION'])
+        self.assertEqual(self._read_accessor(gltf_data, buffer, attributes['TRANSLATION'], 'f'),
+                         [0.0, 2.0, 0.0, 1.0, 2.0, 0.0, 2.0, 2.0, 0.0])
+        self.assertEqual(self._read_accessor(gltf_data, buffer, attributes['ROTATION'], 'f')[4:8], [0.0, 0.0, 1.0, 0.0])
+
+        stream = io.BytesIO(json.dumps(gltf_data).encode('utf-8'))
+        imported = Scene()
+        GltfImporter().import_scene(imported, stream, GltfLoadOptions())
+        instances = imported.root_node.child_nodes[0].child_nodes
+        self.assertEqual(len(instances), 3)
+        self.assertIsNone(imported.root_node.child_nodes[0].entity)
+        self.assertTrue(all(node.entity is instances[0].entity for node in instances))
+        self.assertEqual(instances[2].transform.translation, Vector3(2.0, 2.0, 0.0))
+        self.assertEqual(instances[1].transform.rotation, Quaternion(0.0, 0.0, 0.0, 1.0))
+
+    def test_mesh_instancing_folds_quantization(self):
+        from aspose.threed.utilities import Quaternion
+
+        options = GltfSaveOptions()
+        options.mesh_quantization = True
+        options.mesh_instancing = True
+
+        scene = self._create_quantizable_scene()
+        first = scene.root_node.child_nodes[0]
+        second = scene.root_node.create_child_node('Rotated')
+        second.entity = first.entity
+        second.transform.rotation = Quaternion(0.5 ** 0.5, 0.0, 0.0, 0.5 ** 0.5)
+        gltf_data, buffer = self._export_ascii(scene, options)
+
+        self.assertEqual(gltf_data['extensionsUsed'], ['KHR_mesh_quantization', 'EXT_mesh_gpu_instancing'])
+        self.assertNotIn('translation', gltf_data['nodes'][0])
+        attributes = gltf_data['nodes'][0]['extensions']['EXT_mesh_gpu_instancing']['attributes']
+        translations = self._read_accessor(gltf_data, buffer, attributes['TRANSLATION'], 'f')
+        for actual, expected in zip(translations, [11.0, 3.0, 0.5, -3.0, 1.0, 0.5]):
+            self.assertAlmostEqual(actual, expected, places=5)
+        self.assertEqual(self._read_accessor(gltf_data, buffer, attributes['SCALE'], 'f'), [2.0] * 6)
+
+    def _create_multi_material_scene(self):
+        from aspose.threed.entities import VertexElementType, MappingMode, ReferenceMode, VertexElementNormal
+        from aspose.threed.utilities.FVector4 import FVector4
+
+        mesh = Mesh('Strip')
+        mesh._extend_control_points([float(x) for i in range(4) for x in (i, 0.0, 0.0, i, 1.0, 0.0)], 3)
+        mesh._extend_polygons([0, 2, 3, 1, 2, 4, 5, 3, 4, 6, 7, 5], 4)
+        element = mesh.create_element(VertexElementType.MATERIAL, MappingMode.POLYGON, ReferenceMode.INDEX)
+        element.set_indices([1, 0, 1])
+        normals = VertexElementNormal()
+        normals._data.extend([FVector4(float(i), 0.0, 1.0, 0.0) for i in range(8)])
+        mesh._vertex_elements.append(normals)
+
+        scene = Scene()
+        node = scene.root_node.create_child_node('Strip')
+        node.entity = mesh
+        for name in ('Red', 'Blue'):
+            material = PbrMaterial()
+            material.name = name
+            node._materials.append(material)
+        return scene
+
+    def test_primitives_split_by_material(self):
+        from aspose.threed.formats.gltf import GltfImporter, GltfLoadOptions
+
+        gltf_data, buffer = self._export_ascii(self._create_multi_material_scene())
+
+        primitives = gltf_data['meshes'][0]['primitives']
+        self.assertEqual([primitive['material'] for primitive in primitives], [0, 1])
+        self.assertEqual([m['name'] for m in gltf_data['materials']], ['Red', 'Blue'])
+        self.assertEqual([gltf_data['accessors'][p['attributes']['POSITION']]['count'] for p in primitives], [4, 8])
+        self.assertEqual(self._read_accessor(gltf_data, buffer, primitives[0]['indices'], 'H')[:6], [0, 1, 2, 0, 2, 3])
+        positions = self._read_accessor(gltf_data, buffer, primitives[0]['attributes']['POSITION'], 'f')
+        self.assertEqual(positions[:3], [1.0, 0.0, 0.0])
+
+        imported = Scene()
+        stream = io.BytesIO(json.dumps(gltf_data).encode('utf-8'))
+        GltfImporter().import_scene(imported, stream, GltfLoadOptions())
+        node = imported.root_node.child_nodes[0]
+        self.assertEqual([m.name for m in node.materials], ['Red', 'Blue'])
+        self.assertEqual(node.entity.polygon_count, 6)
+        self.assertEqual(node.entity._vertex_elements[-1].indices, [0, 0, 1, 1, 1, 1])
+        normals = [normal.x for normal in node.entity._vertex_elements[0]._data]
+        self.assertEqual(normals, [2.0, 4.0, 5.0, 3.0, 0.0, 2.0, 3.0, 1.0, 4.0, 6.0, 7.0, 5.0])
+
+        gltf_data, buffer = self._export_ascii(imported)
+        primitives = gltf_data['meshes'][0]['primitives']
+        for primitive in primitives:
+            counts = [gltf_data['accessors'][index]['count'] for index in primitive['attributes'].values()]
+            self.assertEqual(len(counts), 2)
+            self.assertEqual(len(set(counts)), 1)
+        normals = self._read_accessor(gltf_data, buffer, primitives[0]['attributes']['NORMAL'], 'f')
+        self.assertEqual(normals[::3], [2.0, 4.0, 5.0, 3.0])
+
+        # Vertices of a primitive without the attribute are padded.
+        del primitives[0]['attributes']['NORMAL']
+        imported = Scene()
+        GltfImporter().import_scene(imported, io.BytesIO(json.dumps(gltf_data).encode('utf-8')), GltfLoadOptions())
+        normals = [normal.x for normal in imported.root_node.child_nodes[0].entity._vertex_elements[0]._data]
+        self.assertEqual(normals[:5], [0.0, 0.0, 0.0, 0.0, 0.0])
+        self.assertEqual(len(normals), 12)
+
+    def test_primitives_split_by_vertex_count(self):
+        options = GltfSaveOptions()
+        self.assertEqual(options.max_primitive_vertices, 0)
+        with self.assertRaises(ValueError):
+            options.max_primitive_vertices = 2
+        options.max_primitive_vertices = 6
+
+        scene = self._create_multi_material_scene()
+        mesh = scene.root_node.child_nodes[0].entity
+        mesh._vertex_elements.clear()
+        gltf_data, buffer = self._export_ascii(scene, options)
+
+        primitives = gltf_data['meshes'][0]['primitives']
+        self.assertEqual([gltf_data['accessors'][p['attributes']['POSITION']]['count'] for p in primitives], [6, 4])
+        self.assertEqual([gltf_data['accessors'][p['indices']]['count'] for p in primitives], [12, 6])
+        self.assertTrue(all(p['material'] == 0 for p in primitives))
+        positions = self._read_accessor(gltf_data, buffer, primitives[1]['attributes']['POSITION'], 'f')
+        self.assertEqual(positions, [2.0, 0.0, 0.0, 3.0, 0.0, 0.0, 3.0, 1.0, 0.0, 2.0, 1.0, 0.0])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -4,11 +4,34 @@ import os
 import json
 import struct
 import io
+import tempfile
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from aspose.threed import Scene
 from aspose.threed.formats.gltf import GltfLoadOptions
+from aspose.threed.utilities import Vector4, FVector4
+
+
+def _glb(document, binary):
+    binary += b'\x00' * (-len(binary) % 4)
+    document['buffers'] = [{"byteLength": len(binary)}]
+    json_chunk = json.dumps(document).encode('utf-8')
+    json_chunk += b' ' * (-len(json_chunk) % 4)
+    length = 12 + 8 + len(json_chunk) + 8 + len(binary)
+    return (struct.pack('<4sII', b'glTF', 2, length)
+            + struct.pack('<II', len(json_chunk), 0x4E4F534A) + json_chunk
+            + struct.pack('<II', len(binary), 0x004E4942) + binary)
+
+
+def _import_glb(data, packed=False):
+    from aspose.threed.formats.gltf import GltfImporter
+
+    scene = Scene()
+    options = GltfLoadOptions()
+    options.packed_storage = packed
+    GltfImporter().import_scene(scene, io.BytesIO(data), options)
+    return scene.root_node.child_nodes[0].entity
 
 
 class TestGltfImporterFunctional(unittest.TestCase):
@@ -119,6 +142,191 @@ class TestGltfImporterFunctional(unittest.TestCase):
         except Exception as e:
             self.fail(f"Failed to import binary glTF: {e}")
 
+    def test_interleaved_normalized_accessors(self):
+        interleaved = b''.join(struct.pack('<6f', x, y, 0.0, 0.0, 0.0, 1.0)
+                               for x, y in ((0.0, 0.0), (1.0, 0.0), (0.0, 1.0)))
+        colors = struct.pack('<12B', 255, 0, 0, 255, 0, 255, 0, 51, 0, 0, 255, 0)
+        indices = struct.pack('<3B', 2, 1, 0)
+        document = {
+            "asset": {"version": "2.0"},
+            "scene": 0,
+            "scenes": [{"nodes": [0]}],
+            "nodes": [{"mesh": 0}],
+            "meshes": [{"primitives": [{"attributes": {"POSITION": 0, "NORMAL": 1, "COLOR_0": 2}, "indices": 3}]}],
+            "bufferViews": [
+                {"buffer": 0, "byteOffset": 0, "byteLength": 72, "byteStride": 24},
+                {"buffer": 0, "byteOffset": 72, "byteLength": 12},
+                {"buffer": 0, "byteOffset": 84, "byteLength": 3},
+            ],
+            "accessors": [
+                {"bufferView": 0, "componentType": 5126, "count": 3, "type": "VEC3"},
+                {"bufferView": 0, "byteOffset": 12, "componentType": 5126, "count": 3, "type": "VEC3"},
+                {"bufferView": 1, "componentType": 5121, "normalized": True, "count": 3, "type": "VEC4"},
+                {"bufferView": 2, "componentType": 5121, "count": 3, "type": "SCALAR"},
+            ],
+        }
+        data = _glb(document, interleaved + colors + indices)
+
+        for packed in (False, True):
+            mesh = _import_glb(data, packed)
+            self.assertEqual(list(mesh.control_points), [Vector4(0, 0, 0, 1), Vector4(1, 0, 0, 1), Vector4(0, 1, 0, 1)])
+            self.assertEqual(mesh.polygons, [[2, 1, 0]])
+
+            normals = mesh._vertex_elements[0]
+            self.assertEqual(list(normals._data), [FVector4(0.0, 0.0, 1.0, 0.0)] * 3)
+
+            colors = mesh._vertex_elements[1]
+            self.assertEqual(colors._data[0], FVector4(1.0, 0.0, 0.0, 1.0))
+            self.assertAlmostEqual(colors._data[1].w, 0.2, places=6)
+            self.assertEqual(colors._data[2], FVector4(0.0, 0.0, 1.0, 0.0))
+            self.assertEqual(colors.packed, packed)
+
+    def test_sparse_accessor(self):
+        base = struct.pack('<9f', 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+        sparse_indices = struct.pack('<H', 2) + b'\x00\x00'
+        sparse_values = struct.pack('<3f', 0.0, 5.0, 0.0)
+        document = {
+            "asset": {"version": "2.0"},
+            "scene": 0,
+            "scenes": [{"nodes": [0, 1]}],
+            "nodes": [{"mesh": 0}, {"mesh": 1}],
+            "meshes": [
+                {"primitives": [{"attributes": {"POSITION": 0}}]},
+                {"primitives": [{"attributes": {"POSITION": 1}}]},
+            ],
+            "bufferViews": [
+                {"buffer": 0, "byteOffset": 0, "byteLength": 36},
+                {"buffer": 0, "byteOffset": 36, "byteLength": 2},
+                {"buffer": 0, "byteOffset": 40, "byteLength": 12},
+            ],
+            "accessors": [
+                {"bufferView": 0, "componentType": 5126, "count": 3, "type": "VEC3",
+                 "sparse": {"count": 1,
+                            "indices": {"bufferView": 1, "componentType": 5123},
+                            "values": {"bufferView": 2}}},
+                {"componentType": 5126, "count": 3, "type": "VEC3",
+                 "sparse": {"count": 1,
+                            "indices": {"bufferView": 1, "componentType": 5123},
+                            "values": {"bufferView": 2}}},
+            ],
+        }
+        data = _glb(document, base + sparse_indices + sparse_values)
+
+        from aspose.threed.formats.gltf import GltfImporter
+        scene = Scene()
+        GltfImporter().import_scene(scene, io.BytesIO(data), GltfLoadOptions())
+
+        dense = scene.root_node.child_nodes[0].entity
+        self.assertEqual(dense.control_points[1], Vector4(1, 0, 0, 1))
+        self.assertEqual(dense.control_points[2], Vector4(0, 5, 0, 1))
+
+        zeros = scene.root_node.child_nodes[1].entity
+        self.assertEqual(list(zeros.control_points), [Vector4(0, 0, 0, 1), Vector4(0, 0, 0, 1), Vector4(0, 5, 0, 1)])
+        self.assertEqual(zeros.polygons, [[0, 1, 2]])
+
+    def test_instanced_meshes_share_entity(self):
+        from unittest import mock
+        from aspose.threed.formats.gltf import GltfImporter
+
+        positions = struct.pack('<9f', 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+        primitive = {"attributes": {"POSITION": 0}}
+        document = {
+            "asset": {"version": "2.0"},
+            "scene": 0,
+            "scenes": [{"nodes": [0, 1, 2, 3]}],
+            "nodes": [{"mesh": 0}, {"mesh": 0}, {"mesh": 1}, {"mesh": 2}],
+            "meshes": [
+                {"name": "bolt", "primitives": [primitive]},
+                {"name": "bolt_copy", "primitives": [primitive]},
+                {"name": "painted", "primitives": [dict(primitive, material=0)]},
+            ],
+            "materials": [{"name": "paint"}],
+            "bufferViews": [{"buffer": 0, "byteOffset": 0, "byteLength": 36}],
+            "accessors": [{"bufferView": 0, "componentType": 5126, "count": 3, "type": "VEC3"}],
+        }
+
+        importer = GltfImporter()
+        scene = Scene()
+        with mock.patch.object(importer, '_read_accessor', wraps=importer._read_accessor) as read_accessor:
+            importer.import_scene(scene, io.BytesIO(_glb(document, positions)), GltfLoadOptions())
+        self.assertEqual(read_accessor.call_count, 1)
+
+        entities = [node.entity for node in scene.root_node.child_nodes]
+        self.assertIs(entities[0], entities[1])
+        self.assertIsNot(entities[0], entities[2])
+        self.assertIsNot(entities[0], entities[3])
+        self.assertEqual(entities[0].name, 'bolt')
+        self.assertEqual(entities[2].name, 'bolt_copy')
+        self.assertEqual(len(entities[0].parent_nodes), 2)
+        self.assertEqual(entities[2].control_points[1], Vector4(1, 0, 0, 1))
+        self.assertEqual(entities[3].control_points[1], Vector4(1, 0, 0, 1))
+
+    def test_lazy_buffers(self):
+        from unittest import mock
+        from aspose.threed.formats.gltf import GltfImporter
+
+        options = GltfLoadOptions()
+        self.assertFalse(options.lazy_buffers)
+        options.lazy_buffers = True
+
+        positions = struct.pack('<9f', 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+        document = {
+            "asset": {"version": "2.0"},
+            "scene": 0,
+            "scenes": [{"nodes": [0]}],
+            "nodes": [{"mesh": 0}],
+            "meshes": [{"primitives": [{"attributes": {"POSITION": 0}}]}],
+            "buffers": [
+                {"byteLength": 36, "uri": "mesh.bin"},
+                {"byteLength": 4, "uri": "data:application/octet-stream;base64,AAAAAA=="},
+            ],
+            "bufferViews": [
+                {"buffer": 0, "byteOffset": 0, "byteLength": 36},
+                {"buffer": 1, "byteOffset": 0, "byteLength": 4},
+            ],
+            "accessors": [{"bufferView": 0, "componentType": 5126, "count": 3, "type": "VEC3"}],
+        }
+
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, 'mesh.bin'), 'wb') as f:
+                f.write(positions)
+            path = os.path.join(directory, 'mesh.gltf')
+            with open(path, 'w') as f:
+                json.dump(document, f)
+
+            importer = GltfImporter()
+            scene = Scene()
+            with open(path, 'rb') as stream:
+                with mock.patch.object(importer, '_decode_data_uri') as decode_data_uri:
+                    importer.import_scene(scene, stream, options)
+            decode_data_uri.assert_not_called()
+
+        mesh = scene.root_node.child_nodes[0].entity
+        self.assertEqual(mesh.control_points[2], Vector4(0, 1, 0, 1))
+
+    def test_missing_external_buffer(self):
+        from aspose.threed.formats.gltf import GltfImporter
+
+        document = {
+            "asset": {"version": "2.0"},
+            "nodes": [{"mesh": 0}],
+            "meshes": [{"primitives": [{"attributes": {"POSITION": 0}}]}],
+            "buffers": [{"byteLength": 36, "uri": "missing%20mesh.bin"}],
+            "bufferViews": [{"buffer": 0, "byteOffset": 0, "byteLength": 36}],
+            "accessors": [{"bufferView": 0, "componentType": 5126, "count": 3, "type": "VEC3"}],
+        }
+
+        for lazy in (False, True):
+            options = GltfLoadOptions()
+            options.lazy_buffers = lazy
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, 'mesh.gltf')
+                with open(path, 'w') as f:
+                    json.dump(document, f)
+                with open(path, 'rb') as stream:
+                    with self.assertRaisesRegex(IOError, 'missing%20mesh.bin'):
+                        GltfImporter().import_scene(Scene(), stream, options)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,127 @@
+import unittest
+import io
+import sys
+import os
+import struct
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aspose.threed import Scene
+from aspose.threed.entities import Mesh, PolygonModifier
+from aspose.threed.utilities import Vector4, PackedVector4List
+from aspose.threed.formats.stl import StlLoadOptions, StlImporter
+from aspose.threed.formats.obj import ObjLoadOptions, ObjImporter
+
+
+class TestPackedVector4List(unittest.TestCase):
+    def test_append_and_index(self):
+        points = PackedVector4List()
+        points.append(Vector4(1, 2, 3, 1))
+        points.append_components(4, 5, 6)
+
+        self.assertEqual(len(points), 2)
+        self.assertEqual(points[0], Vector4(1, 2, 3, 1))
+        self.assertEqual(points[-1], Vector4(4, 5, 6, 1))
+        self.assertEqual(list(points.buffer), [1, 2, 3, 1, 4, 5, 6, 1])
+        with self.assertRaises(IndexError):
+            points[2]
+
+    def test_extend_components_with_stride(self):
+        points = PackedVector4List()
+        points.extend_components([0, 1, 2, 3, 4, 5], 3)
+
+        self.assertEqual(list(points), [Vector4(0, 1, 2, 1), Vector4(3, 4, 5, 1)])
+
+    def test_list_operations(self):
+        points = PackedVector4List([Vector4(0, 0, 0, 1), Vector4(1, 1, 1, 1)])
+        points[1] = Vector4(2, 2, 2, 1)
+        points.insert(0, Vector4(9, 9, 9, 1))
+
+        self.assertEqual(points.index(Vector4(2, 2, 2, 1)), 2)
+        self.assertIn(Vector4(9, 9, 9, 1), points)
+        points.remove(Vector4(9, 9, 9, 1))
+        self.assertEqual(len(points), 2)
+        del points[0]
+        self.assertEqual(points.to_list(), [Vector4(2, 2, 2, 1)])
+        with self.assertRaises(ValueError):
+            points.index(Vector4(7, 7, 7, 1))
+
+
+class TestMeshPackedStorage(unittest.TestCase):
+    def _create_quad(self, packed):
+        mesh = Mesh('quad', packed=packed)
+        mesh._control_points.append(Vector4(0, 0, 0, 1))
+        mesh._control_points.append(Vector4(1, 0, 0, 1))
+        mesh._control_points.append(Vector4(1, 1, 0, 1))
+        mesh._control_points.append(Vector4(0, 1, 0, 1))
+        mesh.create_polygon(0, 1, 2, 3)
+        mesh.create_polygon(0, 1, 2)
+        return mesh
+
+    def test_packed_storage_types(self):
+        mesh = self._create_quad(True)
+
+        self.assertTrue(mesh.packed)
+        self.assertIsInstance(mesh._control_points, PackedVector4List)
+        self.assertIsInstance(mesh._polygons, array)
+        self.assertEqual(mesh._polygons.typecode, 'I')
+
+    def test_packed_matches_list_storage(self):
+        packed = self._create_quad(True)
+        unpacked = self._create_quad(False)
+
+        self.assertEqual(packed.polygon_count, unpacked.polygon_count)
+        self.assertEqual(packed.polygons, unpacked.polygons)
+        self.assertEqual(packed.polygons[1], [0, 1, 2])
+        self.assertEqual(list(packed.control_points), list(unpacked.control_points))
+
+    def test_pack_converts_existing_data(self):
+        mesh = self._create_quad(False)
+        mesh.pack()
+        mesh.create_polygon([3, 2, 1])
+
+        self.assertTrue(mesh.packed)
+        self.assertEqual(mesh.polygons[2], [3, 2, 1])
+        self.assertEqual(len(mesh.control_points), 4)
+
+    def test_triangulate_keeps_packed_storage(self):
+        mesh = self._create_quad(True)
+        triangulated = PolygonModifier.triangulate(mesh)
+
+        self.assertTrue(triangulated.packed)
+        self.assertEqual(triangulated.polygon_count, 3)
+
+
+class TestImportPackedStorage(unittest.TestCase):
+    def test_stl_binary_import_packed(self):
+        header = b"packed" + b"\x00" * 74
+        facet = struct.pack('<12fH', 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0)
+        data = header + struct.pack('<I', 2) + facet * 2
+
+        options = StlLoadOptions()
+        options.packed_storage = True
+        scene = Scene()
+        StlImporter().import_scene(scene, io.BytesIO(data), options)
+
+        mesh = scene.root_node.child_nodes[0].entity
+        self.assertTrue(mesh.packed)
+        self.assertEqual(len(mesh.control_points), 6)
+        self.assertEqual(mesh.polygon_count, 2)
+        self.assertEqual(mesh.control_points[1], Vector4(1, 0, 0, 1))
+
+    def test_obj_import_packed(self):
+        content = "v 0 0 0\nv 1 0 0\nv 1 1 0\nv 0 1 0\nf 1 2 3 4\n"
+        options = ObjLoadOptions()
+        options.packed_storage = True
+        scene = Scene()
+        ObjImporter().import_scene(scene, io.StringIO(content), options)
+
+        mesh = scene.root_node.child_nodes[0].entity
+        self.assertTrue(mesh.packed)
+        self.assertEqual(mesh.polygons[0], [0, 1, 2, 3])
+        self.assertEqual(mesh.control_points[2], Vector4(1, 1, 0, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aspose.threed.entities import (Mesh, PolygonModifier, VertexElementNormal, VertexElementUV,
+                                    MappingMode, ReferenceMode)
+from aspose.threed.utilities import FVector4
+
+
+def _create_shuffled_grid(size, packed=False):
+    mesh = Mesh('grid', packed=packed)
+    for y in range(size):
+        for x in range(size):
+            mesh._extend_control_points([float(x), float(y), 0.0], 3)
+
+    triangles = []
+    for y in range(size - 1):
+        for x in range(size - 1):
+            a = y * size + x
+            triangles.append([a, a + 1, a + size])
+            triangles.append([a + 1, a + size + 1, a + size])
+    random.Random(7).shuffle(triangles)
+    for triangle in triangles:
+        mesh._extend_polygons(triangle, 3)
+    return mesh
+
+
+def _cache_miss_ratio(mesh, cache_size=16):
+    cache = []
+    misses = 0
+    for v in mesh._polygons:
+        if v not in cache:
+            misses += 1
+            cache.append(v)
+            if len(cache) > cache_size:
+                cache.pop(0)
+    return misses / mesh.polygon_count
+
+
+def _corner_keys(mesh):
+    """Polygons as sorted tuples of their control point positions."""
+    return sorted(tuple(sorted((mesh.control_points[i].x, mesh.control_points[i].y) for i in polygon))
+                  for polygon in mesh.polygons)
+
+
+class TestMeshVertexOrder(unittest.TestCase):
+    def test_reorder_improves_cache_locality(self):
+        for packed in (False, True):
+            mesh = _create_shuffled_grid(20, packed)
+            optimized = PolygonModifier.optimize_vertex_order(mesh)
+
+            self.assertEqual(optimized.packed, packed)
+            self.assertEqual(optimized.polygon_count, mesh.polygon_count)
+            self.assertEqual(len(optimized.control_points), len(mesh.control_points))
+            self.assertEqual(_corner_keys(optimized), _corner_keys(mesh))
+            self.assertLess(_cache_miss_ratio(optimized), 0.8)
+            self.assertGreater(_cache_miss_ratio(mesh), 2.0)
+
+    def test_vertices_numbered_in_first_use_order(self):
+        mesh = Mesh('mixed')
+        mesh._extend_control_points([0.0, 0.0, 0.0, 9.0, 9.0, 9.0, 1.0, 0.0, 0.0, 1.0, 1.0, 0.0, 0.0, 1.0, 0.0], 3)
+        mesh._extend_polygons([4, 3, 2, 0, 4, 2, 3], [4, 3])
+        optimized = PolygonModifier.optimize_vertex_order(mesh)
+
+        seen = []
+        for v in optimized._polygons:
+            if v not in seen:
+                seen.append(v)
+        self.assertEqual(seen, [0, 1, 2, 3])
+        self.assertEqual(sorted(optimized._polygon_sizes), [3, 4])
+        self.assertEqual(optimized.control_points[4].x, 9.0)
+
+    def test_vertex_elements_follow_reorder(self):
+        mesh = _create_shuffled_grid(6)
+
+        normals = VertexElementNormal("", MappingMode.CONTROL_POINT, ReferenceMode.DIRECT)
+        normals.set_data([FVector4(p.x, p.y, 1.0, 0.0) for p in mesh.control_points])
+        mesh.add_element(normals)
+
+        uvs = VertexElementUV(None, "", MappingMode.POLYGON_VERTEX, ReferenceMode.INDEX_TO_DIRECT)
+        uvs.set_data([FVector4(float(v), 0.0, 0.0, 0.0) for v in range(len(mesh.control_points))])
+        uvs.set_indices(list(mesh._polygons))
+        mesh.add_element(uvs)
+
+        optimized = PolygonModifier.optimize_vertex_order(mesh)
+        new_normals, new_uvs = optimized._vertex_elements
+        self.assertIsInstance(new_normals, VertexElementNormal)
+        self.assertIsInstance(new_uvs, VertexElementUV)
+
+        points = optimized.control_points
+        for i, point in enumerate(points):
+            self.assertEqual((new_normals._data[i].x, new_normals._data[i].y), (point.x, point.y))
+
+        original_points = mesh.control_points
+        for corner, v in enumerate(optimized._polygons):
+            original = original_points[int(new_uvs._data[new_uvs._indices[corner]].x)]
+            self.assertEqual((original.x, original.y), (points[v].x, points[v].y))
+
+        self.assertEqual(len(mesh._vertex_elements[0]._data), 36)
+        self.assertIsNot(new_normals._data, normals._data)
+
+
+if __name__ == '__main__':
+    unittest.main()
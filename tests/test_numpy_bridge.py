@@ -0,0 +1,102 @@
+import unittest
+import sys
+import os
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aspose.threed.entities import Mesh, VertexElementNormal, VertexElementUV
+from aspose.threed.utilities import Vector4, FVector4
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _create_mesh(packed):
+    mesh = Mesh('mesh', packed=packed)
+    mesh._control_points.append(Vector4(0, 0, 0, 1))
+    mesh._control_points.append(Vector4(1, 0, 0, 1))
+    mesh._control_points.append(Vector4(1, 1, 0, 1))
+    mesh._control_points.append(Vector4(0, 1, 0, 1))
+    mesh.create_polygon(0, 1, 2, 3)
+    mesh.create_polygon(0, 2, 3)
+    return mesh
+
+
+class TestMeshArrayBridge(unittest.TestCase):
+    def test_to_numpy_returns_offsets(self):
+        positions, indices, offsets = _create_mesh(True).to_numpy()
+
+        self.assertEqual(list(indices), [0, 1, 2, 3, 0, 2, 3])
+        self.assertEqual(list(offsets), [0, 4, 7])
+        self.assertEqual(len(positions), 4 if np is not None else 16)
+
+    def test_from_flat_sequences(self):
+        mesh = Mesh.from_numpy(array('d', [0, 0, 0, 1, 0, 0, 0, 1, 0]), [0, 1, 2, 0], None)
+        self.assertEqual(mesh.polygon_count, 1)
+
+        mesh = Mesh.from_numpy([0, 0, 0, 1, 1, 0, 0, 1, 0, 1, 0, 1], [0, 1, 2], [0, 3])
+        self.assertTrue(mesh.packed)
+        self.assertEqual(mesh.polygons[0], [0, 1, 2])
+        self.assertEqual(mesh.control_points[1], Vector4(1, 0, 0, 1))
+
+    def test_vertex_element_set_array_flat(self):
+        element = VertexElementUV()
+        element.set_array([0.5, 0.25, 1.0, 0.0], 2)
+
+        self.assertTrue(element.packed)
+        self.assertEqual(len(element.data), 2)
+        self.assertEqual(element.data[0], FVector4(0.5, 0.25, 0.0, 0.0))
+
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestMeshNumpyBridge(unittest.TestCase):
+    def test_to_numpy_shares_packed_memory(self):
+        mesh = _create_mesh(True)
+        positions, indices, offsets = mesh.to_numpy()
+
+        self.assertEqual(positions.shape, (4, 4))
+        positions[1, 0] = 5.0
+        self.assertEqual(mesh.control_points[1].x, 5.0)
+        self.assertEqual(indices.dtype, np.uint32)
+
+    def test_to_numpy_copies_list_storage(self):
+        mesh = _create_mesh(False)
+        positions, indices, offsets = mesh.to_numpy()
+
+        positions[1, 0] = 5.0
+        self.assertEqual(mesh.control_points[1].x, 1.0)
+        self.assertEqual(offsets.tolist(), [0, 4, 7])
+
+    def test_from_numpy_round_trip(self):
+        source = _create_mesh(True)
+        mesh = Mesh.from_numpy(*source.to_numpy())
+
+        self.assertEqual(mesh.polygons, source.polygons)
+        self.assertEqual(list(mesh.control_points), list(source.control_points))
+
+    def test_from_numpy_xyz_triangles(self):
+        positions = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=np.float32)
+        mesh = Mesh.from_numpy(positions, np.array([0, 1, 2]))
+
+        self.assertEqual(mesh.polygon_count, 1)
+        self.assertEqual(mesh.control_points[2], Vector4(0, 1, 0, 1))
+
+    def test_vertex_element_arrays(self):
+        element = VertexElementNormal()
+        element.set_array(np.array([[0, 0, 1], [0, 1, 0]], dtype=np.float64))
+
+        view = element.as_array()
+        self.assertEqual(view.shape, (2, 4))
+        view[0, 2] = -1.0
+        self.assertEqual(element.data[0].z, -1.0)
+
+        element = VertexElementNormal()
+        element._data.append(FVector4(1.0, 0.0, 0.0, 0.0))
+        self.assertEqual(element.as_array().tolist(), [[1.0, 0.0, 0.0, 0.0]])
+
+
+if __name__ == '__main__':
+    unittest.main()
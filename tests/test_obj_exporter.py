@@ -0,0 +1,100 @@
+import unittest
+import io
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aspose.threed import Scene, Node
+from aspose.threed.entities import Mesh, VertexElementNormal, MappingMode, ReferenceMode
+from aspose.threed.utilities import Vector4, FVector4
+from aspose.threed.formats.obj import ObjExporter, ObjSaveOptions, ObjImporter, ObjLoadOptions
+
+
+def _add_triangle(scene, name, packed=False):
+    mesh = Mesh(name, packed=packed)
+    mesh._control_points.append(Vector4(0.0, 0.0, 0.0, 1.0))
+    mesh._control_points.append(Vector4(1.0, 0.0, 0.0, 1.0))
+    mesh._control_points.append(Vector4(0.0, 1.0, 0.5, 1.0))
+    mesh.create_polygon(0, 1, 2)
+
+    node = Node(name)
+    node.entity = mesh
+    node.parent_node = scene.root_node
+    return mesh
+
+
+class TestObjExporter(unittest.TestCase):
+    def test_save_options_precision(self):
+        options = ObjSaveOptions()
+        self.assertEqual(options.float_precision, 6)
+        options.float_precision = 3
+        self.assertEqual(options.float_precision, 3)
+        with self.assertRaises(ValueError):
+            options.float_precision = -1
+
+    def test_face_indices_are_global(self):
+        scene = Scene()
+        _add_triangle(scene, "first")
+        _add_triangle(scene, "second", packed=True)
+
+        stream = io.StringIO()
+        options = ObjSaveOptions()
+        options.float_precision = 2
+        ObjExporter().export(scene, stream, options)
+
+        content = stream.getvalue()
+        self.assertIn("o first\n", content)
+        self.assertIn("v 0.00 1.00 0.50\n", content)
+        self.assertIn("f 1 2 3\n", content)
+        self.assertIn("f 4 5 6\n", content)
+
+    def test_normals_and_uvs_round_trip(self):
+        obj_content = """v 0 0 0
+v 1 0 0
+v 1 1 0
+v 0 1 0
+vt 0.25 0.5
+vt 0.75 0.5
+vn 0 0 1
+f 1/1/1 2/2/1 3/1/1 4/2/1
+"""
+        scene = Scene()
+        ObjImporter().import_scene(scene, io.StringIO(obj_content), ObjLoadOptions())
+
+        stream = io.BytesIO()
+        exporter = ObjExporter()
+        exporter._CHUNK_SIZE = 8
+        exporter.export(scene, stream, ObjSaveOptions())
+
+        content = stream.getvalue().decode('utf-8')
+        self.assertIn("vt 0.750000 0.500000\n", content)
+        self.assertIn("vn 0.000000 0.000000 1.000000\n", content)
+        self.assertIn("f 1/1/1 2/2/1 3/1/1 4/2/1\n", content)
+
+        reloaded = Scene()
+        ObjImporter().import_scene(reloaded, io.BytesIO(stream.getvalue()), ObjLoadOptions())
+        mesh = reloaded.root_node.child_nodes[0].entity
+        self.assertEqual(mesh.polygons, [[0, 1, 2, 3]])
+        self.assertEqual(len(mesh._vertex_elements), 2)
+
+    def test_control_point_normals(self):
+        scene = Scene()
+        mesh = _add_triangle(scene, "tri")
+        element = VertexElementNormal("", MappingMode.CONTROL_POINT, ReferenceMode.DIRECT)
+        element.set_data([FVector4(0.0, 0.0, 1.0, 0.0)] * 3)
+        mesh.add_element(element)
+
+        stream = io.StringIO()
+        options = ObjSaveOptions()
+        options.flip_coordinate_system = True
+        ObjExporter().export(scene, stream, options)
+
+        content = stream.getvalue()
+        self.assertEqual(content.count("vn 0.000000 1.000000 0.000000\n"), 3)
+        self.assertIn("v 0.000000 0.500000 1.000000\n", content)
+        self.assertIn("f 1//1 2//2 3//3\n", content)
+
+
+if __name__ == '__main__':
+    unittest.main()
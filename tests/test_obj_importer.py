@@ -6,6 +6,8 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from aspose.threed import Scene
+from aspose.threed.entities import VertexElementType, MappingMode, ReferenceMode
+from aspose.threed.utilities import FVector4
 from aspose.threed.formats.obj import ObjLoadOptions, ObjFormat, ObjImporter, ObjExporter, ObjFormatDetector
 
 
@@ -267,6 +269,7 @@ f 1 2 3
         self.assertTrue(options.enable_materials)
         self.assertAlmostEqual(options.scale, 1.0)
         self.assertTrue(options.normalize_normal)
+        self.assertFalse(options.parallel)
         
         options.flip_coordinate_system = True
         options.enable_materials = False
@@ -278,6 +281,133 @@ f 1 2 3
         self.assertAlmostEqual(options.scale, 2.5)
         self.assertFalse(options.normalize_normal)
 
+    def test_binary_stream_across_chunks(self):
+        obj_content = (b"# crlf\r\nv 0 0 0\r\nv 1 0 0\r\nv 1 1 0\r\n  V 0 1 0\r\n"
+                       b"o first\r\nf 1 2 3\r\no second\r\nF -4 -2 -1\r\nf 1/1 2/2 3/3 4/4")
+        scene = Scene()
+        options = ObjLoadOptions()
+
+        importer = ObjImporter()
+        importer._CHUNK_SIZE = 7
+        importer.import_scene(scene, io.BytesIO(obj_content), options)
+
+        first, second = scene.root_node.child_nodes
+        self.assertEqual(first.name, "first")
+        self.assertEqual(first.entity.polygons, [[0, 1, 2]])
+        self.assertEqual(second.name, "second")
+        self.assertEqual(second.entity.polygons, [[0, 1, 2], [0, 3, 1, 2]])
+        self.assertEqual(second.entity.control_points[1].y, 1.0)
+        self.assertEqual(len(second.entity.control_points), 4)
+
+    def test_normal_and_uv_elements(self):
+        obj_content = """v 0 0 0
+v 1 0 0
+v 1 1 0
+v 0 1 0
+vt 0.25 0.5
+vt 0.75 0.5
+vn 0 0 2
+vn 0 1 0
+f 1/1/1 2/2/1 3/1/1
+f 1//2 3 4/-1/2
+"""
+        for packed in (False, True):
+            scene = Scene()
+            options = ObjLoadOptions()
+            options.packed_storage = packed
+            ObjImporter().import_scene(scene, io.StringIO(obj_content), options)
+
+            mesh = scene.root_node.child_nodes[0].entity
+            normals = mesh.get_element(VertexElementType.NORMAL)
+            self.assertEqual(normals.mapping_mode, MappingMode.POLYGON_VERTEX)
+            self.assertEqual(normals.reference_mode, ReferenceMode.INDEX_TO_DIRECT)
+            self.assertEqual(list(normals.indices), [0, 0, 0, 1, 2, 1])
+            self.assertEqual(list(normals.data), [FVector4(0.0, 0.0, 1.0, 0.0), FVector4(0.0, 1.0, 0.0, 0.0), FVector4(0.0, 0.0, 0.0, 0.0)])
+
+            uvs = mesh.get_element(VertexElementType.UV)
+            self.assertEqual(list(uvs.indices), [0, 1, 0, 2, 2, 1])
+            self.assertEqual(len(uvs.data), 3)
+            self.assertEqual(uvs.data[1], FVector4(0.75, 0.5, 0.0, 0.0))
+
+    def test_elements_exported_to_gltf(self):
+        import json
+        from aspose.threed.formats.gltf import GltfExporter, GltfImporter, GltfLoadOptions, GltfSaveOptions
+
+        obj_content = """v 0 0 0
+v 1 0 0
+v 1 1 0
+v 0 1 0
+vt 0.25 0.5
+vt 0.75 0.5
+vn 0 0 1
+vn 0 1 0
+f 1/1/1 2/2/1 3/1/1
+f 1/2/2 3/2/2 4/1/2
+"""
+        scene = Scene()
+        ObjImporter().import_scene(scene, io.StringIO(obj_content), ObjLoadOptions())
+
+        stream = io.BytesIO()
+        options = GltfSaveOptions()
+        options.binary_mode = False
+        GltfExporter().export(scene, stream, options)
+        gltf_data = json.loads(stream.getvalue().decode('utf-8'))
+        attributes = gltf_data['meshes'][0]['primitives'][0]['attributes']
+        counts = [gltf_data['accessors'][index]['count'] for index in attributes.values()]
+        self.assertEqual(counts, [6, 6, 6])
+
+        imported = Scene()
+        GltfImporter().import_scene(imported, io.BytesIO(stream.getvalue()), GltfLoadOptions())
+        mesh = imported.root_node.child_nodes[0].entity
+        self.assertEqual(mesh.polygons, [[0, 1, 2], [3, 4, 5]])
+        normals = mesh.get_element(VertexElementType.NORMAL)
+        self.assertEqual([n.y for n in normals.data], [0.0, 0.0, 0.0, 1.0, 1.0, 1.0])
+        self.assertEqual([uv.x for uv in mesh.get_element(VertexElementType.UV).data], [0.25, 0.75, 0.25, 0.75, 0.75, 0.25])
+
+    def test_parallel_matches_sequential(self):
+        obj_content = b"""v 0 0 0
+v 1 0 0
+vt 0 0
+vn 0 0 1
+g first
+v 1 1 0
+f 1/1/1 2/1/1 3/1/1
+  V 0 1 0
+o second
+vt 1 1
+f -1/-1/1 -2 -3 -4
+g sub
+vn 0 1 0
+f 4//-1 3//-2 2//1
+G other
+f 1 2 3
+"""
+
+        def load(parallel):
+            importer = ObjImporter()
+            importer._CHUNK_SIZE = 16
+            importer._PARALLEL_BLOCK_SIZE = 1
+            options = ObjLoadOptions()
+            options.parallel = parallel
+            scene = Scene()
+            importer.import_scene(scene, io.BytesIO(obj_content), options)
+            return [(node.name, list(node.entity.control_points), node.entity.polygons,
+                     [(list(e.indices), list(e.data)) for e in node.entity._vertex_elements])
+                    for node in scene.root_node.child_nodes]
+
+        sequential = load(False)
+        self.assertEqual([name for name, _, _, _ in sequential], ["first", "second", "second", "second"])
+        self.assertEqual(sequential[1][2], [[0, 1, 2, 3]])
+        self.assertEqual(load(True), sequential)
+
+    def test_no_elements_without_references(self):
+        scene = Scene()
+        ObjImporter().import_scene(scene, io.StringIO("v 0 0 0\nv 1 0 0\nv 0 1 0\nvn 0 0 1\nf 1 2 3\n"), ObjLoadOptions())
+
+        mesh = scene.root_node.child_nodes[0].entity
+        self.assertIsNone(mesh.get_element(VertexElementType.NORMAL))
+        self.assertIsNone(mesh.get_element(VertexElementType.UV))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,130 @@
+import unittest
+import json
+import struct
+import sys
+import os
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from aspose.threed import Scene, Node
+from aspose.threed.entities import Mesh
+from aspose.threed.utilities import Vector4
+from aspose.threed.formats import LoadOptions
+from aspose.threed.formats.stl import StlLoadOptions
+from aspose.threed.formats.gltf import GltfLoadOptions
+
+
+def _binary_stl(count):
+    facet = struct.pack('<12fH', 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 0, 0)
+    return b"mapped".ljust(80, b"\x00") + struct.pack('<I', count) + facet * count
+
+
+def _glb():
+    positions = struct.pack('<9f', 0, 0, 0, 1, 0, 0, 0, 1, 0)
+    document = {
+        "asset": {"version": "2.0"},
+        "scene": 0,
+        "scenes": [{"nodes": [0]}],
+        "nodes": [{"mesh": 0, "name": "tri"}],
+        "meshes": [{"primitives": [{"attributes": {"POSITION": 0}}]}],
+        "buffers": [{"byteLength": len(positions)}],
+        "bufferViews": [{"buffer": 0, "byteOffset": 0, "byteLength": len(positions)}],
+        "accessors": [{"bufferView": 0, "componentType": 5126, "count": 3, "type": "VEC3"}],
+    }
+    json_chunk = json.dumps(document).encode('utf-8')
+    json_chunk += b' ' * (-len(json_chunk) % 4)
+    length = 12 + 8 + len(json_chunk) + 8 + len(positions)
+    return (struct.pack('<4sII', b'glTF', 2, length)
+            + struct.pack('<II', len(json_chunk), 0x4E4F534A) + json_chunk
+            + struct.pack('<II', len(positions), 0x004E4942) + positions)
+
+
+class TestSceneOpenMmap(unittest.TestCase):
+    def setUp(self):
+        self._dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self._dir.cleanup()
+
+    def _write(self, name, data):
+        path = os.path.join(self._dir.name, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_load_options_default(self):
+        options = LoadOptions()
+        self.assertFalse(options.use_mmap)
+        options.use_mmap = True
+        self.assertTrue(options.use_mmap)
+
+    def test_open_binary_stl_mapped(self):
+        path = self._write('mapped.stl', _binary_stl(3))
+        options = StlLoadOptions()
+        options.use_mmap = True
+
+        scene = Scene()
+        scene.open(path, options)
+
+        mesh = scene.root_node.child_nodes[0].entity
+        self.assertEqual(mesh.polygon_count, 3)
+        self.assertEqual(mesh.control_points[1], Vector4(1, 0, 0, 1))
+
+    def test_open_ascii_stl_mapped(self):
+        content = ("solid tri\nfacet normal 0 0 1\nouter loop\nvertex 0 0 0\n"
+                   "vertex 1 0 0\nvertex 0 1 0\nendloop\nendfacet\nendsolid tri\n")
+        path = self._write('ascii.stl', content.encode('utf-8'))
+        options = StlLoadOptions()
+        options.use_mmap = True
+
+        scene = Scene()
+        scene.open(path, options)
+
+        self.assertEqual(scene.root_node.child_nodes[0].entity.polygon_count, 1)
+
+    def test_open_empty_file_mapped(self):
+        path = self._write('empty.stl', b'')
+        options = StlLoadOptions()
+        options.use_mmap = True
+
+        scene = Scene()
+        scene.open(path, options)
+
+        self.assertEqual(len(scene.root_node.child_nodes), 0)
+
+    def test_open_glb_mapped(self):
+        path = self._write('tri.glb', _glb())
+        options = GltfLoadOptions()
+        options.use_mmap = True
+
+        scene = Scene()
+        scene.open(path, options)
+
+        mesh = scene.root_node.child_nodes[0].entity
+        self.assertEqual(mesh.polygon_count, 1)
+        self.assertEqual(mesh.control_points[2], Vector4(0, 1, 0, 1))
+
+    def test_open_3mf_mapped(self):
+        source = Scene()
+        mesh = Mesh("tri")
+        mesh._control_points.append(Vector4(0, 0, 0, 1))
+        mesh._control_points.append(Vector4(1, 0, 0, 1))
+        mesh._control_points.append(Vector4(0, 1, 0, 1))
+        mesh.create_polygon(0, 1, 2)
+        node = Node("tri")
+        node.entity = mesh
+        node.parent_node = source.root_node
+        path = os.path.join(self._dir.name, 'tri.3mf')
+        source.save(path)
+
+        options = LoadOptions()
+        options.use_mmap = True
+        scene = Scene()
+        scene.open(path, options)
+
+        self.assertEqual(scene.root_node.child_nodes[0].entity.polygon_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
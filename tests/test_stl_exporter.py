@@ -1,5 +1,6 @@
 import unittest
 import io
+import struct
 import sys
 import os
 
@@ -202,6 +203,50 @@ class TestStlExporter(unittest.TestCase):
         mesh2 = scene2.root_node.child_nodes[0].entity
         self.assertEqual(mesh2.polygon_count, 1)
 
+    def _create_strip_scene(self, count):
+        scene = Scene()
+        mesh = Mesh("strip", packed=True)
+        for i in range(count + 2):
+            mesh._control_points.append(Vector4(float(i), float(i % 2), 0.0, 1.0))
+        for i in range(count):
+            mesh.create_polygon(i, i + 1, i + 2)
+
+        node = Node("strip_node")
+        node.entity = mesh
+        node.parent_node = scene.root_node
+        return scene
+
+    def test_binary_export_spans_chunks(self):
+        count = 5
+        stream = io.BytesIO()
+        options = StlSaveOptions()
+        options.binary_mode = True
+
+        exporter = StlExporter()
+        exporter._CHUNK_FACETS = 2
+        exporter.export(self._create_strip_scene(count), stream, options)
+
+        data = stream.getvalue()
+        self.assertEqual(len(data), 84 + count * 50)
+        self.assertEqual(struct.unpack_from('<I', data, 80)[0], count)
+        facet = struct.unpack_from('<12f', data, 84 + 4 * 50)
+        self.assertEqual(facet[3:], (4.0, 0.0, 0.0, 5.0, 1.0, 0.0, 6.0, 0.0, 0.0))
+
+    def test_ascii_export_to_binary_stream(self):
+        count = 5
+        stream = io.BytesIO()
+        options = StlSaveOptions()
+        options.binary_mode = False
+
+        exporter = StlExporter()
+        exporter._CHUNK_FACETS = 2
+        exporter.export(self._create_strip_scene(count), stream, options)
+
+        content = stream.getvalue().decode('utf-8')
+        self.assertTrue(content.startswith("solid exported\n"))
+        self.assertTrue(content.endswith("endsolid exported"))
+        self.assertEqual(content.count("endfacet"), count)
+
 
 if __name__ == '__main__':
     unittest.main()
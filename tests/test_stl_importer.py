@@ -154,6 +154,169 @@ endsolid Test
         self.assertAlmostEqual(first_point.y, 2.0)
         self.assertAlmostEqual(first_point.z, 2.0)
 
+    def _binary_stl(self, facets):
+        import struct
+        
+        data = b"Binary" + b"\x00" * 74 + struct.pack('<I', len(facets))
+        for values in facets:
+            data += struct.pack('<12fH', *values, 0)
+        return data
+
+    def test_binary_flip_scale_and_normals(self):
+        content = self._binary_stl([
+            (0.0, 1.0, 0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0, 8.0, 9.0),
+            (0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0),
+        ])
+        
+        scene = Scene()
+        options = StlLoadOptions()
+        options.flip_coordinate_system = True
+        options.scale = 2.0
+        options.import_normals = True
+        
+        StlImporter().import_scene(scene, io.BytesIO(content), options)
+        
+        mesh = scene.root_node.child_nodes[0].entity
+        self.assertEqual(len(mesh.control_points), 6)
+        point = mesh.control_points[1]
+        self.assertAlmostEqual(point.x, 8.0)
+        self.assertAlmostEqual(point.y, 12.0)
+        self.assertAlmostEqual(point.z, 10.0)
+        
+        from aspose.threed.entities import VertexElementNormal, MappingMode
+        normals = [e for e in mesh.vertex_elements if isinstance(e, VertexElementNormal)]
+        self.assertEqual(len(normals), 1)
+        self.assertIs(normals[0].mapping_mode, MappingMode.POLYGON)
+        self.assertEqual(len(normals[0].data), 2)
+        self.assertAlmostEqual(normals[0].data[0].z, 1.0)
+        self.assertAlmostEqual(normals[0].data[1].y, 1.0)
+
+    def test_binary_decoders_agree(self):
+        content = self._binary_stl([
+            (0.0, 0.0, 1.0, 0.5, 1.5, 2.5, 3.5, 4.5, 5.5, 6.5, 7.5, 8.5),
+            (1.0, 0.0, 0.0, -1.0, -2.0, -3.0, 0.0, 0.0, 0.0, 1.0, 1.0, 1.0),
+        ])
+        options = StlLoadOptions()
+        options.flip_coordinate_system = True
+        options.scale = 3.0
+        
+        importer = StlImporter()
+        facets = memoryview(content)[84:]
+        positions, normals = importer._decode_facets(facets, 2, options)
+        self.assertEqual(list(positions[:3]), [1.5, 7.5, 4.5])
+        self.assertEqual(list(normals[:3]), [0.0, 1.0, 0.0])
+        
+        try:
+            import numpy as np
+        except ImportError:
+            return
+        np_positions, np_normals = importer._decode_facets_numpy(np, facets, 2, options)
+        self.assertEqual(list(np_positions), list(positions))
+        self.assertEqual(list(np_normals), list(normals))
+
+    def test_binary_truncated_facet_count(self):
+        content = self._binary_stl([(0.0,) * 12])
+        content = content[:80] + (5).to_bytes(4, 'little') + content[84:]
+        
+        scene = Scene()
+        StlImporter().import_scene(scene, io.BytesIO(content), StlLoadOptions())
+        
+        mesh = scene.root_node.child_nodes[0].entity
+        self.assertEqual(mesh.polygon_count, 1)
+
+    def test_weld_vertices(self):
+        stl_content = """solid Quad
+  facet normal 0.0 0.0 1.0
+    outer loop
+      vertex 0.0 0.0 0.0
+      vertex 1.0 0.0 0.0
+      vertex 1.0 1.0 0.0
+    endloop
+  endfacet
+  facet normal 0.0 0.0 1.0
+    outer loop
+      vertex 0.0 0.0 0.0000000001
+      vertex 1.0 1.0 0.0
+      vertex 0.0 1.0 0.0
+    endloop
+  endfacet
+endsolid Quad
+"""
+        scene = Scene()
+        options = StlLoadOptions()
+        options.weld_vertices = True
+        
+        StlImporter().import_scene(scene, io.StringIO(stl_content), options)
+        
+        mesh = scene.root_node.child_nodes[0].entity
+        self.assertEqual(len(mesh.control_points), 4)
+        self.assertEqual(mesh.polygons, [[0, 1, 2], [0, 2, 3]])
+
+    def test_normals_exported_to_gltf(self):
+        import json
+        from aspose.threed.formats.gltf import GltfExporter, GltfSaveOptions
+
+        content = self._binary_stl([
+            (0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 0.0),
+            (1.0, 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 1.0, 0.0, 1.0, 1.0, 1.0),
+        ])
+        scene = Scene()
+        options = StlLoadOptions()
+        options.import_normals = True
+        options.weld_vertices = True
+        StlImporter().import_scene(scene, io.BytesIO(content), options)
+        self.assertEqual(len(scene.root_node.child_nodes[0].entity.control_points), 4)
+
+        stream = io.BytesIO()
+        save_options = GltfSaveOptions()
+        save_options.binary_mode = False
+        GltfExporter().export(scene, stream, save_options)
+        gltf_data = json.loads(stream.getvalue().decode('utf-8'))
+        attributes = gltf_data['meshes'][0]['primitives'][0]['attributes']
+        self.assertEqual(gltf_data['accessors'][attributes['POSITION']]['count'], 6)
+        self.assertEqual(gltf_data['accessors'][attributes['NORMAL']]['count'], 6)
+
+    def test_weld_vertices_exact(self):
+        from array import array
+        
+        positions = array('d', [0, 0, 0, 1, 0, 0, 0, 0, 1e-9, 1, 0, 0])
+        importer = StlImporter()
+        
+        welded, indices = importer._weld_vertices(positions, 0.0)
+        self.assertEqual(list(indices), [0, 1, 2, 1])
+        self.assertEqual(len(welded), 9)
+        
+        welded, indices = importer._weld_vertices(positions, 1e-6)
+        self.assertEqual(list(indices), [0, 1, 0, 1])
+        self.assertEqual(list(welded), [0, 0, 0, 1, 0, 0])
+
+    def test_weld_implementations_agree(self):
+        from array import array
+        
+        tolerance = 1e-5
+        # Coordinates half a step apart, where rounding x * (1 / tolerance) and
+        # x / tolerance can disagree
+        values = [(k + 0.5) * tolerance for k in range(-200, 200)]
+        positions = array('d', [c for v in values for c in (v, 0.0, 0.0)])
+        positions.extend([float('nan'), 0.0, 0.0, float('inf'), 0.0, 0.0, float('nan'), 0.0, 0.0, 0.0, 0.0, 0.0])
+        importer = StlImporter()
+        
+        welded, indices = importer._weld_vertices_python(positions, tolerance)
+        count = len(welded) // 3
+        self.assertEqual(list(indices[-4:-1]), [count - 3, count - 2, count - 1])
+        self.assertLess(indices[-1], count - 3)
+        self.assertEqual(list(importer._weld_vertices_python(positions, 0.0)[1][-4:]), [400, 401, 402, 403])
+        
+        try:
+            import numpy as np
+        except ImportError:
+            return
+        for t in (tolerance, 0.0):
+            expected = importer._weld_vertices_python(positions, t)
+            actual = importer._weld_vertices_numpy(np, positions, t)
+            self.assertEqual(list(actual[1]), list(expected[1]))
+            self.assertEqual(array('d', actual[0]).tobytes(), expected[0].tobytes())
+
 
 if __name__ == '__main__':
     unittest.main()